@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pure ASGI TraceIDMiddleware against a BaseHTTPMiddleware version.
+
+The BaseHTTPMiddleware variant reproduces the previous ``dispatch``-based
+implementation on top of the same helper methods, so the numbers isolate the
+cost of the middleware plumbing (extra tasks and memory streams) rather than
+the trace/context work both versions share. Requests are driven directly
+through the ASGI interface, without a server or network stack, and the access
+log call is stubbed out in both variants.
+
+Usage:
+    python scripts/benchmark_trace_middleware.py [OPTIONS]
+
+Examples:
+    # Default run
+    python scripts/benchmark_trace_middleware.py
+
+    # More requests and a longer streaming body
+    python scripts/benchmark_trace_middleware.py --requests 20000 --chunks 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from fapilog._internal.context import bind_context, clear_context
+from fapilog.middleware import TraceIDMiddleware
+
+
+class QuietTraceIDMiddleware(TraceIDMiddleware):
+    """Pure ASGI middleware with the access log stubbed out."""
+
+    def _log_request_success(self, *args: Any) -> None:
+        pass
+
+    def _log_request_error(self, *args: Any) -> None:
+        pass
+
+
+class BaseHTTPTraceIDMiddleware(BaseHTTPMiddleware):
+    """Previous BaseHTTPMiddleware-based implementation, for comparison."""
+
+    def __init__(self, app: Any, trace_id_header: str = "X-Request-ID") -> None:
+        super().__init__(app)
+        self._helpers = QuietTraceIDMiddleware(app, trace_id_header)
+
+    async def dispatch(self, request: Any, call_next: Any) -> Any:
+        helpers = self._helpers
+        metadata = helpers._extract_request_metadata(request)
+        trace_id, span_id = helpers._generate_trace_ids(request)
+        helpers._set_request_context(request, trace_id, span_id, metadata)
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+            duration = round((time.perf_counter() - start_time) * 1000, 2)
+            # The old implementation could only see pre-rendered bodies
+            res_size = len(getattr(response, "body", b"") or b"")
+            bind_context(
+                res_bytes=res_size,
+                status_code=response.status_code,
+                latency_ms=duration,
+            )
+            request.state.latency_ms = duration
+            helpers._add_correlation_headers(
+                response.headers, trace_id, span_id, duration
+            )
+            return response
+        finally:
+            clear_context()
+
+
+def build_app(chunks: int) -> Starlette:
+    """Build a minimal app with a JSON and a streaming endpoint."""
+
+    async def json_endpoint(request: Any) -> JSONResponse:
+        return JSONResponse({"message": "ok", "items": list(range(10))})
+
+    async def stream_endpoint(request: Any) -> StreamingResponse:
+        async def generate():
+            for _ in range(chunks):
+                yield b"x" * 256
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    return Starlette(
+        routes=[
+            Route("/json", json_endpoint),
+            Route("/stream", stream_endpoint),
+        ]
+    )
+
+
+def make_scope(path: str) -> Dict[str, Any]:
+    """Build an HTTP scope for a GET request."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench/1.0")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+
+
+async def run_requests(app: Callable, path: str, count: int) -> List[float]:
+    """Drive ``count`` sequential requests and return latencies in µs."""
+    latencies = []
+
+    def make_receive() -> Callable:
+        delivered = False
+        disconnected = asyncio.Event()
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal delivered
+            if not delivered:
+                delivered = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Block like a live connection until the listener is cancelled
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        return receive
+
+    async def send(message: Dict[str, Any]) -> None:
+        pass
+
+    for _ in range(count):
+        start = time.perf_counter()
+        await app(make_scope(path), make_receive(), send)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    return latencies
+
+
+def summarize(name: str, latencies: List[float]) -> str:
+    """Format mean and percentile latencies for one variant."""
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    return (
+        f"  {name:<22} mean {statistics.mean(ordered):8.1f} µs   "
+        f"p50 {statistics.median(ordered):8.1f} µs   p99 {p99:8.1f} µs"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--chunks", type=int, default=20)
+    args = parser.parse_args()
+
+    variants = {
+        "no middleware": build_app(args.chunks),
+        "BaseHTTPMiddleware": BaseHTTPTraceIDMiddleware(build_app(args.chunks)),
+        "pure ASGI": QuietTraceIDMiddleware(build_app(args.chunks)),
+    }
+
+    for path in ("/json", "/stream"):
+        print(f"{path} ({args.requests} requests)")
+        for name, app in variants.items():
+            # Warm up
+            await run_requests(app, path, min(200, args.requests))
+            print(summarize(name, await run_requests(app, path, args.requests)))
+        print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
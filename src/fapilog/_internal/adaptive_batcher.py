@@ -0,0 +1,101 @@
+"""Adaptive batch size and flush timeout for the queue worker.
+
+A fixed ``batch_size`` is a compromise: bursts are written in many small
+batches, each paying the sinks' per-write overhead, while a large fixed
+size buys nothing when traffic is light. ``AdaptiveBatcher`` is fed the
+outcome of every batch. While the queue stays deep and the sinks' time per
+event keeps falling as batches grow, it doubles the batch size and lengthens
+the flush timeout, the time a partial batch may wait for more events.
+Whenever a batch finds the queue drained, it halves both again, so light
+traffic is written without delay. Both values stay within their bounds.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+# Weight of the newest batch in the smoothed time per event
+_SMOOTHING = 0.2
+
+
+class AdaptiveBatcher:
+    """Batch size and flush timeout tuned from queue depth and sink latency."""
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 1000,
+        min_flush_timeout: float = 0.0,
+        max_flush_timeout: float = 0.05,
+        initial_size: Optional[int] = None,
+        container: Optional["LoggingContainer"] = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            min_size: Smallest batch size
+            max_size: Largest batch size
+            min_flush_timeout: Shortest flush timeout in seconds
+            max_flush_timeout: Longest flush timeout in seconds
+            initial_size: Starting batch size (defaults to ``min_size``)
+            container: Optional LoggingContainer for the batch gauges
+        """
+        self.min_size = max(min_size, 1)
+        self.max_size = max(max_size, self.min_size)
+        self.min_flush_timeout = max(min_flush_timeout, 0.0)
+        self.max_flush_timeout = max(max_flush_timeout, self.min_flush_timeout)
+        self._container = container
+        start = self.min_size if initial_size is None else initial_size
+        self.size = min(max(start, self.min_size), self.max_size)
+        self.flush_timeout = self.min_flush_timeout
+        # Flush timeouts are raised in eighths of their range
+        self._timeout_step = (self.max_flush_timeout - self.min_flush_timeout) / 8
+        # Smoothed sink seconds per event
+        self._per_event: Optional[float] = None
+        self._record_metrics()
+
+    def observe(self, count: int, backlog: int, elapsed: float) -> None:
+        """Adjust the batch size and flush timeout after a batch.
+
+        Args:
+            count: Number of events in the batch
+            backlog: Events left in the queue after the batch was written
+            elapsed: Seconds spent writing the batch to the sinks
+        """
+        if count <= 0:
+            return
+        per_event = elapsed / count
+        previous = self._per_event
+        self._per_event = (
+            per_event
+            if previous is None
+            else previous + _SMOOTHING * (per_event - previous)
+        )
+        size, flush_timeout = self.size, self.flush_timeout
+
+        if backlog >= size and count >= size:
+            # Deep queue: grow while bigger batches are cheaper per event
+            if previous is None or per_event <= previous:
+                size = min(size * 2, self.max_size)
+                flush_timeout = min(
+                    flush_timeout + self._timeout_step, self.max_flush_timeout
+                )
+        elif backlog == 0 and count < size:
+            # Light traffic: smaller batches, flushed sooner
+            size = max(size // 2, self.min_size)
+            flush_timeout = self.min_flush_timeout + (
+                (flush_timeout - self.min_flush_timeout) / 2
+            )
+            if flush_timeout - self.min_flush_timeout < self._timeout_step / 2:
+                flush_timeout = self.min_flush_timeout
+
+        if (size, flush_timeout) != (self.size, self.flush_timeout):
+            self.size, self.flush_timeout = size, flush_timeout
+            self._record_metrics()
+
+    def _record_metrics(self) -> None:
+        """Publish the current batch size and flush timeout as gauges."""
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_batch_tuning(self.size, self.flush_timeout)
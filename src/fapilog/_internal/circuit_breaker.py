@@ -0,0 +1,116 @@
+"""Per-sink circuit breaker used by the queue worker.
+
+When a sink's backend is down, every write otherwise goes through the full
+retry schedule, and the worker spends its time sleeping while the queue
+overflows. A breaker opens after ``failure_threshold`` consecutive
+failures; while open, writes to the sink fail fast without being attempted.
+After ``reset_timeout`` seconds it lets a single probe write through
+(half-open) and closes again if the probe succeeds.
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Breaker states, in the order of their Prometheus gauge values
+CIRCUIT_STATES: Tuple[str, ...] = (CLOSED, OPEN, HALF_OPEN)
+
+
+class CircuitBreaker:
+    """Track consecutive failures of one sink and gate its writes.
+
+    Not thread-safe; a breaker is used only from the worker's event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        container: Optional["LoggingContainer"] = None,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Sink name used in logs and metrics
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before probing
+            container: Optional LoggingContainer for transition metrics
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._container = container
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        # Start time of the half-open probe in flight, if any
+        self._probe_started: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Check whether a write may be attempted now.
+
+        In the half-open state only one probe is allowed at a time; a probe
+        that never reports back is replaced after ``reset_timeout``.
+        """
+        if self.state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            self._transition(HALF_OPEN)
+        elif (
+            self._probe_started is not None
+            and now - self._probe_started < self.reset_timeout
+        ):
+            return False
+
+        self._probe_started = now
+        return True
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 otherwise)."""
+        if self.state != OPEN:
+            return 0.0
+        return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self) -> None:
+        """Record a successful write, closing the breaker."""
+        self.failures = 0
+        self._probe_started = None
+        if self.state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed write, opening the breaker when the limit is hit."""
+        self.failures += 1
+        self._probe_started = None
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        if state == OPEN:
+            logger.warning(
+                f"Circuit for sink {self.name} opened after {self.failures} "
+                f"consecutive failures; retrying in {self.reset_timeout}s"
+            )
+        else:
+            logger.info(f"Circuit for sink {self.name} is now {state}")
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_circuit_transition(self.name, state)
@@ -8,6 +8,7 @@ dependencies.
 from typing import TYPE_CHECKING, Optional
 
 from fapilog._internal.async_lock_manager import ProcessorLockManager
+from fapilog._internal.drop_ledger import DropLedger
 from fapilog._internal.metrics import MetricsCollector
 from fapilog._internal.processor_metrics import ProcessorMetrics
 from fapilog.enrichers import (
@@ -82,14 +83,31 @@ class ComponentFactory:
                 "my_processor", latency_ms=10.5, success=True
             )
         """
-        return ProcessorMetrics()
+        return ProcessorMetrics(
+            sample_every=self._settings.processor_metrics_sample_every
+        )
+
+    def create_drop_ledger(self) -> DropLedger:
+        """Create DropLedger for container.
+
+        Creates a new DropLedger instance that counts events discarded by
+        this container's pipeline, by reason.
+
+        Returns:
+            DropLedger: New drop ledger instance
+
+        Example:
+            ledger = factory.create_drop_ledger()
+            ledger.record("overflow")
+        """
+        return DropLedger()
 
     def create_metrics_collector(self) -> Optional[MetricsCollector]:
         """Create MetricsCollector if enabled in settings.
 
         Creates a MetricsCollector instance if metrics collection is enabled
         in the container's LoggingSettings. Uses settings for configuration
-        of sample window size.
+        of sample window size and histogram buckets.
 
         Returns:
             Optional[MetricsCollector]: MetricsCollector if enabled, None otherwise
@@ -103,7 +121,10 @@ class ComponentFactory:
             return None
 
         return MetricsCollector(
-            enabled=True, sample_window=self._settings.metrics_sample_window
+            enabled=True,
+            sample_window=self._settings.metrics_sample_window,
+            histogram_buckets=self._settings.metrics_histogram_buckets,
+            top_k=self._settings.metrics_top_k,
         )
 
     def create_prometheus_exporter(self) -> Optional[PrometheusExporter]:
@@ -111,7 +132,7 @@ class ComponentFactory:
 
         Creates a PrometheusExporter instance if Prometheus metrics export
         is enabled in the container's LoggingSettings. Uses settings for
-        host and port configuration.
+        host, port, serving mode and cache TTL configuration.
 
         Returns:
             Optional[PrometheusExporter]: PrometheusExporter if enabled, None otherwise
@@ -129,6 +150,8 @@ class ComponentFactory:
             host=self._settings.metrics_prometheus_host,
             port=self._settings.metrics_prometheus_port,
             enabled=True,
+            mode=self._settings.metrics_prometheus_mode,
+            cache_ttl=self._settings.metrics_prometheus_cache_ttl,
         )
 
     def create_async_smart_cache(self) -> AsyncSmartCache:
@@ -1,10 +1,13 @@
 """Context variables for request correlation and tracing."""
 
 import contextvars
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from .error_handling import handle_context_error
 
+if TYPE_CHECKING:
+    from .request_buffer import RequestLogBuffer
+
 # Context variables for request correlation
 trace_ctx: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "trace_id", default=None
@@ -52,6 +55,11 @@ auth_scheme_ctx: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "auth_scheme", default=None
 )
 
+# Context variable for tail-based per-request log buffering
+request_buffer_ctx: contextvars.ContextVar[Optional["RequestLogBuffer"]] = (
+    contextvars.ContextVar("request_buffer", default=None)
+)
+
 
 def get_context() -> Dict[str, Any]:
     """Get the current context as a dictionary.
@@ -152,6 +160,7 @@ def clear_context() -> None:
     user_id_ctx.set(None)
     user_roles_ctx.set(None)
     auth_scheme_ctx.set(None)
+    request_buffer_ctx.set(None)
 
 
 def context_copy() -> contextvars.Context:
@@ -164,6 +173,20 @@ def context_copy() -> contextvars.Context:
     return contextvars.copy_context()
 
 
+def bind_request_buffer(buffer: Optional["RequestLogBuffer"]) -> None:
+    """Bind (or with None, unbind) the log buffer for the current request.
+
+    Args:
+        buffer: The request log buffer, or None to stop buffering
+    """
+    request_buffer_ctx.set(buffer)
+
+
+def get_request_buffer() -> Optional["RequestLogBuffer"]:
+    """Get the log buffer bound to the current request, if any."""
+    return request_buffer_ctx.get()
+
+
 def get_trace_id() -> Optional[str]:
     """Get the current trace ID from context."""
     return trace_ctx.get()
@@ -0,0 +1,103 @@
+"""Unified accounting of log events discarded by the pipeline.
+
+Every place that drops an event records it here under a reason, so data
+loss is visible in metrics and, through the queue worker's periodic summary
+event, in the log stream itself. Like ``MetricsCollector``, recording writes
+to a per-thread counter without taking a lock; counters are merged on read,
+and the counters of exited threads are folded into a retired total.
+"""
+
+import threading
+import weakref
+from typing import Dict, List, Tuple
+
+# Known drop reasons, in reporting order
+DROP_REASONS: Tuple[str, ...] = (
+    "overflow",
+    "sampled",
+    "throttled",
+    "deduped",
+    "shutdown",
+    "no_loop",
+    "sink_overflow",
+    "sink_failed",
+    "circuit_open",
+    "evicted",
+    "shed",
+)
+
+
+class DropLedger:
+    """Count dropped events by reason."""
+
+    def __init__(self) -> None:
+        # Guards counter registration, merging and summaries, never recording
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Recording thread and its counts, per registered thread
+        self._counters: List[Tuple[weakref.ref[threading.Thread], Dict[str, int]]] = []
+        # Counts of threads that have exited
+        self._retired: Dict[str, int] = {}
+        # Totals already included in a summary
+        self._reported: Dict[str, int] = {}
+
+    def record(self, reason: str, count: int = 1) -> None:
+        """Record ``count`` events dropped for ``reason``."""
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = {}
+            owner = weakref.ref(threading.current_thread())
+            with self._lock:
+                self._retire_counters()
+                self._counters.append((owner, counts))
+        counts[reason] = counts.get(reason, 0) + count
+
+    def _retire_counters(self) -> None:
+        """Fold the counters of exited threads into the retired counts."""
+        live = []
+        for owner, counts in self._counters:
+            thread = owner()
+            if thread is not None and thread.is_alive():
+                live.append((owner, counts))
+                continue
+            for reason, count in counts.items():
+                self._retired[reason] = self._retired.get(reason, 0) + count
+        self._counters = live
+
+    def _merge(self) -> Dict[str, int]:
+        totals = dict.fromkeys(DROP_REASONS, 0)
+        totals.update(self._retired)
+        for _, counts in self._counters:
+            for reason, count in list(counts.items()):
+                totals[reason] = totals.get(reason, 0) + count
+        return totals
+
+    def totals(self) -> Dict[str, int]:
+        """Total dropped events per reason since creation or reset."""
+        with self._lock:
+            return self._merge()
+
+    def take_summary(self) -> Dict[str, int]:
+        """Events dropped per reason since the previous summary.
+
+        Only reasons with new drops are included; an empty dict means
+        nothing was dropped.
+        """
+        with self._lock:
+            totals = self._merge()
+            summary = {
+                reason: count - self._reported.get(reason, 0)
+                for reason, count in totals.items()
+                if count > self._reported.get(reason, 0)
+            }
+            self._reported = totals
+        return summary
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            # Threads pick up fresh counters through the new thread-local
+            self._local = threading.local()
+            self._counters = []
+            self._retired = {}
+            self._reported = {}
@@ -0,0 +1,140 @@
+"""Fixed-bucket histograms for in-process latency aggregation."""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Log-spaced latency buckets in milliseconds (upper bounds, inclusive)
+DEFAULT_LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+
+class Histogram:
+    """Histogram with fixed, sorted bucket upper bounds.
+
+    Observations cost one binary search and two additions; memory is constant
+    per histogram regardless of traffic. Buckets follow Prometheus ``le``
+    semantics, with an implicit ``+Inf`` bucket, so snapshots can be exported
+    directly as ``_bucket``/``_sum``/``_count`` series. Not thread-safe on its
+    own; callers keep one histogram per recording thread.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count", "max")
+
+    def __init__(self, bounds: Optional[Sequence[float]] = None) -> None:
+        """Initialize the histogram.
+
+        Args:
+            bounds: Bucket upper bounds; defaults to DEFAULT_LATENCY_BUCKETS_MS
+        """
+        self.bounds: Tuple[float, ...] = tuple(
+            sorted(bounds if bounds is not None else DEFAULT_LATENCY_BUCKETS_MS)
+        )
+        # One extra slot for the +Inf bucket
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram with the same bounds into this one."""
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.sum += other.sum
+        self.count += other.count
+        if other.max > self.max:
+            self.max = other.max
+
+    def cumulative_counts(self) -> List[int]:
+        """Return cumulative counts per bucket, ending with the +Inf bucket."""
+        total = 0
+        result = []
+        for bucket_count in self.counts:
+            total += bucket_count
+            result.append(total)
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, average, p50/p90/p99 and max for reporting."""
+        return {
+            "count": self.count,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile by interpolating within its bucket.
+
+        Estimates never exceed the largest observed value, which is also what
+        observations in the +Inf bucket are reported as.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if index == len(self.bounds):
+                    return self.max
+                upper = self.bounds[index]
+                estimate = lower + (upper - lower) * ((rank - seen) / bucket_count)
+                return min(estimate, self.max)
+            seen += bucket_count
+            if index < len(self.bounds):
+                lower = self.bounds[index]
+        return self.max
+
+
+def format_prometheus_histogram(
+    name: str,
+    help_text: str,
+    series: Sequence[Tuple[str, Histogram]],
+) -> List[str]:
+    """Render histograms as Prometheus ``_bucket``/``_sum``/``_count`` lines.
+
+    Args:
+        name: Metric base name
+        help_text: HELP text for the metric
+        series: ``(labels, histogram)`` pairs, where labels is the rendered
+            label list without braces (e.g. ``'sink="stdout"'``) or ""
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        prefix = f"{labels}," if labels else ""
+        cumulative = histogram.cumulative_counts()
+        for bound, bucket_total in zip(histogram.bounds, cumulative):
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {bucket_total}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {cumulative[-1]}')
+        label_block = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{label_block} {histogram.sum}")
+        lines.append(f"{name}_count{label_block} {histogram.count}")
+    lines.append("")
+    return lines
@@ -0,0 +1,280 @@
+"""Two-lane event queue that gives ERROR and CRITICAL events precedence.
+
+A single ring buffer drops whatever arrives once it is full, so during an
+incident the errors that explain it are as likely to be lost as the debug
+noise around them. ``LaneQueue`` keeps high-priority events in their own
+ring buffer: they are drained first, and when their lane is full they
+evict the oldest low-priority event instead of being rejected. A
+starvation guard hands the low lane the next batch after it has been
+passed over ``starvation_limit`` times in a row.
+
+``LaneQueue`` offers the ``RingBuffer`` interface used by the queue worker
+and the pipeline, so it can stand in for the worker's queue. A byte budget
+covers both lanes; a high-priority event over budget evicts low-priority
+events until it fits.
+"""
+
+import asyncio
+from typing import Any, Callable, FrozenSet, List, Optional
+
+from .ring_buffer import RingBuffer, _resolve
+
+# Levels (as set by structlog's add_log_level) that use the high lane
+HIGH_PRIORITY_LEVELS: FrozenSet[str] = frozenset(
+    {"error", "exception", "critical", "fatal"}
+)
+
+
+def is_high_priority(event: Any) -> bool:
+    """Check whether an event belongs in the high-priority lane."""
+    level = event.get("level") if isinstance(event, dict) else None
+    return isinstance(level, str) and level.lower() in HIGH_PRIORITY_LEVELS
+
+
+class LaneQueue:
+    """Bounded queue with a high-priority lane for ERROR/CRITICAL events.
+
+    The low lane holds up to ``maxsize`` events and the high lane up to
+    ``priority_size``. A high-priority event arriving while its lane is full
+    takes the slot of the oldest low-priority event, which is passed to
+    ``on_evict``; it is rejected only when the low lane is empty. Events
+    logged from other threads cannot evict and are refused when their lane
+    is full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        priority_size: int,
+        starvation_limit: int = 4,
+        on_evict: Optional[Callable[[Any], None]] = None,
+        max_bytes: int = 0,
+        sizer: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            maxsize: Capacity of the low-priority lane
+            priority_size: Capacity of the high-priority lane
+            starvation_limit: Consecutive drains that may pass over a
+                non-empty low lane before it is drained first
+            on_evict: Optional callback receiving each evicted event
+            max_bytes: Budget of estimated bytes across both lanes (0 for
+                no limit); requires ``sizer``
+            sizer: Optional function estimating an event's size in bytes
+        """
+        if max_bytes and sizer is None:
+            raise ValueError("LaneQueue max_bytes requires a sizer")
+        self.maxsize = maxsize + priority_size
+        self.priority_size = priority_size
+        self.starvation_limit = starvation_limit
+        self.on_evict = on_evict
+        self.max_bytes = max_bytes
+        # Both lanes check the shared budget, so threads blocked in
+        # put_threadsafe also wait for bytes to be freed
+        budget = self._over_budget if max_bytes else None
+        self.low = RingBuffer(maxsize, sizer=sizer, over_budget=budget)
+        # Sized for the whole queue: evictions let it borrow low slots
+        self.high = RingBuffer(maxsize + priority_size, sizer=sizer, over_budget=budget)
+        self._starved = 0
+
+    def qsize(self) -> int:
+        """Number of events in both lanes."""
+        return self.high.qsize() + self.low.qsize()
+
+    def empty(self) -> bool:
+        """Return True if both lanes are empty."""
+        return self.high.empty() and self.low.empty()
+
+    def full(self) -> bool:
+        """Return True if every slot of the queue is in use."""
+        return self.qsize() >= self.maxsize
+
+    @property
+    def bytes(self) -> int:
+        """Estimated bytes of the events in both lanes."""
+        return self.high.bytes + self.low.bytes
+
+    def _over_budget(self, size: int) -> bool:
+        """Check whether ``size`` more bytes would exceed the byte budget."""
+        return (
+            self.max_bytes > 0
+            and not self.empty()
+            and self.bytes + size > self.max_bytes
+        )
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Set the event loop that owns both lanes."""
+        self.high.bind(loop)
+        self.low.bind(loop)
+
+    def put_threadsafe(self, item: Any, timeout: float = 0.0) -> bool:
+        """Append an event from any thread.
+
+        Args:
+            item: The event to append
+            timeout: Maximum seconds to block waiting for room in the
+                event's lane and in the byte budget (0 never blocks)
+
+        Returns:
+            True if the event was accepted, False if its lane stayed full,
+            the byte budget stayed spent or there is no running owner loop
+        """
+        # The budget covers both lanes but each lane checks it under its own
+        # lock, so racing threads can overshoot the budget by an event each.
+        # Bytes freed by the other lane are noticed on the lane's periodic
+        # recheck rather than by notification.
+        size = self.low.size_of(item)
+        if is_high_priority(item):
+            return self.high.put_threadsafe(
+                item, limit=self.priority_size, timeout=timeout, size=size
+            )
+        return self.low.put_threadsafe(item, timeout=timeout, size=size)
+
+    def put_nowait(self, item: Any) -> None:
+        """Append an event to its lane without blocking.
+
+        Raises:
+            asyncio.QueueFull: If the event's lane is full or the byte budget
+                is spent and, for a high-priority event, evicting
+                low-priority events cannot make room
+        """
+        high = self.high
+        low = self.low
+        size = low.size_of(item)
+        if is_high_priority(item):
+            need_slot = high.qsize() >= self.priority_size
+            over_budget = self._over_budget(size)
+            if (need_slot or over_budget) and low.empty():
+                raise asyncio.QueueFull
+            # Evicting every low-priority event cannot bring it under budget
+            if over_budget and high.bytes and high.bytes + size > self.max_bytes:
+                raise asyncio.QueueFull
+            while need_slot or self._over_budget(size):
+                need_slot = False
+                evicted = low.drain(1)
+                if not evicted:
+                    raise asyncio.QueueFull
+                if self.on_evict is not None:
+                    self.on_evict(evicted[0])
+            high.put_nowait(item, size)
+            return
+
+        # High-priority events holding evicted slots still count against
+        # the low lane's capacity
+        borrowed = high.qsize() - self.priority_size
+        if borrowed > 0 and low.qsize() + borrowed >= low.maxsize:
+            raise asyncio.QueueFull
+        if self._over_budget(size):
+            raise asyncio.QueueFull
+        low.put_nowait(item, size)
+
+    async def put(self, item: Any) -> None:
+        """Append an event, waiting for room in its lane if needed."""
+        while True:
+            try:
+                self.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                pass
+            # Either lane draining can make room (see borrowed slots)
+            putter = asyncio.get_running_loop().create_future()
+            self.high._putters.append(putter)
+            self.low._putters.append(putter)
+            try:
+                await putter
+            finally:
+                for lane in (self.high, self.low):
+                    if putter in lane._putters:
+                        lane._putters.remove(putter)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the next event.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        return self.drain(1)[0]
+
+    async def get(self) -> Any:
+        """Remove and return the next event, waiting until one arrives."""
+        while self.empty():
+            await self.wait()
+        return self.get_nowait()
+
+    def drain(
+        self, max_items: int, capture_times: Optional[List[float]] = None
+    ) -> List[Any]:
+        """Remove and return up to ``max_items`` events, high priority first.
+
+        Args:
+            max_items: Maximum number of events to return
+            capture_times: Optional list extended with the ``perf_counter``
+                stamp of each returned event, in the same order
+
+        Returns:
+            High-priority events in FIFO order followed by low-priority
+            events in FIFO order, or the reverse when the low lane is due
+        """
+        if self._starved >= self.starvation_limit:
+            batch = self.low.drain(max_items, capture_times)
+            low_taken = len(batch)
+            if low_taken < max_items:
+                batch += self.high.drain(max_items - low_taken, capture_times)
+        else:
+            batch = self.high.drain(max_items, capture_times)
+            high_taken = len(batch)
+            if high_taken < max_items:
+                batch += self.low.drain(max_items - high_taken, capture_times)
+            low_taken = len(batch) - high_taken
+
+        # Count consecutive drains that passed over waiting low-lane events
+        if low_taken or self.low.empty():
+            self._starved = 0
+        else:
+            self._starved += 1
+        return batch
+
+    async def wait(self, timeout: Optional[float] = None, count: int = 1) -> bool:
+        """Wait until the lanes hold at least ``count`` events in total.
+
+        A high-priority event ends the wait early even if fewer than
+        ``count`` events are queued, so errors are not held back.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            count: Number of events to wait for
+
+        Returns:
+            True if ``count`` events are available, False if the timeout
+            expired or the wait ended early
+        """
+        if self.qsize() >= count:
+            return True
+
+        loop = asyncio.get_running_loop()
+        # Both lanes resolve the same waiter: the high lane on its next
+        # event, the low lane once it brings the total to ``count``
+        waiter = self.high._waiter = self.low._waiter = loop.create_future()
+        self.high._wait_for = self.high._count + 1
+        self.low._wait_for = min(max(count - self.high.qsize(), 1), self.low.maxsize)
+        handle = (
+            loop.call_later(timeout, _resolve, waiter) if timeout is not None else None
+        )
+        try:
+            await waiter
+        finally:
+            if handle is not None:
+                handle.cancel()
+            for lane in (self.high, self.low):
+                if lane._waiter is waiter:
+                    lane._waiter = None
+                    lane._wait_for = 1
+        return self.qsize() >= count
+
+    def wake(self) -> None:
+        """Wake the parked consumer even though no event arrived."""
+        self.high.wake()
+        self.low.wake()
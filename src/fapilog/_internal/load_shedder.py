@@ -0,0 +1,118 @@
+"""Adaptive load shedding for the ``adaptive`` queue overflow strategy.
+
+A fixed ``sampling_rate`` thins events whether or not the sinks keep up,
+and without it a saturated queue drops every event, errors included, once
+it is full. ``LoadShedder`` instead admits DEBUG and INFO events with
+probabilities driven by an AIMD controller: while the queue is above its
+high watermark and still growing (events admitted faster than the worker
+drains them), the DEBUG rate is halved, then the INFO rate once DEBUG is at
+its floor; once the queue drains or falls below the low watermark the rates
+recover additively, INFO first. Warnings and errors are never shed.
+
+The controller runs inline on the logging path, at most once per
+``interval``; there is no timer task.
+"""
+
+import random as rnd
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+# Levels that may be shed, in shedding order
+SHEDDABLE_LEVELS: Tuple[str, ...] = ("debug", "info")
+
+
+class LoadShedder:
+    """AIMD controller for per-level admission probabilities.
+
+    Counters are updated without a lock from whichever thread logs; a lost
+    increment only nudges one controller step.
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        interval: float = 0.005,
+        high_water: float = 0.5,
+        low_water: float = 0.25,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        min_rate: float = 0.01,
+        container: Optional["LoggingContainer"] = None,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            queue: The worker's queue (``qsize()`` and ``maxsize``)
+            interval: Minimum seconds between controller updates
+            high_water: Fill ratio above which a growing queue sheds load
+            low_water: Fill ratio below which admission rates recover
+            increase: Amount added to a rate on each recovery step
+            decrease: Factor applied to a rate on each shedding step
+            min_rate: Lowest admission probability of any level
+            container: Optional LoggingContainer for rate metrics
+        """
+        self.queue = queue
+        self.interval = interval
+        self.high_water = high_water
+        self.low_water = low_water
+        self.increase = increase
+        self.decrease = decrease
+        self.min_rate = min_rate
+        self._container = container
+        self.rates: Dict[str, float] = dict.fromkeys(SHEDDABLE_LEVELS, 1.0)
+        # Admitted and drained events since the last update
+        self._admitted = 0
+        self._drained = 0
+        self._updated_at = time.monotonic()
+
+    def admit(self, level: Any) -> bool:
+        """Decide whether an event at ``level`` enters the queue."""
+        now = time.monotonic()
+        if now - self._updated_at >= self.interval:
+            self._update(now)
+
+        rate = self.rates.get(level.lower()) if isinstance(level, str) else None
+        if rate is not None and rate < 1.0 and rnd.random() >= rate:
+            return False
+        self._admitted += 1
+        return True
+
+    def record_drained(self, count: int) -> None:
+        """Count events taken off the queue by the worker."""
+        self._drained += count
+
+    def _update(self, now: float) -> None:
+        """Run one AIMD step from the queue's fill ratio and net inflow."""
+        fill = self.queue.qsize() / self.queue.maxsize
+        growing = self._admitted > self._drained
+        self._admitted = 0
+        self._drained = 0
+        self._updated_at = now
+
+        rates = self.rates
+        if fill >= self.high_water and growing:
+            # Multiplicative decrease, least important level first
+            for level in SHEDDABLE_LEVELS:
+                if rates[level] > self.min_rate:
+                    rates[level] = max(rates[level] * self.decrease, self.min_rate)
+                    break
+            else:
+                return
+        elif fill < self.low_water or not growing:
+            # Additive increase, most important level first
+            for level in reversed(SHEDDABLE_LEVELS):
+                if rates[level] < 1.0:
+                    rates[level] = min(rates[level] + self.increase, 1.0)
+                    break
+            else:
+                return
+        else:
+            return
+
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            for level, rate in rates.items():
+                metrics.record_admission_rate(level, rate)
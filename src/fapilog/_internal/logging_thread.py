@@ -0,0 +1,109 @@
+"""Dedicated thread running the queue worker on its own event loop.
+
+By default the queue worker is a task on the application's event loop, so
+sink I/O, retry backoff and HTTP sink calls share the loop with request
+handling. ``LoggingThread`` instead runs the worker, and with it every sink
+write, on a private loop in a daemon thread. The application side only
+hands events off through the ring buffer's ``put_threadsafe``.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingThread:
+    """Own a daemon thread and event loop that run a ``QueueWorker``."""
+
+    def __init__(self, worker: Any, name: str = "fapilog-worker") -> None:
+        """Initialize the thread.
+
+        Args:
+            worker: The ``QueueWorker`` to run on the thread's loop
+            name: Thread name, shown in thread dumps and profilers
+        """
+        self.worker = worker
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The thread's event loop, or None if the thread is not running."""
+        return self._loop
+
+    def is_running(self) -> bool:
+        """Check whether the thread and its loop are running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: float = 5.0) -> None:
+        """Start the thread and the worker on its loop.
+
+        Returns once the worker is running, so events logged afterwards are
+        accepted by the thread-safe handoff.
+        """
+        if self.is_running():
+            return
+
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        self._loop = loop
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait(timeout)
+        asyncio.run_coroutine_threadsafe(self.worker.start(), loop).result(timeout)
+        logger.debug("Logging thread started")
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Shut down the worker, draining the queue, then stop the thread."""
+        loop = self._loop
+        if loop is None or not self.is_running():
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(self.worker.shutdown(), loop)
+                ),
+                timeout,
+            )
+        except Exception as e:
+            logger.warning(f"Error during logging thread worker shutdown: {e}")
+        self._stop_loop(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Blocking version of ``shutdown`` for sync callers and ``atexit``."""
+        loop = self._loop
+        if loop is None or not self.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.worker.shutdown(), loop).result(
+                timeout
+            )
+        except Exception as e:
+            logger.warning(f"Error during logging thread worker shutdown: {e}")
+        self._stop_loop(timeout)
+
+    def _stop_loop(self, timeout: float) -> None:
+        loop, thread = self._loop, self._thread
+        self._loop = None
+        self._thread = None
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                pass  # Loop already closed
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        logger.debug("Logging thread stopped")
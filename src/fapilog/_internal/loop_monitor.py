@@ -0,0 +1,89 @@
+"""Event-loop lag probe for measuring logging's impact on the application.
+
+The probe sleeps for a fixed interval and measures how late it wakes up.
+That delay is the scheduling lag every other coroutine on the loop (request
+handlers included) experienced at the same moment. Samples taken while the
+queue worker was processing a batch are recorded separately, so stalls
+caused by logging can be told apart from stalls caused by the application.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+    from .queue_worker import QueueWorker
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Periodically measure event-loop scheduling delay."""
+
+    def __init__(
+        self,
+        metrics: "MetricsCollector",
+        interval: float = 0.1,
+        worker: Optional["QueueWorker"] = None,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            metrics: Collector that receives the lag samples
+            interval: Seconds between probes
+            worker: Optional queue worker whose batches lag is attributed to
+        """
+        self.metrics = metrics
+        self.interval = interval
+        self.worker = worker
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start probing on the running event loop (idempotent)."""
+        if self.is_running():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.debug("Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        """Stop probing and wait for the probe task to finish."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except RuntimeError:
+            # Task belongs to another (possibly closed) loop
+            pass
+
+    def cancel(self) -> None:
+        """Cancel the probe task without waiting (for sync shutdown)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            try:
+                task.cancel()
+            except RuntimeError:
+                pass
+
+    def is_running(self) -> bool:
+        """Check if the probe task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Probe loop: sleep for the interval and record the overshoot."""
+        loop = asyncio.get_running_loop()
+        while True:
+            worker = self.worker
+            batches_before = worker.batches_started if worker else 0
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+
+            during_batch = worker is not None and (
+                worker.in_batch or worker.batches_started != batches_before
+            )
+            self.metrics.record_loop_lag(lag_ms, during_batch=during_batch)
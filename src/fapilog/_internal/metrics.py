@@ -1,11 +1,30 @@
-"""Metrics collection system for fapilog performance monitoring."""
+"""Metrics collection system for fapilog performance monitoring.
+
+Recording is designed to stay cheap on the logging hot path: each thread
+writes to its own shard without taking a lock, sliding-window averages are
+maintained as running sums, and shards are only aggregated when metrics are
+read. The shards of threads that have exited are folded into one retired
+shard whenever a new thread registers, so short-lived threads do not grow
+the shard list.
+"""
 
 import logging
+import math
 import threading
 import time
-from collections import defaultdict, deque
+import weakref
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, DefaultDict, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .circuit_breaker import CIRCUIT_STATES
+from .drop_ledger import DropLedger
+from .histogram import (
+    DEFAULT_LATENCY_BUCKETS_MS,
+    Histogram,
+    format_prometheus_histogram,
+)
+from .top_k import SpaceSavingCounter
 
 # Optional dependency for resource monitoring
 try:
@@ -18,6 +37,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Breakdowns tracked by record_event_volume: dimension -> Prometheus label
+VOLUME_DIMENSIONS: Tuple[Tuple[str, str], ...] = (
+    ("level", "level"),
+    ("logger", "logger"),
+    ("event", "event"),
+)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
 
 @dataclass
 class QueueMetrics:
@@ -29,6 +60,8 @@ class QueueMetrics:
     total_dequeued: int = 0
     total_dropped: int = 0
     total_sampled: int = 0
+    total_blocked: int = 0
+    blocked_seconds: float = 0.0
     enqueue_latency_ms: float = 0.0
     dequeue_latency_ms: float = 0.0
     batch_processing_time_ms: float = 0.0
@@ -44,6 +77,9 @@ class SinkMetrics:
     total_successes: int = 0
     total_failures: int = 0
     total_retries: int = 0
+    total_dropped: int = 0
+    backlog: int = 0
+    circuit_state: str = "closed"
     avg_write_latency_ms: float = 0.0
     avg_batch_size: float = 0.0
     memory_usage_bytes: int = 0
@@ -62,41 +98,282 @@ class PerformanceMetrics:
     cpu_usage_percent: float = 0.0
 
 
+class _RunningWindow:
+    """Sliding window of recent samples with an O(1) running sum.
+
+    The value evicted by each append is subtracted from the running total.
+    Once per full window the total is recomputed exactly, so floating point
+    drift cannot accumulate and the amortized cost stays O(1).
+    """
+
+    __slots__ = ("values", "total", "_evictions")
+
+    def __init__(self, size: int) -> None:
+        self.values: Deque[float] = deque(maxlen=size)
+        self.total = 0.0
+        self._evictions = 0
+
+    def add(self, value: float) -> None:
+        values = self.values
+        if len(values) == values.maxlen:
+            self.total -= values[0]
+            self._evictions += 1
+        values.append(value)
+        self.total += value
+        if self._evictions >= len(values):
+            self.total = math.fsum(values)
+            self._evictions = 0
+
+    def merge(self, other: "_RunningWindow") -> None:
+        for value in other.values:
+            self.add(value)
+
+
+def _mean(windows: List[_RunningWindow]) -> float:
+    """Mean over the samples of several windows."""
+    count = sum(len(window.values) for window in windows)
+    if count == 0:
+        return 0.0
+    return sum(window.total for window in windows) / count
+
+
+class _SinkShard:
+    """Per-thread sink counters."""
+
+    __slots__ = (
+        "writes",
+        "successes",
+        "failures",
+        "retries",
+        "dropped",
+        "circuit_transitions",
+        "write_times",
+        "write_latency",
+        "dwell_latency",
+        "end_to_end_latency",
+        "batch_sizes",
+        "last_error",
+        "last_error_time",
+    )
+
+    def __init__(self, sample_window: int, buckets: Tuple[float, ...]) -> None:
+        self.writes = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.dropped = 0
+        self.circuit_transitions: Dict[str, int] = {}
+        self.write_times = _RunningWindow(sample_window)
+        self.write_latency = Histogram(buckets)
+        self.dwell_latency = Histogram(buckets)
+        self.end_to_end_latency = Histogram(buckets)
+        self.batch_sizes = _RunningWindow(sample_window)
+        self.last_error: Optional[str] = None
+        self.last_error_time: Optional[float] = None
+
+    def merge(self, other: "_SinkShard") -> None:
+        """Add another shard's counters and samples into this one."""
+        self.writes += other.writes
+        self.successes += other.successes
+        self.failures += other.failures
+        self.retries += other.retries
+        self.dropped += other.dropped
+        for state, count in other.circuit_transitions.items():
+            self.circuit_transitions[state] = (
+                self.circuit_transitions.get(state, 0) + count
+            )
+        self.write_times.merge(other.write_times)
+        self.write_latency.merge(other.write_latency)
+        self.dwell_latency.merge(other.dwell_latency)
+        self.end_to_end_latency.merge(other.end_to_end_latency)
+        self.batch_sizes.merge(other.batch_sizes)
+        if (other.last_error_time or 0.0) >= (self.last_error_time or 0.0):
+            if other.last_error is not None:
+                self.last_error = other.last_error
+                self.last_error_time = other.last_error_time
+
+
+class _MetricsShard:
+    """Metrics recorded by a single thread; only that thread writes to it."""
+
+    def __init__(
+        self, sample_window: int, buckets: Tuple[float, ...], top_k: int
+    ) -> None:
+        self.sample_window = sample_window
+        self.buckets = buckets
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+        self.sampled = 0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.log_events = 0
+        self.enqueue_times = _RunningWindow(sample_window)
+        self.dequeue_times = _RunningWindow(sample_window)
+        self.batch_processing_times = _RunningWindow(sample_window)
+        self.processing_times = _RunningWindow(sample_window)
+        self.enqueue_latency = Histogram(buckets)
+        self.dwell_latency = Histogram(buckets)
+        self.batch_latency = Histogram(buckets)
+        self.loop_lag = Histogram(buckets)
+        self.loop_lag_during_batch = Histogram(buckets)
+        self.event_timestamps: Deque[float] = deque(maxlen=sample_window)
+        self.sinks: Dict[str, _SinkShard] = {}
+        self.request_latency: Dict[Tuple[str, str, int], Histogram] = {}
+        self.level_volume = SpaceSavingCounter(top_k)
+        self.logger_volume = SpaceSavingCounter(top_k)
+        self.event_volume = SpaceSavingCounter(top_k)
+        # Recording thread; None for the shard of retired threads
+        self.owner: Optional[weakref.ref[threading.Thread]] = None
+
+    def sink(self, sink_name: str) -> _SinkShard:
+        shard = self.sinks.get(sink_name)
+        if shard is None:
+            shard = self.sinks[sink_name] = _SinkShard(self.sample_window, self.buckets)
+        return shard
+
+    def is_retired(self) -> bool:
+        """Whether the thread that recorded into this shard has exited."""
+        if self.owner is None:
+            return False
+        thread = self.owner()
+        return thread is None or not thread.is_alive()
+
+    def merge(self, other: "_MetricsShard") -> None:
+        """Add another shard's counters and samples into this one."""
+        self.enqueued += other.enqueued
+        self.dequeued += other.dequeued
+        self.dropped += other.dropped
+        self.sampled += other.sampled
+        self.blocked += other.blocked
+        self.blocked_seconds += other.blocked_seconds
+        self.log_events += other.log_events
+        self.enqueue_times.merge(other.enqueue_times)
+        self.dequeue_times.merge(other.dequeue_times)
+        self.batch_processing_times.merge(other.batch_processing_times)
+        self.processing_times.merge(other.processing_times)
+        self.enqueue_latency.merge(other.enqueue_latency)
+        self.dwell_latency.merge(other.dwell_latency)
+        self.batch_latency.merge(other.batch_latency)
+        self.loop_lag.merge(other.loop_lag)
+        self.loop_lag_during_batch.merge(other.loop_lag_during_batch)
+        timestamps = sorted([*self.event_timestamps, *other.event_timestamps])
+        self.event_timestamps.clear()
+        self.event_timestamps.extend(timestamps)
+        for sink_name, sink_shard in other.sinks.items():
+            self.sink(sink_name).merge(sink_shard)
+        for key, histogram in other.request_latency.items():
+            target = self.request_latency.get(key)
+            if target is None:
+                target = self.request_latency[key] = Histogram(histogram.bounds)
+            target.merge(histogram)
+        self.level_volume.merge(other.level_volume)
+        self.logger_volume.merge(other.logger_volume)
+        self.event_volume.merge(other.event_volume)
+
+
 class MetricsCollector:
-    """Centralized metrics collection system for fapilog."""
+    """Centralized metrics collection system for fapilog.
+
+    ``queue_metrics``, ``sink_metrics`` and ``performance_metrics`` are
+    snapshots aggregated from the per-thread shards each time they are read.
+    """
 
-    def __init__(self, enabled: bool = True, sample_window: int = 100):
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_window: int = 100,
+        histogram_buckets: Optional[Sequence[float]] = None,
+        top_k: int = 50,
+        drop_ledger: Optional[DropLedger] = None,
+    ):
         """Initialize the metrics collector.
 
         Args:
             enabled: Whether metrics collection is enabled
             sample_window: Number of recent samples to keep for averages
+                (per recording thread)
+            histogram_buckets: Latency histogram bucket upper bounds in
+                milliseconds; defaults to DEFAULT_LATENCY_BUCKETS_MS
+            top_k: Number of levels, logger names and event names whose
+                event and byte volume is tracked (space-saving top-K)
+            drop_ledger: Optional ledger whose per-reason drop counts are
+                exported with these metrics
         """
         self.enabled = enabled
         self.sample_window = sample_window
+        self.top_k = top_k
+        self.drop_ledger = drop_ledger
+        self.histogram_buckets: Tuple[float, ...] = tuple(
+            sorted(
+                histogram_buckets
+                if histogram_buckets is not None
+                else DEFAULT_LATENCY_BUCKETS_MS
+            )
+        )
+        # Guards shard registration and aggregation, never recording
         self._lock = threading.RLock()
 
-        # Initialize metrics
-        self.queue_metrics = QueueMetrics()
-        self.sink_metrics: Dict[str, SinkMetrics] = {}
-        self.performance_metrics = PerformanceMetrics()
-
-        # Sliding windows for calculating averages
-        self._enqueue_times: deque = deque(maxlen=sample_window)
-        self._dequeue_times: deque = deque(maxlen=sample_window)
-        self._batch_processing_times: deque = deque(maxlen=sample_window)
-        self._sink_write_times: DefaultDict[str, deque] = defaultdict(
-            lambda: deque(maxlen=sample_window)
-        )
-        self._sink_batch_sizes: DefaultDict[str, deque] = defaultdict(
-            lambda: deque(maxlen=sample_window)
-        )
-        self._processing_times: deque = deque(maxlen=sample_window)
-        self._event_timestamps: deque = deque(maxlen=sample_window)
+        self._local = threading.local()
+        # Live threads' shards, after the shard of retired threads
+        self._shards: List[_MetricsShard] = [self._new_shard()]
+
+        # Gauges written directly (last write wins)
+        self._queue_size = 0
+        self._peak_queue_size = 0
+        self._queue_memory_bytes = 0
+        self._memory_usage_bytes = 0
+        self._cpu_usage_percent = 0.0
+        # Events buffered per sink queue
+        self._sink_backlog: Dict[str, int] = {}
+        # Current circuit breaker state per sink
+        self._circuit_state: Dict[str, str] = {}
+        # Disk spill store gauges by store name
+        self._spill: Dict[str, Dict[str, float]] = {}
+        # Adaptive overflow admission probability by level
+        self._admission_rates: Dict[str, float] = {}
+        # Adaptive batch size and flush timeout of the queue worker
+        self._batch_tuning: Dict[str, float] = {}
+        # Estimated bytes in the queue, when the queue has a byte budget
+        self._queue_bytes: Optional[int] = None
 
         # Start time for metrics
         self._start_time = time.time()
 
+    def _new_shard(self) -> _MetricsShard:
+        return _MetricsShard(self.sample_window, self.histogram_buckets, self.top_k)
+
+    def _shard(self) -> _MetricsShard:
+        """Get the calling thread's shard, registering it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+            shard.owner = weakref.ref(threading.current_thread())
+            with self._lock:
+                self._retire_shards()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _retire_shards(self) -> None:
+        """Fold the shards of exited threads into the retired shard.
+
+        The merge goes into a new shard so readers still aggregating the
+        previous shard list never see an event counted twice.
+        """
+        live = []
+        merged = None
+        for shard in self._shards[1:]:
+            if not shard.is_retired():
+                live.append(shard)
+                continue
+            if merged is None:
+                merged = self._new_shard()
+                merged.merge(self._shards[0])
+            merged.merge(shard)
+        if merged is not None:
+            self._shards = [merged, *live]
+
     def is_enabled(self) -> bool:
         """Check if metrics collection is enabled."""
         return self.enabled
@@ -115,93 +392,291 @@ class MetricsCollector:
             return
 
         with self._lock:
-            self.queue_metrics = QueueMetrics()
-            self.sink_metrics.clear()
-            self.performance_metrics = PerformanceMetrics()
-
-            # Clear sliding windows
-            self._enqueue_times.clear()
-            self._dequeue_times.clear()
-            self._batch_processing_times.clear()
-            self._sink_write_times.clear()
-            self._sink_batch_sizes.clear()
-            self._processing_times.clear()
-            self._event_timestamps.clear()
+            # Threads pick up fresh shards through the new thread-local
+            self._local = threading.local()
+            self._shards = [self._new_shard()]
+
+            self._queue_size = 0
+            self._peak_queue_size = 0
+            self._queue_memory_bytes = 0
+            self._memory_usage_bytes = 0
+            self._cpu_usage_percent = 0.0
+            self._sink_backlog = {}
+            self._circuit_state = {}
+            self._spill = {}
+            self._admission_rates = {}
+            self._batch_tuning = {}
+            self._queue_bytes = None
 
             self._start_time = time.time()
 
+    # Aggregated views
+    @property
+    def queue_metrics(self) -> QueueMetrics:
+        """Queue metrics aggregated across all recording threads."""
+        with self._lock:
+            shards = list(self._shards)
+        return QueueMetrics(
+            size=self._queue_size,
+            peak_size=self._peak_queue_size,
+            total_enqueued=sum(shard.enqueued for shard in shards),
+            total_dequeued=sum(shard.dequeued for shard in shards),
+            total_dropped=sum(shard.dropped for shard in shards),
+            total_sampled=sum(shard.sampled for shard in shards),
+            total_blocked=sum(shard.blocked for shard in shards),
+            blocked_seconds=sum(shard.blocked_seconds for shard in shards),
+            enqueue_latency_ms=_mean([shard.enqueue_times for shard in shards]),
+            dequeue_latency_ms=_mean([shard.dequeue_times for shard in shards]),
+            batch_processing_time_ms=_mean(
+                [shard.batch_processing_times for shard in shards]
+            ),
+            memory_usage_bytes=self._queue_memory_bytes,
+        )
+
+    @property
+    def sink_metrics(self) -> Dict[str, SinkMetrics]:
+        """Per-sink metrics aggregated across all recording threads."""
+        with self._lock:
+            shards = list(self._shards)
+
+        grouped: Dict[str, List[_SinkShard]] = {}
+        for shard in shards:
+            for sink_name, sink_shard in list(shard.sinks.items()):
+                grouped.setdefault(sink_name, []).append(sink_shard)
+
+        result = {}
+        for sink_name, sink_shards in grouped.items():
+            latest = max(sink_shards, key=lambda s: s.last_error_time or 0.0)
+            result[sink_name] = SinkMetrics(
+                name=sink_name,
+                total_writes=sum(s.writes for s in sink_shards),
+                total_successes=sum(s.successes for s in sink_shards),
+                total_failures=sum(s.failures for s in sink_shards),
+                total_retries=sum(s.retries for s in sink_shards),
+                total_dropped=sum(s.dropped for s in sink_shards),
+                backlog=self._sink_backlog.get(sink_name, 0),
+                circuit_state=self._circuit_state.get(sink_name, "closed"),
+                avg_write_latency_ms=_mean([s.write_times for s in sink_shards]),
+                avg_batch_size=_mean([s.batch_sizes for s in sink_shards]),
+                last_error=latest.last_error,
+                last_error_time=latest.last_error_time,
+            )
+        return result
+
+    @property
+    def performance_metrics(self) -> PerformanceMetrics:
+        """Performance metrics aggregated across all recording threads."""
+        with self._lock:
+            shards = list(self._shards)
+
+        # Events per second over the union of the recent timestamp windows
+        events_per_second = 0.0
+        windows = [list(shard.event_timestamps) for shard in shards]
+        windows = [window for window in windows if window]
+        sample_count = sum(len(window) for window in windows)
+        if sample_count > 1:
+            time_span = max(w[-1] for w in windows) - min(w[0] for w in windows)
+            if time_span > 0:
+                events_per_second = sample_count / time_span
+
+        return PerformanceMetrics(
+            total_log_events=sum(shard.log_events for shard in shards),
+            events_per_second=events_per_second,
+            avg_processing_time_ms=_mean([shard.processing_times for shard in shards]),
+            memory_usage_bytes=self._memory_usage_bytes,
+            cpu_usage_percent=self._cpu_usage_percent,
+        )
+
+    @property
+    def request_latency(self) -> Dict[Tuple[str, str, int], Histogram]:
+        """Request latency histograms merged across all recording threads."""
+        with self._lock:
+            shards = list(self._shards)
+
+        merged: Dict[Tuple[str, str, int], Histogram] = {}
+        for shard in shards:
+            for key, histogram in list(shard.request_latency.items()):
+                target = merged.get(key)
+                if target is None:
+                    target = merged[key] = Histogram(histogram.bounds)
+                target.merge(histogram)
+        return merged
+
+    @property
+    def latency_histograms(self) -> Dict[str, Histogram]:
+        """Queue pipeline latency histograms merged across recording threads.
+
+        Keys are ``enqueue``, ``dwell`` and ``batch_processing``.
+        """
+        with self._lock:
+            shards = list(self._shards)
+
+        merged = {
+            "enqueue": Histogram(self.histogram_buckets),
+            "dwell": Histogram(self.histogram_buckets),
+            "batch_processing": Histogram(self.histogram_buckets),
+        }
+        for shard in shards:
+            merged["enqueue"].merge(shard.enqueue_latency)
+            merged["dwell"].merge(shard.dwell_latency)
+            merged["batch_processing"].merge(shard.batch_latency)
+        return merged
+
+    @property
+    def loop_lag(self) -> Dict[str, Histogram]:
+        """Event loop lag histograms merged across recording threads.
+
+        Keys are ``app`` (no worker batch in progress) and ``logging``
+        (the queue worker processed a batch during the sample).
+        """
+        with self._lock:
+            shards = list(self._shards)
+
+        merged = {
+            "app": Histogram(self.histogram_buckets),
+            "logging": Histogram(self.histogram_buckets),
+        }
+        for shard in shards:
+            merged["app"].merge(shard.loop_lag)
+            merged["logging"].merge(shard.loop_lag_during_batch)
+        return merged
+
+    def _merged_sink_histograms(self, attribute: str) -> Dict[str, Histogram]:
+        """Merge one per-sink histogram across recording threads."""
+        with self._lock:
+            shards = list(self._shards)
+
+        merged: Dict[str, Histogram] = {}
+        for shard in shards:
+            for sink_name, sink_shard in list(shard.sinks.items()):
+                target = merged.get(sink_name)
+                if target is None:
+                    target = merged[sink_name] = Histogram(self.histogram_buckets)
+                target.merge(getattr(sink_shard, attribute))
+        return merged
+
+    @property
+    def sink_latency(self) -> Dict[str, Histogram]:
+        """Per-sink write latency histograms merged across recording threads."""
+        return self._merged_sink_histograms("write_latency")
+
+    @property
+    def sink_dwell_latency(self) -> Dict[str, Histogram]:
+        """Per-sink time from queue capture until the sink write started."""
+        return self._merged_sink_histograms("dwell_latency")
+
+    @property
+    def sink_end_to_end_latency(self) -> Dict[str, Histogram]:
+        """Per-sink time from queue capture until the sink write completed."""
+        return self._merged_sink_histograms("end_to_end_latency")
+
+    @property
+    def event_volume(self) -> Dict[str, SpaceSavingCounter]:
+        """Top-K event and byte volume merged across recording threads.
+
+        Keys are ``level``, ``logger`` and ``event``.
+        """
+        with self._lock:
+            shards = list(self._shards)
+
+        merged = {
+            dimension: SpaceSavingCounter(self.top_k)
+            for dimension, _ in VOLUME_DIMENSIONS
+        }
+        for shard in shards:
+            merged["level"].merge(shard.level_volume)
+            merged["logger"].merge(shard.logger_volume)
+            merged["event"].merge(shard.event_volume)
+        return merged
+
     # Queue metrics methods
     def record_queue_size(self, size: int) -> None:
         """Record current queue size."""
         if not self.enabled:
             return
 
-        with self._lock:
-            self.queue_metrics.size = size
-            if size > self.queue_metrics.peak_size:
-                self.queue_metrics.peak_size = size
+        self._queue_size = size
+        if size > self._peak_queue_size:
+            self._peak_queue_size = size
+
+    def record_queue_bytes(self, queued_bytes: int) -> None:
+        """Record the estimated bytes of the events in the queue."""
+        if not self.enabled:
+            return
+
+        self._queue_bytes = queued_bytes
+        self._queue_memory_bytes = queued_bytes
 
     def record_enqueue(self, latency_ms: float) -> None:
         """Record an enqueue operation."""
         if not self.enabled:
             return
 
-        with self._lock:
-            self.queue_metrics.total_enqueued += 1
-            self._enqueue_times.append(latency_ms)
-            self.queue_metrics.enqueue_latency_ms = sum(self._enqueue_times) / len(
-                self._enqueue_times
-            )
+        shard = self._shard()
+        shard.enqueued += 1
+        shard.enqueue_times.add(latency_ms)
+        shard.enqueue_latency.observe(latency_ms)
+
+    def record_dequeue(self, latency_ms: float, count: int = 1) -> None:
+        """Record a dequeue operation.
 
-    def record_dequeue(self, latency_ms: float) -> None:
-        """Record a dequeue operation."""
+        Args:
+            latency_ms: Time the dequeue call took, including any wait
+            count: Number of events the call returned
+        """
         if not self.enabled:
             return
 
-        with self._lock:
-            self.queue_metrics.total_dequeued += 1
-            self._dequeue_times.append(latency_ms)
-            self.queue_metrics.dequeue_latency_ms = sum(self._dequeue_times) / len(
-                self._dequeue_times
-            )
+        shard = self._shard()
+        shard.dequeued += count
+        shard.dequeue_times.add(latency_ms)
+
+    def record_queue_dwell(self, dwell_ms: float) -> None:
+        """Record how long an event waited in the queue before dequeue."""
+        if not self.enabled:
+            return
+
+        self._shard().dwell_latency.observe(dwell_ms)
 
     def record_dropped_event(self) -> None:
         """Record a dropped event."""
         if not self.enabled:
             return
 
-        with self._lock:
-            self.queue_metrics.total_dropped += 1
+        self._shard().dropped += 1
 
     def record_sampled_event(self) -> None:
         """Record a sampled (skipped) event."""
         if not self.enabled:
             return
 
-        with self._lock:
-            self.queue_metrics.total_sampled += 1
+        self._shard().sampled += 1
+
+    def record_enqueue_blocked(self, seconds: float) -> None:
+        """Record time a caller spent blocked waiting for queue space."""
+        if not self.enabled:
+            return
+
+        shard = self._shard()
+        shard.blocked += 1
+        shard.blocked_seconds += seconds
 
     def record_batch_processing(self, processing_time_ms: float) -> None:
         """Record batch processing time."""
         if not self.enabled:
             return
 
-        with self._lock:
-            self._batch_processing_times.append(processing_time_ms)
-            self.queue_metrics.batch_processing_time_ms = sum(
-                self._batch_processing_times
-            ) / len(self._batch_processing_times)
+        shard = self._shard()
+        shard.batch_processing_times.add(processing_time_ms)
+        shard.batch_latency.observe(processing_time_ms)
 
     # Sink metrics methods
     def get_sink_metrics(self, sink_name: str) -> SinkMetrics:
-        """Get or create sink metrics for a given sink."""
+        """Get a snapshot of the metrics for a given sink."""
         if not self.enabled:
             return SinkMetrics(name=sink_name)
 
-        with self._lock:
-            if sink_name not in self.sink_metrics:
-                self.sink_metrics[sink_name] = SinkMetrics(name=sink_name)
-            return self.sink_metrics[sink_name]
+        return self.sink_metrics.get(sink_name) or SinkMetrics(name=sink_name)
 
     def record_sink_write(
         self,
@@ -215,38 +690,127 @@ class MetricsCollector:
         if not self.enabled:
             return
 
-        with self._lock:
-            metrics = self.get_sink_metrics(sink_name)
-            metrics.total_writes += 1
-
-            if success:
-                metrics.total_successes += 1
-            else:
-                metrics.total_failures += 1
-                if error:
-                    metrics.last_error = error
-                    metrics.last_error_time = time.time()
-
-            # Update latency average
-            self._sink_write_times[sink_name].append(latency_ms)
-            metrics.avg_write_latency_ms = sum(self._sink_write_times[sink_name]) / len(
-                self._sink_write_times[sink_name]
-            )
+        sink = self._shard().sink(sink_name)
+        sink.writes += 1
 
-            # Update batch size average
-            self._sink_batch_sizes[sink_name].append(batch_size)
-            metrics.avg_batch_size = sum(self._sink_batch_sizes[sink_name]) / len(
-                self._sink_batch_sizes[sink_name]
-            )
+        if success:
+            sink.successes += 1
+        else:
+            sink.failures += 1
+            if error:
+                sink.last_error = error
+                sink.last_error_time = time.time()
+
+        sink.write_times.add(latency_ms)
+        sink.write_latency.observe(latency_ms)
+        sink.batch_sizes.add(batch_size)
+
+    def record_sink_delivery(
+        self, sink_name: str, dwell_ms: float, end_to_end_ms: float
+    ) -> None:
+        """Record how long an event took to reach a sink.
+
+        Args:
+            sink_name: Name of the sink
+            dwell_ms: Time from queue capture until the sink write started
+            end_to_end_ms: Time from queue capture until the write completed
+        """
+        if not self.enabled:
+            return
+
+        sink = self._shard().sink(sink_name)
+        sink.dwell_latency.observe(dwell_ms)
+        sink.end_to_end_latency.observe(end_to_end_ms)
 
     def record_sink_retry(self, sink_name: str) -> None:
         """Record a sink retry operation."""
         if not self.enabled:
             return
 
+        self._shard().sink(sink_name).retries += 1
+
+    def record_sink_backlog(self, sink_name: str, size: int) -> None:
+        """Record the number of events buffered in a sink's queue."""
+        if not self.enabled:
+            return
+
+        self._shard().sink(sink_name)
+        self._sink_backlog[sink_name] = size
+
+    def record_sink_dropped(self, sink_name: str) -> None:
+        """Record an event dropped by a sink's queue."""
+        if not self.enabled:
+            return
+
+        self._shard().sink(sink_name).dropped += 1
+
+    def record_circuit_transition(self, sink_name: str, state: str) -> None:
+        """Record a sink's circuit breaker moving to ``state``."""
+        if not self.enabled:
+            return
+
+        transitions = self._shard().sink(sink_name).circuit_transitions
+        transitions[state] = transitions.get(state, 0) + 1
+        self._circuit_state[sink_name] = state
+
+    def circuit_transitions(self, sink_name: str) -> Dict[str, int]:
+        """Circuit breaker transitions of a sink by target state."""
         with self._lock:
-            metrics = self.get_sink_metrics(sink_name)
-            metrics.total_retries += 1
+            shards = list(self._shards)
+
+        merged: Dict[str, int] = {}
+        for shard in shards:
+            sink = shard.sinks.get(sink_name)
+            if sink is None:
+                continue
+            for state, count in list(sink.circuit_transitions.items()):
+                merged[state] = merged.get(state, 0) + count
+        return merged
+
+    def record_admission_rate(self, level: str, rate: float) -> None:
+        """Record the adaptive overflow admission probability of a level."""
+        if not self.enabled:
+            return
+
+        self._admission_rates[level] = rate
+
+    def record_batch_tuning(self, batch_size: int, flush_timeout: float) -> None:
+        """Record the batch size and flush timeout chosen by adaptive batching."""
+        if not self.enabled:
+            return
+
+        self._batch_tuning = {
+            "batch_size": batch_size,
+            "flush_timeout_seconds": flush_timeout,
+        }
+
+    def record_spill(
+        self,
+        store: str,
+        spilled_bytes: int,
+        segments: int,
+        pending: int,
+        replay_lag_seconds: float,
+    ) -> None:
+        """Record the state of a disk spill store.
+
+        Args:
+            store: Name of the spill store
+            spilled_bytes: Bytes of spilled events not yet replayed
+            segments: Segment files on disk
+            pending: Spilled events not yet replayed
+            replay_lag_seconds: Time the most recently replayed event spent
+                on disk (0 once the store is caught up)
+        """
+        if not self.enabled:
+            return
+
+        self._spill[store] = {
+            "bytes": spilled_bytes,
+            "segments": segments,
+            "pending": pending,
+            "replay_lag_seconds": replay_lag_seconds,
+        }
 
     # Performance metrics methods
     def record_log_event(self, processing_time_ms: float) -> None:
@@ -254,24 +818,68 @@ class MetricsCollector:
         if not self.enabled:
             return
 
-        with self._lock:
-            now = time.time()
-            self.performance_metrics.total_log_events += 1
-
-            # Update processing time average
-            self._processing_times.append(processing_time_ms)
-            self.performance_metrics.avg_processing_time_ms = sum(
-                self._processing_times
-            ) / len(self._processing_times)
-
-            # Update events per second
-            self._event_timestamps.append(now)
-            if len(self._event_timestamps) > 1:
-                time_span = self._event_timestamps[-1] - self._event_timestamps[0]
-                if time_span > 0:
-                    self.performance_metrics.events_per_second = (
-                        len(self._event_timestamps) / time_span
-                    )
+        shard = self._shard()
+        shard.log_events += 1
+        shard.processing_times.add(processing_time_ms)
+        shard.event_timestamps.append(time.time())
+
+    def record_event_volume(
+        self, level: str, logger_name: str, event_name: str, size_bytes: int
+    ) -> None:
+        """Count an accepted event and its serialized size by source.
+
+        Args:
+            level: Log level of the event
+            logger_name: Name of the logger that emitted the event
+            event_name: The event message
+            size_bytes: Estimated serialized size of the event
+        """
+        if not self.enabled:
+            return
+
+        shard = self._shard()
+        shard.level_volume.add(level, size_bytes)
+        shard.logger_volume.add(logger_name, size_bytes)
+        shard.event_volume.add(event_name, size_bytes)
+
+    def record_loop_lag(self, lag_ms: float, during_batch: bool = False) -> None:
+        """Record an event loop scheduling delay sample.
+
+        Args:
+            lag_ms: How late the probe woke up, in milliseconds
+            during_batch: Whether the queue worker processed a batch while
+                the probe was sleeping
+        """
+        if not self.enabled:
+            return
+
+        shard = self._shard()
+        if during_batch:
+            shard.loop_lag_during_batch.observe(lag_ms)
+        else:
+            shard.loop_lag.observe(lag_ms)
+
+    # Request metrics methods
+    def record_request(
+        self, method: str, route: str, status_code: int, latency_ms: float
+    ) -> None:
+        """Record a request latency in its per-route, per-status histogram.
+
+        Args:
+            method: HTTP method
+            route: Route template (not the raw path, to bound cardinality)
+            status_code: HTTP response status code
+            latency_ms: Request latency in milliseconds
+        """
+        if not self.enabled:
+            return
+
+        histograms = self._shard().request_latency
+        key = (method, route, status_code)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.histogram_buckets)
+        histogram.observe(latency_ms)
 
     def update_memory_metrics(self) -> None:
         """Update memory usage metrics."""
@@ -282,16 +890,14 @@ class MetricsCollector:
             process = psutil.Process()
             memory_info = process.memory_info()
 
-            with self._lock:
-                self.performance_metrics.memory_usage_bytes = memory_info.rss
-                self.performance_metrics.cpu_usage_percent = process.cpu_percent()
+            self._memory_usage_bytes = memory_info.rss
+            self._cpu_usage_percent = process.cpu_percent()
 
-                # Estimate queue memory usage (rough approximation)
-                # This is a simple heuristic based on queue size
+            # Without a byte-budgeted queue reporting its running total,
+            # estimate queue memory from the queue size
+            if self._queue_bytes is None:
                 estimated_event_size = 500  # bytes per event estimate
-                self.queue_metrics.memory_usage_bytes = (
-                    self.queue_metrics.size * estimated_event_size
-                )
+                self._queue_memory_bytes = self._queue_size * estimated_event_size
 
         except Exception as e:
             logger.debug(f"Failed to update memory metrics: {e}")
@@ -301,56 +907,122 @@ class MetricsCollector:
         if not self.enabled:
             return {}
 
-        with self._lock:
-            # Update memory metrics before returning
-            self.update_memory_metrics()
-
-            return {
-                "queue": {
-                    "size": self.queue_metrics.size,
-                    "peak_size": self.queue_metrics.peak_size,
-                    "total_enqueued": self.queue_metrics.total_enqueued,
-                    "total_dequeued": self.queue_metrics.total_dequeued,
-                    "total_dropped": self.queue_metrics.total_dropped,
-                    "total_sampled": self.queue_metrics.total_sampled,
-                    "enqueue_latency_ms": self.queue_metrics.enqueue_latency_ms,
-                    "dequeue_latency_ms": self.queue_metrics.dequeue_latency_ms,
-                    "batch_processing_time_ms": self.queue_metrics.batch_processing_time_ms,
-                    "memory_usage_bytes": self.queue_metrics.memory_usage_bytes,
-                },
-                "sinks": {
-                    name: {
-                        "total_writes": metrics.total_writes,
-                        "total_successes": metrics.total_successes,
-                        "total_failures": metrics.total_failures,
-                        "total_retries": metrics.total_retries,
-                        "success_rate": (
-                            metrics.total_successes / metrics.total_writes
-                            if metrics.total_writes > 0
-                            else 0.0
-                        ),
-                        "error_rate": (
-                            metrics.total_failures / metrics.total_writes
-                            if metrics.total_writes > 0
-                            else 0.0
-                        ),
-                        "avg_write_latency_ms": metrics.avg_write_latency_ms,
-                        "avg_batch_size": metrics.avg_batch_size,
-                        "memory_usage_bytes": metrics.memory_usage_bytes,
-                        "last_error": metrics.last_error,
-                        "last_error_time": metrics.last_error_time,
-                    }
-                    for name, metrics in self.sink_metrics.items()
-                },
-                "performance": {
-                    "total_log_events": self.performance_metrics.total_log_events,
-                    "events_per_second": self.performance_metrics.events_per_second,
-                    "avg_processing_time_ms": self.performance_metrics.avg_processing_time_ms,
-                    "memory_usage_bytes": self.performance_metrics.memory_usage_bytes,
-                    "cpu_usage_percent": self.performance_metrics.cpu_usage_percent,
-                    "uptime_seconds": time.time() - self._start_time,
-                },
-            }
+        # Update memory metrics before returning
+        self.update_memory_metrics()
+
+        # Aggregate the per-thread shards once for this read
+        queue_metrics = self.queue_metrics
+        sink_metrics = self.sink_metrics
+        performance_metrics = self.performance_metrics
+        request_latency = self.request_latency
+        latency_histograms = self.latency_histograms
+        loop_lag = self.loop_lag
+        event_volume = self.event_volume
+        drops = self.drop_ledger.totals() if self.drop_ledger is not None else {}
+        sink_histograms = {
+            "write_latency": self.sink_latency,
+            "dwell": self.sink_dwell_latency,
+            "end_to_end": self.sink_end_to_end_latency,
+        }
+        empty_summary = Histogram(self.histogram_buckets).summary()
+
+        return {
+            "queue": {
+                "size": queue_metrics.size,
+                "peak_size": queue_metrics.peak_size,
+                "total_enqueued": queue_metrics.total_enqueued,
+                "total_dequeued": queue_metrics.total_dequeued,
+                "total_dropped": queue_metrics.total_dropped,
+                "total_sampled": queue_metrics.total_sampled,
+                "total_blocked": queue_metrics.total_blocked,
+                "blocked_seconds": queue_metrics.blocked_seconds,
+                "enqueue_latency_ms": queue_metrics.enqueue_latency_ms,
+                "dequeue_latency_ms": queue_metrics.dequeue_latency_ms,
+                "batch_processing_time_ms": queue_metrics.batch_processing_time_ms,
+                "memory_usage_bytes": queue_metrics.memory_usage_bytes,
+                "admission_rates": dict(self._admission_rates),
+                "batch_tuning": dict(self._batch_tuning),
+                "bytes": self._queue_bytes,
+            },
+            "drops": drops,
+            "spill": {store: dict(gauges) for store, gauges in self._spill.items()},
+            "latency": {
+                name: histogram.summary()
+                for name, histogram in latency_histograms.items()
+            },
+            "loop_lag": {
+                source: histogram.summary() for source, histogram in loop_lag.items()
+            },
+            "volume": {
+                dimension: [
+                    {"key": key, "events": events, "bytes": nbytes, "error": error}
+                    for key, events, nbytes, error in counter.top()
+                ]
+                for dimension, counter in event_volume.items()
+            },
+            "sinks": {
+                name: {
+                    "total_writes": metrics.total_writes,
+                    "total_successes": metrics.total_successes,
+                    "total_failures": metrics.total_failures,
+                    "total_retries": metrics.total_retries,
+                    "total_dropped": metrics.total_dropped,
+                    "backlog": metrics.backlog,
+                    "circuit_state": metrics.circuit_state,
+                    "circuit_transitions": self.circuit_transitions(name),
+                    "success_rate": (
+                        metrics.total_successes / metrics.total_writes
+                        if metrics.total_writes > 0
+                        else 0.0
+                    ),
+                    "error_rate": (
+                        metrics.total_failures / metrics.total_writes
+                        if metrics.total_writes > 0
+                        else 0.0
+                    ),
+                    "avg_write_latency_ms": metrics.avg_write_latency_ms,
+                    **{
+                        key: (
+                            histograms[name].summary()
+                            if name in histograms
+                            else empty_summary
+                        )
+                        for key, histograms in sink_histograms.items()
+                    },
+                    "avg_batch_size": metrics.avg_batch_size,
+                    "memory_usage_bytes": metrics.memory_usage_bytes,
+                    "last_error": metrics.last_error,
+                    "last_error_time": metrics.last_error_time,
+                }
+                for name, metrics in sink_metrics.items()
+            },
+            "requests": [
+                {
+                    "method": method,
+                    "route": route,
+                    "status_code": status_code,
+                    "count": histogram.count,
+                    "avg_latency_ms": histogram.sum / histogram.count,
+                    "p50_latency_ms": histogram.quantile(0.5),
+                    "p90_latency_ms": histogram.quantile(0.9),
+                    "p99_latency_ms": histogram.quantile(0.99),
+                    "max_latency_ms": histogram.max,
+                }
+                for (
+                    method,
+                    route,
+                    status_code,
+                ), histogram in request_latency.items()
+            ],
+            "performance": {
+                "total_log_events": performance_metrics.total_log_events,
+                "events_per_second": performance_metrics.events_per_second,
+                "avg_processing_time_ms": performance_metrics.avg_processing_time_ms,
+                "memory_usage_bytes": performance_metrics.memory_usage_bytes,
+                "cpu_usage_percent": performance_metrics.cpu_usage_percent,
+                "uptime_seconds": time.time() - self._start_time,
+            },
+        }
 
     def get_prometheus_metrics(self) -> str:
         """Export metrics in Prometheus format."""
@@ -384,6 +1056,17 @@ class MetricsCollector:
                 "# TYPE fapilog_queue_dropped_total counter",
                 f"fapilog_queue_dropped_total {queue.get('total_dropped', 0)}",
                 "",
+                "# HELP fapilog_queue_blocked_total Enqueues that blocked "
+                "waiting for queue space",
+                "# TYPE fapilog_queue_blocked_total counter",
+                f"fapilog_queue_blocked_total {queue.get('total_blocked', 0)}",
+                "",
+                "# HELP fapilog_queue_blocked_seconds_total Total time callers "
+                "spent blocked waiting for queue space",
+                "# TYPE fapilog_queue_blocked_seconds_total counter",
+                "fapilog_queue_blocked_seconds_total "
+                f"{queue.get('blocked_seconds', 0.0)}",
+                "",
                 "# HELP fapilog_queue_enqueue_latency_ms Average enqueue latency",
                 "# TYPE fapilog_queue_enqueue_latency_ms gauge",
                 f"fapilog_queue_enqueue_latency_ms {queue.get('enqueue_latency_ms', 0)}",
@@ -395,6 +1078,51 @@ class MetricsCollector:
             ]
         )
 
+        admission_rates = queue.get("admission_rates") or {}
+        if admission_rates:
+            lines.extend(
+                [
+                    "# HELP fapilog_queue_admission_rate Probability that an event "
+                    "at this level is admitted by the adaptive overflow strategy",
+                    "# TYPE fapilog_queue_admission_rate gauge",
+                ]
+            )
+            lines.extend(
+                f'fapilog_queue_admission_rate{{level="{level}"}} {rate}'
+                for level, rate in admission_rates.items()
+            )
+            lines.append("")
+
+        queue_bytes = queue.get("bytes")
+        if queue_bytes is not None:
+            lines.extend(
+                [
+                    "# HELP fapilog_queue_bytes Estimated bytes of the events "
+                    "in the queue",
+                    "# TYPE fapilog_queue_bytes gauge",
+                    f"fapilog_queue_bytes {queue_bytes}",
+                    "",
+                ]
+            )
+
+        batch_tuning = queue.get("batch_tuning") or {}
+        if batch_tuning:
+            lines.extend(
+                [
+                    "# HELP fapilog_queue_batch_size Batch size chosen by "
+                    "adaptive batching",
+                    "# TYPE fapilog_queue_batch_size gauge",
+                    f"fapilog_queue_batch_size {batch_tuning['batch_size']}",
+                    "",
+                    "# HELP fapilog_queue_flush_timeout_seconds Flush timeout "
+                    "chosen by adaptive batching",
+                    "# TYPE fapilog_queue_flush_timeout_seconds gauge",
+                    "fapilog_queue_flush_timeout_seconds "
+                    f"{batch_tuning['flush_timeout_seconds']}",
+                    "",
+                ]
+            )
+
         # Sink metrics
         sinks = all_metrics.get("sinks", {})
         for sink_name, sink_metrics in sinks.items():
@@ -420,8 +1148,65 @@ class MetricsCollector:
                     "# TYPE fapilog_sink_latency_ms gauge",
                     f'fapilog_sink_latency_ms{{sink="{sink_name}"}} {sink_metrics.get("avg_write_latency_ms", 0)}',
                     "",
+                    "# HELP fapilog_sink_backlog Events buffered in the sink's queue",
+                    "# TYPE fapilog_sink_backlog gauge",
+                    f'fapilog_sink_backlog{{sink="{sink_name}"}} {sink_metrics.get("backlog", 0)}',
+                    "",
+                    "# HELP fapilog_sink_dropped_total Events dropped by the sink's queue",
+                    "# TYPE fapilog_sink_dropped_total counter",
+                    f'fapilog_sink_dropped_total{{sink="{sink_name}"}} {sink_metrics.get("total_dropped", 0)}',
+                    "",
+                    "# HELP fapilog_sink_circuit_state Sink circuit breaker state "
+                    "(0 closed, 1 open, 2 half-open)",
+                    "# TYPE fapilog_sink_circuit_state gauge",
+                    f'fapilog_sink_circuit_state{{sink="{sink_name}"}} '
+                    f"{CIRCUIT_STATES.index(sink_metrics.get('circuit_state', 'closed'))}",
+                    "",
                 ]
             )
+            transitions = sink_metrics.get("circuit_transitions") or {}
+            if transitions:
+                lines.extend(
+                    [
+                        "# HELP fapilog_sink_circuit_transitions_total Sink circuit "
+                        "breaker transitions by target state",
+                        "# TYPE fapilog_sink_circuit_transitions_total counter",
+                    ]
+                )
+                lines.extend(
+                    f'fapilog_sink_circuit_transitions_total{{sink="{sink_name}",'
+                    f'state="{state}"}} {count}'
+                    for state, count in transitions.items()
+                )
+                lines.append("")
+
+        # Disk spill stores
+        spill = all_metrics.get("spill", {})
+        if spill:
+            for name, key, help_text in (
+                (
+                    "fapilog_spill_bytes",
+                    "bytes",
+                    "Bytes of spilled events not yet replayed",
+                ),
+                ("fapilog_spill_segments", "segments", "Spill segment files on disk"),
+                (
+                    "fapilog_spill_pending_events",
+                    "pending",
+                    "Spilled events not yet replayed",
+                ),
+                (
+                    "fapilog_spill_replay_lag_seconds",
+                    "replay_lag_seconds",
+                    "Time the most recently replayed event spent on disk",
+                ),
+            ):
+                lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} gauge"])
+                lines.extend(
+                    f'{name}{{store="{store}"}} {gauges[key]}'
+                    for store, gauges in spill.items()
+                )
+                lines.append("")
 
         # Performance metrics
         perf = all_metrics.get("performance", {})
@@ -446,4 +1231,120 @@ class MetricsCollector:
             ]
         )
 
+        # Queue pipeline latency histograms
+        histograms = self.latency_histograms
+        for name, key, help_text in (
+            (
+                "fapilog_queue_enqueue_duration_ms",
+                "enqueue",
+                "Time taken to put an event on the queue",
+            ),
+            (
+                "fapilog_queue_dwell_ms",
+                "dwell",
+                "Time events wait in the queue before being dequeued",
+            ),
+            (
+                "fapilog_batch_processing_duration_ms",
+                "batch_processing",
+                "Time taken to process a batch of events",
+            ),
+        ):
+            lines.extend(
+                format_prometheus_histogram(name, help_text, [("", histograms[key])])
+            )
+
+        lag_series = [
+            (f'source="{source}"', histogram)
+            for source, histogram in self.loop_lag.items()
+            if histogram.count
+        ]
+        if lag_series:
+            lines.extend(
+                format_prometheus_histogram(
+                    "fapilog_event_loop_lag_ms",
+                    "Event loop scheduling delay, by whether a log batch was "
+                    "being processed",
+                    lag_series,
+                )
+            )
+
+        for name, sink_histograms, help_text in (
+            ("fapilog_sink_write_duration_ms", self.sink_latency, "Sink write latency"),
+            (
+                "fapilog_sink_dwell_ms",
+                self.sink_dwell_latency,
+                "Time from queue capture until the sink write started",
+            ),
+            (
+                "fapilog_event_end_to_end_ms",
+                self.sink_end_to_end_latency,
+                "Time from queue capture until the sink write completed",
+            ),
+        ):
+            series = [
+                (f'sink="{sink_name}"', histogram)
+                for sink_name, histogram in sorted(sink_histograms.items())
+                if histogram.count
+            ]
+            if series:
+                lines.extend(format_prometheus_histogram(name, help_text, series))
+
+        # Dropped events by reason
+        drops = all_metrics.get("drops", {})
+        if drops:
+            lines.extend(
+                [
+                    "# HELP fapilog_events_dropped_total Dropped log events by reason",
+                    "# TYPE fapilog_events_dropped_total counter",
+                ]
+            )
+            lines.extend(
+                f'fapilog_events_dropped_total{{reason="{reason}"}} {count}'
+                for reason, count in drops.items()
+            )
+            lines.append("")
+
+        # Event and byte volume by source (top-K keys only)
+        volume = all_metrics.get("volume", {})
+        for dimension, label in VOLUME_DIMENSIONS:
+            entries = volume.get(dimension, [])
+            if not entries:
+                continue
+            for suffix, field, help_text in (
+                ("events", "events", "Accepted log events"),
+                ("bytes", "bytes", "Estimated serialized bytes of accepted log events"),
+            ):
+                name = f"fapilog_{suffix}_by_{dimension}_total"
+                lines.extend(
+                    [
+                        f"# HELP {name} {help_text} by {dimension} (top {self.top_k})",
+                        f"# TYPE {name} counter",
+                    ]
+                )
+                lines.extend(
+                    f'{name}{{{label}="{_escape_label(entry["key"])}"}} {entry[field]}'
+                    for entry in entries
+                )
+                lines.append("")
+
+        # Request latency histograms
+        request_series = [
+            (
+                f'method="{method}",route="{route}",status="{status_code}"',
+                histogram,
+            )
+            for (method, route, status_code), histogram in sorted(
+                self.request_latency.items()
+            )
+        ]
+        if request_series:
+            lines.extend(
+                format_prometheus_histogram(
+                    "fapilog_request_latency_ms",
+                    "Request latency by route and status",
+                    request_series,
+                )
+            )
+
         return "\n".join(lines)
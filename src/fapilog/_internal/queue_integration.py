@@ -8,16 +8,127 @@ dependency injection patterns.
 import asyncio
 import logging
 import random as rnd
+import time
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import structlog
 
+from .load_shedder import LoadShedder
+from .processor_metrics import estimate_event_size
+from .spill_store import SpillStore
+
 if TYPE_CHECKING:
     from ..container import LoggingContainer
 
 logger = logging.getLogger(__name__)
 
 
+def _drop(container: "LoggingContainer", reason: str) -> structlog.DropEvent:
+    """Record a dropped event in the container's drop ledger.
+
+    Returns the ``DropEvent`` for the caller to raise.
+    """
+    container.get_drop_ledger().record(reason)
+    return structlog.DropEvent()
+
+
+def _record_volume(
+    container: "LoggingContainer",
+    logger: Any,
+    method_name: str,
+    event_dict: Dict[str, Any],
+) -> None:
+    """Count an accepted event by level, logger name and event name."""
+    metrics = container.get_metrics_collector()
+    if metrics is None:
+        return
+    metrics.record_event_volume(
+        str(event_dict.get("level", method_name)),
+        str(getattr(logger, "name", None) or "root"),
+        str(event_dict.get("event", "")),
+        estimate_event_size(event_dict),
+    )
+
+
+def _spilled(worker: Any, event_dict: Dict[str, Any]) -> bool:
+    """Hand the event to the worker's spill store if its queue is backed up."""
+    return isinstance(getattr(worker, "spill", None), SpillStore) and bool(
+        worker.spill_event(event_dict)
+    )
+
+
+def _shed(worker: Any, method_name: str, event_dict: Dict[str, Any]) -> bool:
+    """Check whether the worker's adaptive load shedder rejects the event."""
+    shedder = getattr(worker, "shedder", None)
+    return isinstance(shedder, LoadShedder) and not shedder.admit(
+        event_dict.get("level", method_name)
+    )
+
+
+def _put_threadsafe(
+    container: "LoggingContainer", worker: Any, event_dict: Dict[str, Any]
+) -> bool:
+    """Hand an event to the worker's queue from another thread.
+
+    Under the ``block`` strategy a caller finding the queue full waits up to
+    the worker's ``block_timeout`` for space, and the wait is recorded as
+    blocked time.
+    """
+    queue = worker.queue
+    if queue.put_threadsafe(event_dict):
+        return True
+    timeout = getattr(worker, "block_timeout", 0.0)
+    blocking = worker.overflow_strategy == "block"
+    if not blocking or not isinstance(timeout, (int, float)) or timeout <= 0:
+        return False
+
+    start = time.perf_counter()
+    accepted = bool(queue.put_threadsafe(event_dict, timeout=timeout))
+    metrics = container.get_metrics_collector()
+    if metrics is not None:
+        metrics.record_enqueue_blocked(time.perf_counter() - start)
+    return accepted
+
+
+def _running_on(loop: asyncio.AbstractEventLoop) -> bool:
+    """Check whether the calling thread is running ``loop``."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def _enqueue_threadsafe(
+    container: "LoggingContainer",
+    worker: Any,
+    loop: asyncio.AbstractEventLoop,
+    logger: Any,
+    method_name: str,
+    event_dict: Dict[str, Any],
+) -> None:
+    """Hand an event logged outside the worker's loop over to the worker.
+
+    Always raises ``DropEvent``, either after queuing the event or after
+    recording why it was dropped.
+    """
+    if loop.is_closed() or not loop.is_running():
+        raise _drop(container, "no_loop")
+
+    rate = worker.sampling_rate
+    sampled = worker.overflow_strategy in ("sample", "adaptive")
+    if sampled and rate < 1.0 and rnd.random() > rate:
+        raise _drop(container, "sampled")
+    if _shed(worker, method_name, event_dict):
+        raise _drop(container, "shed")
+
+    if not _spilled(worker, event_dict) and not _put_threadsafe(
+        container, worker, event_dict
+    ):
+        raise _drop(container, "overflow")
+    _record_volume(container, logger, method_name, event_dict)
+    raise structlog.DropEvent
+
+
 def create_queue_sink(container: "LoggingContainer") -> Any:
     """Create a queue sink processor for structlog with explicit container.
 
@@ -64,7 +175,15 @@ def create_queue_sink(container: "LoggingContainer") -> Any:
         # Check if we're shutting down first
         if worker._stopping:
             # Drop events during shutdown
-            raise structlog.DropEvent
+            raise _drop(container, "shutdown")
+
+        # Events from other threads (sync endpoints in the threadpool,
+        # run_in_executor, background threads) take the thread-safe handoff
+        owner = getattr(worker, "_loop", None)
+        if isinstance(owner, asyncio.AbstractEventLoop) and not _running_on(owner):
+            _enqueue_threadsafe(
+                container, worker, owner, logger, method_name, event_dict
+            )
 
         # Start the worker if it's not running (but be more careful)
         if not worker._running and not worker._stopping:
@@ -77,40 +196,52 @@ def create_queue_sink(container: "LoggingContainer") -> Any:
                         loop.create_task(worker.start())
                     else:
                         # Event loop is closed, drop the event
-                        raise structlog.DropEvent
+                        raise _drop(container, "no_loop")
                 except RuntimeError:
                     # No running loop - drop the event rather than fall back
                     # This prevents structured data from reaching the logger
-                    raise structlog.DropEvent from None
+                    raise _drop(container, "no_loop") from None
             except Exception:
                 # Any other exception during startup - drop the event
-                raise structlog.DropEvent from None
+                raise _drop(container, "no_loop") from None
+
+        # Past the spill watermark events go to disk, whatever the strategy
+        if _spilled(worker, event_dict):
+            _record_volume(container, logger, method_name, event_dict)
+            raise structlog.DropEvent
 
         # Handle different overflow strategies
         if worker.overflow_strategy == "drop":
             # Drop strategy: try to enqueue, drop if full
             try:
                 worker.queue.put_nowait(event_dict)
+                _record_volume(container, logger, method_name, event_dict)
                 raise structlog.DropEvent
             except asyncio.QueueFull:
-                raise structlog.DropEvent from None
+                raise _drop(container, "overflow") from None
         elif worker.overflow_strategy == "block":
-            # Block strategy: not supported in sync context, drop instead
+            # Block strategy: this thread runs the worker's loop, so waiting
+            # here would stall the consumer that frees space; drop instead.
+            # Callers on other threads block in _enqueue_threadsafe.
             try:
                 worker.queue.put_nowait(event_dict)
+                _record_volume(container, logger, method_name, event_dict)
                 raise structlog.DropEvent
             except asyncio.QueueFull:
-                raise structlog.DropEvent from None
-        else:  # "sample"
-            # Sample strategy: apply sampling and try to enqueue
+                raise _drop(container, "overflow") from None
+        else:  # "sample" or "adaptive"
+            # Sample strategies: apply sampling and try to enqueue
             rate = worker.sampling_rate
             if rate < 1.0 and rnd.random() > rate:
-                raise structlog.DropEvent
+                raise _drop(container, "sampled")
+            if _shed(worker, method_name, event_dict):
+                raise _drop(container, "shed")
             try:
                 worker.queue.put_nowait(event_dict)
+                _record_volume(container, logger, method_name, event_dict)
                 raise structlog.DropEvent
             except asyncio.QueueFull:
-                raise structlog.DropEvent from None
+                raise _drop(container, "overflow") from None
 
     return queue_sink
 
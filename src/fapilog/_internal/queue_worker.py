@@ -7,16 +7,28 @@ strategies.
 
 import asyncio
 import logging
+import os
 import random as rnd
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Sequence, Union
 
+from ..enrichers import _registered_async_enrichers, run_async_enrichers
 from ..sinks import Sink
+from .adaptive_batcher import AdaptiveBatcher
+from .circuit_breaker import CLOSED, CircuitBreaker
+from .drop_ledger import DropLedger
 from .error_handling import (
     handle_queue_error,
     log_error_with_context,
     retry_with_backoff_async,
 )
+from .lane_queue import LaneQueue
+from .load_shedder import LoadShedder
+from .processor_metrics import estimate_event_size
+from .ring_buffer import RingBuffer
+from .sink_queue import SinkOverflow, SinkQueue
+from .spill_store import SpillStore
 
 if TYPE_CHECKING:
     from ..container import LoggingContainer
@@ -24,6 +36,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _sink_label(sink: Any) -> str:
+    """Name used to label per-sink metrics."""
+    name = getattr(sink, "_sink_name", None)
+    return name if isinstance(name, str) else type(sink).__name__
+
+
 class QueueWorker:
     """Background worker that processes log events from the queue."""
 
@@ -35,15 +53,33 @@ class QueueWorker:
         batch_timeout: float = 1.0,
         retry_delay: float = 1.0,
         max_retries: int = 3,
-        overflow_strategy: Literal["drop", "block", "sample"] = "drop",
+        overflow_strategy: Literal["drop", "block", "sample", "adaptive"] = "drop",
         sampling_rate: float = 1.0,
         container: Optional["LoggingContainer"] = None,
+        enricher_timeout: float = 0.5,
+        drop_summary_interval: float = 60.0,
+        sink_queue_size: int = 0,
+        sink_queue_overflow: SinkOverflow = "drop",
+        circuit_breaker_threshold: int = 0,
+        circuit_breaker_reset_timeout: float = 30.0,
+        spill_dir: Optional[str] = None,
+        spill_watermark: float = 0.8,
+        spill_max_bytes: int = 256 * 1024 * 1024,
+        spill_replay_rate: float = 1000.0,
+        queue_priority_size: int = 0,
+        block_timeout: float = 1.0,
+        adaptive_batching: bool = False,
+        min_batch_size: int = 1,
+        max_batch_size: int = 1000,
+        min_flush_timeout: float = 0.0,
+        max_flush_timeout: float = 0.05,
+        queue_max_bytes: int = 0,
     ) -> None:
         """Initialize the queue worker.
 
         Args:
             sinks: List of sink instances to write to
-            queue_max_size: Maximum size of the internal queue
+            queue_max_size: Number of event slots in the ring buffer queue
             batch_size: Number of events to process in a batch
             batch_timeout: Maximum time to wait for batch completion
             retry_delay: Delay between retries on sink failures
@@ -51,22 +87,131 @@ class QueueWorker:
             overflow_strategy: Strategy for handling queue overflow
             sampling_rate: Sampling rate for log messages (0.0 to 1.0)
             container: Optional LoggingContainer for metrics collection
+            enricher_timeout: Per-batch deadline for async batch enrichers
+            drop_summary_interval: Seconds between summary events reporting
+                dropped events from the container's drop ledger (0 disables)
+            sink_queue_size: If positive, give each sink its own queue of
+                this many events with its own consumer task and retries;
+                0 writes every event to all sinks together
+            sink_queue_overflow: Default policy when a sink's queue is full;
+                a sink's ``queue_overflow`` attribute overrides it
+            circuit_breaker_threshold: Consecutive failures after which a
+                sink's circuit breaker opens and its writes fail fast
+                (0 disables the breakers)
+            circuit_breaker_reset_timeout: Seconds an open breaker waits
+                before letting a single probe write through
+            spill_dir: If set, directory of the disk spill stores that take
+                events once the queue (and each sink queue) reaches the
+                spill watermark; events left there by a previous process are
+                recovered and replayed
+            spill_watermark: Fraction of a queue's size at which new events
+                spill to disk
+            spill_max_bytes: Unreplayed bytes each spill store may hold
+            spill_replay_rate: Maximum events per second replayed from each
+                spill store (0 for no limit)
+            queue_priority_size: If positive, ERROR and CRITICAL events get a
+                separate lane of this many slots that is drained first and
+                evicts low-priority events when full; 0 uses a single queue
+            block_timeout: Under the ``block`` strategy, maximum seconds a
+                caller on another thread waits for queue space before its
+                event is dropped (0 never waits)
+            adaptive_batching: If True, tune the batch size and flush
+                timeout from queue depth and sink time per event instead of
+                using ``batch_size``
+            min_batch_size: Smallest batch size for adaptive batching
+            max_batch_size: Largest batch size for adaptive batching
+            min_flush_timeout: Shortest time a partial batch waits for more
+                events under adaptive batching
+            max_flush_timeout: Longest time a partial batch waits for more
+                events under adaptive batching
+            queue_max_bytes: If positive, budget of estimated event bytes
+                the queue may hold; events that would exceed it overflow
         """
         self.sinks = sinks
-        self.queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
-            maxsize=queue_max_size
+        self.queue_max_bytes = queue_max_bytes
+        sizer = estimate_event_size if queue_max_bytes > 0 else None
+        self.queue: Union[RingBuffer, LaneQueue] = (
+            LaneQueue(
+                queue_max_size,
+                queue_priority_size,
+                on_evict=self._evicted,
+                max_bytes=queue_max_bytes,
+                sizer=sizer,
+            )
+            if queue_priority_size > 0
+            else RingBuffer(queue_max_size, queue_max_bytes, sizer)
+        )
+        # Per-level admission control for the adaptive overflow strategy
+        self.shedder: Optional[LoadShedder] = (
+            LoadShedder(self.queue, container=container)
+            if overflow_strategy == "adaptive"
+            else None
         )
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
+        self.batcher: Optional[AdaptiveBatcher] = (
+            AdaptiveBatcher(
+                min_batch_size,
+                max_batch_size,
+                min_flush_timeout,
+                max_flush_timeout,
+                initial_size=batch_size,
+                container=container,
+            )
+            if adaptive_batching
+            else None
+        )
         self.retry_delay = retry_delay
         self.max_retries = max_retries
         self.overflow_strategy = overflow_strategy
         self.sampling_rate = sampling_rate
+        self.block_timeout = block_timeout
         self._container = container
+        self.enricher_timeout = enricher_timeout
+        self.drop_summary_interval = drop_summary_interval
+        self._last_drop_summary = time.monotonic()
+        self.sink_queue_size = sink_queue_size
+        self.sink_queue_overflow = sink_queue_overflow
+        self._sink_queues: List[SinkQueue] = []
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_reset_timeout = circuit_breaker_reset_timeout
+        # Circuit breakers keyed by sink identity, created on first write
+        self._breakers: Dict[int, CircuitBreaker] = {}
+        self.spill_watermark = spill_watermark
+        self._spill_mark = max(1, int(queue_max_size * spill_watermark))
+        # Bytes in the queue at which events spill (0 without a byte budget)
+        self._spill_byte_mark = int(queue_max_bytes * spill_watermark)
+        self.spill: Optional[SpillStore] = None
+        self._sink_spills: List[Optional[SpillStore]] = []
+        if spill_dir:
+            directories = [os.path.join(spill_dir, "queue")]
+            if sink_queue_size > 0:
+                directories.extend(
+                    os.path.join(spill_dir, f"sink-{index}-{_sink_label(sink)}")
+                    for index, sink in enumerate(sinks)
+                )
+            stores = [
+                SpillStore(
+                    directory,
+                    max_bytes=spill_max_bytes,
+                    replay_rate=spill_replay_rate,
+                    container=container,
+                )
+                for directory in directories
+            ]
+            for store in stores:
+                # Recovers events spilled by a previous process
+                store.open()
+            self.spill, self._sink_spills = stores[0], list(stores[1:])
         self._task: Optional[asyncio.Task[None]] = None
         self._running = False
         self._stopping = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Batch activity, read by the event loop lag monitor for attribution
+        self.batches_started = 0
+        self.in_batch = False
+        # Queue capture stamps of the batch being collected, in batch order
+        self._batch_capture_times: List[float] = []
 
     async def start(self) -> None:
         """Start the queue worker."""
@@ -76,6 +221,10 @@ class QueueWorker:
         self._running = True
         self._stopping = False
         self._loop = asyncio.get_running_loop()
+        self.queue.bind(self._loop)
+        self._last_drop_summary = time.monotonic()
+        if self.sink_queue_size > 0:
+            self._start_sink_queues()
         self._task = asyncio.create_task(self._run())
         logger.debug("QueueWorker started")
 
@@ -108,13 +257,14 @@ class QueueWorker:
         # Wait for the worker task to complete
         if self._task is not None and not self._task.done():
             try:
-                # Cancel the task if it's still running
-                self._task.cancel()
-
                 # Only wait if we're on the same event loop
                 if self._loop and self._loop == asyncio.get_running_loop():
+                    # Let the worker finish its current batch and exit;
+                    # wait_for cancels it if it does not within the timeout
+                    self.queue.wake()
                     await asyncio.wait_for(self._task, timeout=5.0)
                 else:
+                    self._task.cancel()
                     # Different loop, just let it cancel naturally
                     try:
                         logger.debug("Different loop, allowing natural cancel")
@@ -131,6 +281,12 @@ class QueueWorker:
         # Drain any remaining events in the queue
         await self._drain_queue()
 
+        # Let each sink deliver its backlog
+        sink_queues, self._sink_queues = self._sink_queues, []
+        for sink_queue in sink_queues:
+            await sink_queue.close()
+        self._close_spill()
+
         try:
             logger.debug("QueueWorker shutdown completed")
         except Exception:
@@ -219,37 +375,170 @@ class QueueWorker:
                 except Exception:
                     pass  # Ignore logging errors during shutdown
 
+        sink_queues, self._sink_queues = self._sink_queues, []
+        for sink_queue in sink_queues:
+            sink_queue.cancel()
+
+        if self.spill is not None:
+            # Keep events the worker did not get to for the next process
+            for event in self.queue.drain(self.queue.qsize()):
+                if not self.spill.append(event):
+                    self._record_drop("shutdown")
+        self._close_spill()
+
         try:
             logger.debug("QueueWorker marked for shutdown")
         except Exception:
             pass  # Ignore logging errors during shutdown
 
+    def _start_sink_queues(self) -> None:
+        """Create and start one delivery queue per sink."""
+        if not self._sink_queues:
+            self._sink_queues = [
+                SinkQueue(
+                    sink,
+                    _sink_label(sink),
+                    maxsize=self.sink_queue_size,
+                    overflow=getattr(sink, "queue_overflow", None)
+                    or self.sink_queue_overflow,
+                    batch_size=self.batch_size,
+                    max_retries=self.max_retries,
+                    retry_delay=self.retry_delay,
+                    container=self._container,
+                    breaker=self._breaker(sink),
+                    spill=(
+                        self._sink_spills[index]
+                        if index < len(self._sink_spills)
+                        else None
+                    ),
+                    spill_watermark=self.spill_watermark,
+                )
+                for index, sink in enumerate(self.sinks)
+            ]
+        for sink_queue in self._sink_queues:
+            sink_queue.start()
+
+    def _close_spill(self) -> None:
+        """Close the spill stores, keeping unreplayed events on disk."""
+        for store in [self.spill, *self._sink_spills]:
+            if store is not None:
+                store.close()
+
+    def spill_event(self, event_dict: Dict[str, Any]) -> bool:
+        """Write an event to the spill store if the queue is backed up.
+
+        Events spill once the queue reaches the spill watermark, by event
+        count or, with a byte budget, by bytes, and keep spilling while
+        earlier spilled events wait to be replayed so the sinks receive
+        events in order. Safe to call from any thread.
+
+        Returns:
+            True if the event was spilled, False if it should be queued
+        """
+        spill = self.spill
+        if spill is None:
+            return False
+        if (
+            not spill.pending
+            and self.queue.qsize() < self._spill_mark
+            and (not self._spill_byte_mark or self.queue.bytes < self._spill_byte_mark)
+        ):
+            return False
+        return spill.append(event_dict)
+
+    def _delivery_paused(self) -> float:
+        """Seconds shared delivery waits for open circuit breakers.
+
+        With a spill store, the worker stops taking events off the queue
+        while any sink's breaker is open, so the backlog spills to disk
+        instead of being skipped for that sink. Sink queues pause on their
+        own, so this is always 0 when they are enabled.
+        """
+        if self.spill is None or self._sink_queues:
+            return 0.0
+        return max((b.retry_in() for b in self._breakers.values()), default=0.0)
+
+    async def _replay_spill(self) -> bool:
+        """Move spilled events back into the queue below the watermark.
+
+        Returns:
+            True if the worker should collect a batch now, False if it
+            slept instead (delivery paused or replay rate exhausted)
+        """
+        spill: SpillStore = self.spill  # type: ignore[assignment]
+        pause = self._delivery_paused()
+        if pause > 0:
+            await asyncio.sleep(min(pause, self.batch_timeout))
+            return False
+        if not spill.pending:
+            return True
+
+        # An event the queue refuses, e.g. over the byte budget, stays
+        # spilled and is replayed first next time
+        spill.replay(self._spill_mark - self.queue.qsize(), self._requeue)
+        if self.queue.empty():
+            await asyncio.sleep(max(spill.next_replay_in(), 0.001))
+            return False
+        return True
+
+    def _requeue(self, event: Dict[str, Any]) -> bool:
+        """Put a replayed event into the queue if it has room."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        return True
+
     async def _drain_queue(self) -> None:
         """Drain all remaining events from the queue and process them."""
-        drained_events = []
+        capture_times: List[float] = []
 
-        # Collect all remaining events from the queue
-        while not self.queue.empty():
-            try:
-                event = self.queue.get_nowait()
-                drained_events.append(event)
-            except asyncio.QueueEmpty:
-                break
+        # Collect all remaining events from the queue in one call
+        drained_events = self.queue.drain(self.queue.qsize(), capture_times)
+
+        if drained_events and self._delivery_paused() > 0:
+            # Sinks are down: keep the backlog on disk for the next start
+            for event in drained_events:
+                if not self.spill.append(event):  # type: ignore[union-attr]
+                    self._record_drop("shutdown")
+            drained_events = []
 
         # Process all drained events
         if drained_events:
             logger.debug(f"Draining {len(drained_events)} remaining events")
-            for event in drained_events:
-                await self._process_event(event)
+            drained_events = await self._enrich_batch(drained_events)
+            stamps: Sequence[Optional[float]] = capture_times
+            if len(stamps) != len(drained_events):
+                stamps = [None] * len(drained_events)
+            for event, captured_at in zip(drained_events, stamps):
+                await self._process_event(event, captured_at)
+
+        # Report drops since the last summary before the sinks go away
+        if self.drop_summary_interval > 0:
+            await self._emit_drop_summary()
 
     async def _run(self) -> None:
         """Main worker loop."""
         while self._running and not self._stopping:
             try:
                 # Process events in batches
-                batch = await self._collect_batch()
-                if batch:
-                    await self._process_batch(batch)
+                if self.spill is None or await self._replay_spill():
+                    batch = await self._collect_batch()
+                    if batch:
+                        started = time.perf_counter()
+                        await self._process_batch(batch, self._batch_capture_times)
+                        if self.batcher is not None:
+                            self.batcher.observe(
+                                len(batch),
+                                self.queue.qsize(),
+                                time.perf_counter() - started,
+                            )
+                if (
+                    self.drop_summary_interval > 0
+                    and time.monotonic() - self._last_drop_summary
+                    >= self.drop_summary_interval
+                ):
+                    await self._emit_drop_summary()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -266,59 +555,223 @@ class QueueWorker:
             await self._drain_queue()
 
     async def _collect_batch(self) -> List[Dict[str, Any]]:
-        """Collect a batch of events from the queue."""
+        """Collect a batch of events from the queue.
+
+        Waits up to ``batch_timeout`` for the first event, then drains up to
+        ``batch_size`` buffered events in one call. Under adaptive batching
+        the batcher sets the size, and a partial batch first waits up to its
+        flush timeout for the queue to fill it.
+        """
         start_time = time.time()
         metrics = self._container.get_metrics_collector() if self._container else None
-        batch = []
+        capture_times: List[float] = []
+        self._batch_capture_times = capture_times
+
+        if not await self.queue.wait(self.batch_timeout):
+            return []
+
+        # While a breaker is not closed, send one event as its probe
+        batcher = self.batcher
+        limit = self.batch_size if batcher is None else batcher.size
+        if self.spill is not None and not self._sink_queues:
+            if any(b.state != CLOSED for b in self._breakers.values()):
+                limit = 1
+        if (
+            batcher is not None
+            and batcher.flush_timeout > 0
+            and self.queue.qsize() < limit
+            and not self._stopping
+        ):
+            # Woken as soon as the batch is full, not after the whole timeout
+            await self.queue.wait(batcher.flush_timeout, count=limit)
+        batch = self.queue.drain(limit, capture_times)
+        if self.shedder is not None:
+            self.shedder.record_drained(len(batch))
+        if metrics and self.queue_max_bytes > 0:
+            metrics.record_queue_bytes(self.queue.bytes)
+        if metrics and batch:
+            dequeue_latency_ms = (time.time() - start_time) * 1000
+            metrics.record_dequeue(dequeue_latency_ms, count=len(batch))
+            now = time.perf_counter()
+            for captured_at in capture_times:
+                metrics.record_queue_dwell((now - captured_at) * 1000)
+        return batch
 
-        # Get the first event (blocking)
-        try:
-            first_event = await asyncio.wait_for(
-                self.queue.get(), timeout=self.batch_timeout
+    def _breaker(self, sink: Any) -> Optional[CircuitBreaker]:
+        """The sink's circuit breaker, or None if breakers are disabled."""
+        if self.circuit_breaker_threshold <= 0:
+            return None
+        breaker = self._breakers.get(id(sink))
+        if breaker is None:
+            breaker = self._breakers[id(sink)] = CircuitBreaker(
+                _sink_label(sink),
+                failure_threshold=self.circuit_breaker_threshold,
+                reset_timeout=self.circuit_breaker_reset_timeout,
+                container=self._container,
             )
-            batch.append(first_event)
-            if metrics:
-                dequeue_latency_ms = (time.time() - start_time) * 1000
-                metrics.record_dequeue(dequeue_latency_ms)
-        except asyncio.TimeoutError:
-            return batch
+        return breaker
+
+    def _drop_ledger(self) -> Optional[DropLedger]:
+        """The container's drop ledger, if there is one."""
+        if self._container is None:
+            return None
+        ledger = self._container.get_drop_ledger()
+        return ledger if isinstance(ledger, DropLedger) else None
+
+    def _record_drop(self, reason: str) -> None:
+        """Record an event dropped by this worker."""
+        ledger = self._drop_ledger()
+        if ledger is not None:
+            ledger.record(reason)
+
+    def _evicted(self, event: Dict[str, Any]) -> None:
+        """Record a low-priority event evicted for an ERROR/CRITICAL event."""
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_dropped_event()
+        self._record_drop("evicted")
 
-        # Try to get more events (non-blocking)
-        while len(batch) < self.batch_size:
-            try:
-                dequeue_start = time.time()
-                event = self.queue.get_nowait()
-                batch.append(event)
-                if metrics:
-                    dequeue_latency_ms = (time.time() - dequeue_start) * 1000
-                    metrics.record_dequeue(dequeue_latency_ms)
-            except asyncio.QueueEmpty:
-                break
+    async def _emit_drop_summary(self) -> None:
+        """Write a summary of events dropped since the last one to the sinks.
 
-        return batch
+        The summary bypasses the queue so it cannot itself be dropped. Nothing
+        is written when no events were dropped.
+        """
+        now = time.monotonic()
+        interval = now - self._last_drop_summary
+        self._last_drop_summary = now
+
+        ledger = self._drop_ledger()
+        if ledger is None:
+            return
+        dropped = ledger.take_summary()
+        if not dropped:
+            return
+
+        event = {
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "level": "warning",
+            "event": "Log events dropped",
+            "dropped": dropped,
+            "dropped_total": sum(dropped.values()),
+            "interval_seconds": round(interval, 3),
+        }
+        try:
+            await self._process_event(event)
+        except Exception as e:
+            logger.warning(f"Failed to write drop summary: {e}")
+
+    async def _process_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        capture_times: Optional[Sequence[Optional[float]]] = None,
+    ) -> None:
+        """Process a batch of events.
 
-    async def _process_batch(self, batch: List[Dict[str, Any]]) -> None:
-        """Process a batch of events."""
+        Args:
+            batch: Events in dequeue order
+            capture_times: Optional queue capture stamps, one per event, used
+                for per-sink dwell and end-to-end latency
+        """
         start_time = time.time()
         metrics = self._container.get_metrics_collector() if self._container else None
+        self.batches_started += 1
+        self.in_batch = True
 
-        for event in batch:
-            await self._process_event(event)
+        try:
+            batch = await self._enrich_batch(batch)
+            if capture_times is None or len(capture_times) != len(batch):
+                capture_times = [None] * len(batch)
+
+            for event, captured_at in zip(batch, capture_times):
+                await self._process_event(event, captured_at)
+        finally:
+            self.in_batch = False
 
         if metrics:
             processing_time_ms = (time.time() - start_time) * 1000
             metrics.record_batch_processing(processing_time_ms)
 
-    async def _process_event(self, event: Dict[str, Any]) -> None:
-        """Process a single event with retry logic."""
+    async def _enrich_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run registered async batch enrichers over a batch before the sinks.
+
+        Enrichment failures never block delivery: on any error the batch is
+        written as it stands.
+        """
+        if not _registered_async_enrichers:
+            return batch
+
+        cache = None
+        health_monitor = None
+        error_handler = None
+        if self._container is not None:
+            cache = self._container.get_async_smart_cache()
+            health_monitor = self._container.get_enricher_health_monitor()
+            error_handler = self._container.get_enricher_error_handler()
+
+        try:
+            return await run_async_enrichers(
+                batch,
+                cache=cache,
+                timeout=self.enricher_timeout,
+                health_monitor=health_monitor,
+                error_handler=error_handler,
+            )
+        except Exception as e:
+            logger.warning(f"Async batch enrichment failed: {e}")
+            return batch
+
+    async def _process_event(
+        self, event: Dict[str, Any], captured_at: Optional[float] = None
+    ) -> None:
+        """Process a single event with retry logic.
+
+        Args:
+            event: The event to write to every sink
+            captured_at: Optional ``perf_counter`` stamp taken when the event
+                was put on the queue
+        """
         start_time = time.time()
         metrics = self._container.get_metrics_collector() if self._container else None
 
+        if self._sink_queues:
+            # Each sink's queue handles delivery and retries independently
+            for sink_queue in self._sink_queues:
+                sink_queue.offer(event, captured_at)
+            if metrics:
+                metrics.record_log_event((time.time() - start_time) * 1000)
+            return
+
+        async def write_with_latency(sink: Sink) -> None:
+            """Write to one sink, recording its dwell and end-to-end time."""
+            breaker = self._breaker(sink)
+            if breaker is not None and not breaker.allow():
+                # Open circuit: skip the sink instead of failing the event
+                if metrics:
+                    metrics.record_sink_dropped(_sink_label(sink))
+                self._record_drop("circuit_open")
+                return
+            write_start = time.perf_counter()
+            try:
+                await sink.write(event)
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            if metrics and captured_at is not None:
+                metrics.record_sink_delivery(
+                    _sink_label(sink),
+                    dwell_ms=(write_start - captured_at) * 1000,
+                    end_to_end_ms=(time.perf_counter() - captured_at) * 1000,
+                )
+
         async def process_event_with_sinks() -> None:
             """Process event by writing to all sinks."""
             # Write to all sinks
             results = await asyncio.gather(
-                *[sink.write(event) for sink in self.sinks],
+                *[write_with_latency(sink) for sink in self.sinks],
                 return_exceptions=True,
             )
 
@@ -386,14 +839,25 @@ class QueueWorker:
         metrics = self._container.get_metrics_collector() if self._container else None
 
         if self._stopping:
+            self._record_drop("shutdown")
             return False
 
         # Apply sampling if enabled
         if self.sampling_rate < 1.0 and rnd.random() > self.sampling_rate:
             if metrics:
                 metrics.record_sampled_event()
+            self._record_drop("sampled")
             return False
 
+        if self.shedder is not None and not self.shedder.admit(event_dict.get("level")):
+            if metrics:
+                metrics.record_sampled_event()
+            self._record_drop("shed")
+            return False
+
+        if self.spill_event(event_dict):
+            return True
+
         try:
             if self.overflow_strategy == "drop":
                 # Drop strategy: try to enqueue, drop if full
@@ -407,6 +871,7 @@ class QueueWorker:
                 except asyncio.QueueFull:
                     if metrics:
                         metrics.record_dropped_event()
+                    self._record_drop("overflow")
                     return False
             elif self.overflow_strategy == "block":
                 # Block strategy: wait until space is available
@@ -419,8 +884,8 @@ class QueueWorker:
                     return True
                 except asyncio.CancelledError:
                     return False
-            else:  # "sample"
-                # Sample strategy: use sampling rate for overflow
+            else:  # "sample" or "adaptive"
+                # Sample strategies: already sampled above, drop if full
                 try:
                     self.queue.put_nowait(event_dict)
                     if metrics:
@@ -431,6 +896,7 @@ class QueueWorker:
                 except asyncio.QueueFull:
                     if metrics:
                         metrics.record_dropped_event()
+                    self._record_drop("overflow")
                     return False
         except Exception as e:
             # Unexpected error during enqueue
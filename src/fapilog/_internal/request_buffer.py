@@ -0,0 +1,111 @@
+"""Tail-based per-request log buffering.
+
+While a request is in flight, DEBUG and INFO events are held in a bounded
+per-request buffer instead of being handed to the queue or renderer.
+``TraceIDMiddleware`` flushes the buffer when the request fails, returns a
+5xx status or is slow, and otherwise discards it, so full detail is kept
+only for the requests worth investigating.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+import structlog
+
+from .context import get_request_buffer
+
+# Only events at or below INFO are buffered; warnings and errors pass through
+_BUFFERED_LEVELS = frozenset({"debug", "info"})
+
+_Replay = Callable[[Any, str, Dict[str, Any]], None]
+
+
+class RequestLogBuffer:
+    """Bounded buffer of events emitted during a single request.
+
+    When full, the oldest events are evicted and counted in ``evicted``.
+    """
+
+    def __init__(self, max_events: int) -> None:
+        """Initialize the buffer.
+
+        Args:
+            max_events: Maximum number of events held for the request
+        """
+        self._events: Deque[Tuple[_Replay, Any, str, Dict[str, Any]]] = deque(
+            maxlen=max_events
+        )
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(
+        self, replay: _Replay, logger: Any, method_name: str, event_dict: Dict[str, Any]
+    ) -> None:
+        """Hold an event until the request outcome is known."""
+        if len(self._events) == self._events.maxlen:
+            self.evicted += 1
+        self._events.append((replay, logger, method_name, event_dict))
+
+    def flush(self) -> int:
+        """Emit all held events in order and return how many were emitted."""
+        count = 0
+        while self._events:
+            replay, logger, method_name, event_dict = self._events.popleft()
+            replay(logger, method_name, event_dict)
+            count += 1
+        return count
+
+    def discard(self) -> int:
+        """Drop all held events and return how many were lost in total."""
+        count = len(self._events) + self.evicted
+        self._events.clear()
+        self.evicted = 0
+        return count
+
+
+class RequestBufferProcessor:
+    """Processor that diverts DEBUG/INFO events into the request buffer.
+
+    It sits just before the final queue sink or renderer; buffered events are
+    replayed through those remaining processors when the buffer is flushed.
+    """
+
+    def __init__(self, downstream: List[Callable[..., Any]]) -> None:
+        """Initialize the processor.
+
+        Args:
+            downstream: Processors that follow this one in the chain
+        """
+        self.downstream = downstream
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        buffer = get_request_buffer()
+        if buffer is None or method_name not in _BUFFERED_LEVELS:
+            return event_dict
+        buffer.add(self._replay, logger, method_name, event_dict)
+        raise structlog.DropEvent
+
+    def _replay(
+        self, logger: Any, method_name: str, event_dict: Dict[str, Any]
+    ) -> None:
+        """Run a buffered event through the downstream processors and emit it."""
+        result: Any = event_dict
+        try:
+            for processor in self.downstream:
+                result = processor(logger, method_name, result)
+        except structlog.DropEvent:
+            # The queue sink enqueues and then drops the event
+            return
+
+        emit = getattr(logger, method_name)
+        if isinstance(result, tuple):
+            args, kwargs = result
+            emit(*args, **kwargs)
+        elif isinstance(result, dict):
+            emit(**result)
+        else:
+            emit(result)
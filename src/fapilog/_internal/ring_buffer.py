@@ -0,0 +1,424 @@
+"""Bounded ring buffer used as the queue between the log pipeline and sinks.
+
+The buffer replaces ``asyncio.Queue`` on the logging hot path. Slots are
+preallocated, so ``put_nowait`` is an index computation and two list
+stores. The single consumer parks on one future that producers resolve only
+when the buffer reaches the number of events it waits for (by default the
+empty-to-non-empty transition), and ``drain(n)`` hands out a whole batch
+per call instead of one ``get`` per event.
+
+Like ``asyncio.Queue``, the slot operations must run on the event loop that
+owns the buffer. Other threads hand events off with ``put_threadsafe``: they
+append to a small lock-guarded pending list, and the first event of a burst
+schedules one ``call_soon_threadsafe`` transfer into the slots on the owner
+loop. A thread may instead wait, up to a deadline, on a condition that
+``drain`` notifies when it frees slots.
+
+Given a ``sizer``, the buffer also keeps a running total of the estimated
+bytes it holds, and with ``max_bytes`` refuses events that would take the
+total past that budget.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RingBuffer:
+    """Bounded FIFO of events with a single consumer.
+
+    Each slot stores the ``perf_counter`` time its event was put, so the
+    consumer can measure queue dwell time. ``last_captured_at`` and
+    ``last_dwell_ms`` describe the most recently dequeued event.
+
+    The ``put_nowait``/``get_nowait``/``put``/``get``/``qsize``/``empty``/
+    ``full`` methods follow ``asyncio.Queue`` semantics, including raising
+    ``asyncio.QueueFull`` and ``asyncio.QueueEmpty``.
+
+    Under a byte budget, an event is always accepted into an empty buffer,
+    so a single event larger than ``max_bytes`` is not refused forever.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_bytes: int = 0,
+        sizer: Optional[Callable[[Any], int]] = None,
+        over_budget: Optional[Callable[[int], bool]] = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            maxsize: Number of event slots to preallocate
+            max_bytes: Budget of estimated bytes the buffer may hold
+                (0 for no limit); requires ``sizer``
+            sizer: Optional function estimating an event's size in bytes,
+                called once per event; enables ``bytes``
+            over_budget: Optional check, given an event's size, of a byte
+                budget shared with other buffers; replaces ``max_bytes``
+                and requires ``sizer``
+        """
+        if over_budget is not None and sizer is None:
+            raise ValueError("RingBuffer over_budget requires a sizer")
+        if maxsize < 1:
+            raise ValueError("RingBuffer maxsize must be at least 1")
+        if max_bytes and sizer is None:
+            raise ValueError("RingBuffer max_bytes requires a sizer")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._shared_budget = over_budget
+        self._items: List[Any] = [None] * maxsize
+        self._stamps: List[float] = [0.0] * maxsize
+        # Estimated size of each slot's event, when sizing is enabled
+        self._sizes: Optional[List[int]] = [0] * maxsize if sizer is not None else None
+        self._bytes = 0  # Bytes in the slots (owner loop only)
+        self._pending_bytes = 0  # Bytes in pending handoffs (under the lock)
+        self._head = 0  # Slot of the oldest event
+        self._count = 0
+        # Parked consumer, resolved once the buffer holds _wait_for events
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._wait_for = 1
+        # Producers blocked in put() waiting for a free slot
+        self._putters: Deque[asyncio.Future[None]] = deque()
+        self.last_captured_at = 0.0
+        self.last_dwell_ms = 0.0
+        # Cross-thread handoff: (stamp, event, size) awaiting transfer
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Deque[Tuple[float, Any, int]] = deque()
+        self._pending_lock = threading.Lock()
+        self._transfer_scheduled = False
+        # Threads blocked in put_threadsafe waiting for a free slot
+        self._space = threading.Condition(self._pending_lock)
+        self._blocked = 0
+
+    def qsize(self) -> int:
+        """Number of events in the buffer, including pending handoffs."""
+        return self._count + len(self._pending)
+
+    def empty(self) -> bool:
+        """Return True if the buffer holds no events."""
+        return self._count == 0 and not self._pending
+
+    def full(self) -> bool:
+        """Return True if every slot is in use."""
+        return self._count >= self.maxsize
+
+    @property
+    def bytes(self) -> int:
+        """Estimated bytes of the buffered events (0 without a sizer)."""
+        return self._bytes + self._pending_bytes
+
+    def size_of(self, item: Any) -> int:
+        """Estimated size of an event in bytes (0 without a sizer)."""
+        return self._sizer(item) if self._sizer is not None else 0
+
+    def _over_budget(self, size: int) -> bool:
+        """Check whether ``size`` more bytes would exceed the byte budget."""
+        if self._shared_budget is not None:
+            return self._shared_budget(size)
+        return (
+            self.max_bytes > 0
+            and not self.empty()
+            and self._bytes + self._pending_bytes + size > self.max_bytes
+        )
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Set the event loop that owns the buffer.
+
+        Events handed off with ``put_threadsafe`` are moved into the slots on
+        this loop.
+        """
+        self._loop = loop
+        with self._pending_lock:
+            if not self._pending or self._transfer_scheduled:
+                return
+            self._transfer_scheduled = True
+        self._schedule_transfer()
+
+    def put_threadsafe(
+        self,
+        item: Any,
+        limit: Optional[int] = None,
+        timeout: float = 0.0,
+        size: Optional[int] = None,
+    ) -> bool:
+        """Append an event from any thread.
+
+        Must not be called with a ``timeout`` on the owner loop's thread:
+        only that loop can free slots.
+
+        Args:
+            item: The event to append
+            limit: Optional number of buffered events, below ``maxsize``, at
+                which the event is refused
+            timeout: Maximum seconds to block waiting for a free slot
+                (0 never blocks)
+            size: The event's size if already estimated
+
+        Returns:
+            True if the event was accepted, False if the buffer stayed full
+            or has no running owner loop
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return False
+        capacity = self.maxsize if limit is None else min(limit, self.maxsize)
+        if size is None:
+            size = self.size_of(item)
+        with self._pending_lock:
+            if self._no_room(capacity, size) and (
+                timeout <= 0 or not self._wait_for_space(capacity, size, timeout)
+            ):
+                return False
+            self._pending.append((time.perf_counter(), item, size))
+            self._pending_bytes += size
+            if self._transfer_scheduled:
+                return True
+            self._transfer_scheduled = True
+        if not self._schedule_transfer():
+            with self._pending_lock:
+                if self._pending:
+                    self._pending_bytes -= self._pending.pop()[2]
+            return False
+        return True
+
+    def _no_room(self, capacity: int, size: int) -> bool:
+        """Check whether an event of ``size`` bytes must wait (lock held)."""
+        return self._count + len(self._pending) >= capacity or self._over_budget(size)
+
+    def _wait_for_space(self, capacity: int, size: int, timeout: float) -> bool:
+        """Wait until an event of ``size`` bytes fits (lock held)."""
+        deadline = time.monotonic() + timeout
+        self._blocked += 1
+        try:
+            while self._no_room(capacity, size):
+                remaining = deadline - time.monotonic()
+                loop = self._loop
+                if remaining <= 0 or loop is None or loop.is_closed():
+                    return False
+                # drain() updates the count without the lock, so a
+                # notification can be missed; wake periodically to recheck
+                self._space.wait(min(remaining, 0.05))
+            return True
+        finally:
+            self._blocked -= 1
+
+    def _schedule_transfer(self) -> bool:
+        """Ask the owner loop to move pending events into the slots."""
+        try:
+            self._loop.call_soon_threadsafe(self._transfer)  # type: ignore[union-attr]
+            return True
+        except RuntimeError:
+            # Owner loop is closed
+            with self._pending_lock:
+                self._transfer_scheduled = False
+            return False
+
+    def _transfer(self) -> None:
+        """Move pending handoffs into free slots (runs on the owner loop)."""
+        with self._pending_lock:
+            self._transfer_scheduled = False
+            moved = min(self.maxsize - self._count, len(self._pending))
+            entries = [self._pending.popleft() for _ in range(moved)]
+            moved_bytes = sum(entry[2] for entry in entries)
+            self._pending_bytes -= moved_bytes
+            # Counted in the slots before the lock is released
+            self._bytes += moved_bytes
+        if not entries:
+            return
+
+        sizes = self._sizes
+        index = self._head + self._count
+        for stamp, item, size in entries:
+            if index >= self.maxsize:
+                index -= self.maxsize
+            self._items[index] = item
+            self._stamps[index] = stamp
+            if sizes is not None:
+                sizes[index] = size
+            index += 1
+        self._count += len(entries)
+        if self._waiter is not None and self._count >= self._wait_for:
+            _resolve(self._waiter)
+
+    def put_nowait(self, item: Any, size: Optional[int] = None) -> None:
+        """Append an event without blocking.
+
+        Args:
+            item: The event to append
+            size: The event's size if already estimated
+
+        Raises:
+            asyncio.QueueFull: If every slot is in use or the event would
+                exceed the byte budget
+        """
+        count = self._count
+        if count >= self.maxsize:
+            raise asyncio.QueueFull
+        index = self._head + count
+        if index >= self.maxsize:
+            index -= self.maxsize
+        sizes = self._sizes
+        if sizes is not None:
+            if size is None:
+                size = self._sizer(item)  # type: ignore[misc]
+            if self._over_budget(size):
+                raise asyncio.QueueFull
+            sizes[index] = size
+            self._bytes += size
+        self._items[index] = item
+        self._stamps[index] = time.perf_counter()
+        self._count = count + 1
+        if self._waiter is not None and count + 1 >= self._wait_for:
+            _resolve(self._waiter)
+
+    async def put(self, item: Any) -> None:
+        """Append an event, waiting for a free slot if the buffer is full."""
+        size = self.size_of(item)
+        while self._count >= self.maxsize or self._over_budget(size):
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                if putter in self._putters:
+                    self._putters.remove(putter)
+                # Pass a freed slot on to the next blocked producer
+                if self._count < self.maxsize:
+                    self._wake_putters(1)
+                raise
+        self.put_nowait(item, size)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest event.
+
+        Raises:
+            asyncio.QueueEmpty: If the buffer is empty
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        return self.drain(1)[0]
+
+    async def get(self) -> Any:
+        """Remove and return the oldest event, waiting until one arrives."""
+        while self._count == 0:
+            await self.wait()
+        return self.get_nowait()
+
+    def drain(
+        self, max_items: int, capture_times: Optional[List[float]] = None
+    ) -> List[Any]:
+        """Remove and return up to ``max_items`` of the oldest events.
+
+        Args:
+            max_items: Maximum number of events to return
+            capture_times: Optional list extended with the ``perf_counter``
+                stamp of each returned event, in the same order
+
+        Returns:
+            The events in FIFO order; empty if the buffer is empty
+        """
+        if self._pending:
+            self._transfer()
+        taken = min(max_items, self._count)
+        if taken <= 0:
+            return []
+
+        items = self._items
+        stamps = self._stamps
+        maxsize = self.maxsize
+        head = self._head
+        end = head + taken
+        sizes = self._sizes
+        if end <= maxsize:
+            batch = items[head:end]
+            batch_stamps = stamps[head:end]
+            items[head:end] = [None] * taken
+            if sizes is not None:
+                self._bytes -= sum(sizes[head:end])
+        else:
+            # The batch wraps around the end of the slot array
+            wrapped = end - maxsize
+            batch = items[head:] + items[:wrapped]
+            batch_stamps = stamps[head:] + stamps[:wrapped]
+            items[head:] = [None] * (maxsize - head)
+            items[:wrapped] = [None] * wrapped
+            if sizes is not None:
+                self._bytes -= sum(sizes[head:]) + sum(sizes[:wrapped])
+            end = wrapped
+
+        self._head = end if end < maxsize else 0
+        self._count -= taken
+        self.last_captured_at = batch_stamps[-1]
+        self.last_dwell_ms = (time.perf_counter() - batch_stamps[-1]) * 1000
+        if capture_times is not None:
+            capture_times.extend(batch_stamps)
+        if self._pending:
+            self._transfer()
+        if self._putters:
+            self._wake_putters(taken)
+        if self._blocked:
+            with self._space:
+                self._space.notify(taken)
+        return batch
+
+    async def wait(self, timeout: Optional[float] = None, count: int = 1) -> bool:
+        """Wait until the buffer holds at least ``count`` events.
+
+        Returns immediately, without allocating, when enough events are
+        already buffered. The consumer is woken once, when the count is
+        reached, rather than for every event.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            count: Number of events to wait for (at most ``maxsize``)
+
+        Returns:
+            True if ``count`` events are available, False if the timeout
+            expired or ``wake`` was called first
+        """
+        count = min(max(count, 1), self.maxsize)
+        if self._count >= count:
+            return True
+        if self._pending:
+            self._transfer()
+            if self._count >= count:
+                return True
+
+        loop = asyncio.get_running_loop()
+        waiter = self._waiter = loop.create_future()
+        self._wait_for = count
+        handle = (
+            loop.call_later(timeout, _resolve, waiter) if timeout is not None else None
+        )
+        try:
+            await waiter
+        finally:
+            if handle is not None:
+                handle.cancel()
+            if self._waiter is waiter:
+                self._waiter = None
+                self._wait_for = 1
+        return self._count >= count
+
+    def wake(self) -> None:
+        """Wake the parked consumer even though no event arrived."""
+        if self._waiter is not None:
+            _resolve(self._waiter)
+
+    def _wake_putters(self, slots: int) -> None:
+        """Wake up to ``slots`` producers blocked in ``put``."""
+        while slots and self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                slots -= 1
@@ -0,0 +1,273 @@
+"""Route-level log policies for request-scoped log suppression and sampling.
+
+A policy table is compiled once from ``pattern -> spec`` pairs and matched
+once per request by ``TraceIDMiddleware``. The resulting ``LogDecision`` is
+stored on the request context so the pipeline's ``route_policy_processor``
+can drop events with a single context variable lookup.
+"""
+
+import contextvars
+import random
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Tuple
+
+import structlog
+
+from ..exceptions import ConfigurationError
+
+# Numeric severities for structlog method names
+LEVEL_NUMBERS: Dict[str, int] = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "warn": 30,
+    "error": 40,
+    "exception": 40,
+    "critical": 50,
+    "fatal": 50,
+}
+
+# Events at or above this severity are never suppressed or sampled out
+_ERROR_LEVEL = LEVEL_NUMBERS["error"]
+
+# Per-request decision made by the middleware
+log_decision_ctx: contextvars.ContextVar[Optional["LogDecision"]] = (
+    contextvars.ContextVar("log_decision", default=None)
+)
+
+_TEMPLATE_PARAM = re.compile(r"\{([^{}:]+)(?::([^{}]+))?\}")
+
+
+def _validate_level(level: str, pattern: str) -> str:
+    """Normalise a level name, raising ConfigurationError if unknown."""
+    name = level.strip().lower()
+    if name not in LEVEL_NUMBERS:
+        raise ConfigurationError(
+            f"Invalid level '{level}' in route log policy for '{pattern}'",
+            "route_log_policies",
+            level,
+            "one of debug, info, warning, error, critical",
+        )
+    return name
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """Log policy applied to requests whose path matches ``pattern``.
+
+    Patterns are matched as follows:
+    - ``/health`` matches the path exactly
+    - ``/internal/*`` matches any path starting with ``/internal/``
+    - ``/items/{item_id}`` matches a route template; ``{name:path}``
+      matches across path segments
+
+    Attributes:
+        pattern: Path, prefix or route template to match
+        suppress: Drop the access log and in-request events
+        sample_rate: Fraction of matching requests whose logs are kept
+        min_level: Minimum level for events emitted within the request
+        access_level: Level the access log is emitted at
+    """
+
+    pattern: str
+    suppress: bool = False
+    sample_rate: float = 1.0
+    min_level: Optional[str] = None
+    access_level: Optional[str] = None
+
+    @classmethod
+    def parse(cls, pattern: str, spec: str) -> "RoutePolicy":
+        """Build a policy from a spec string.
+
+        The spec is one or more ``+``-separated actions: ``suppress``,
+        ``sample:<rate>``, ``level:<level>`` and ``access:<level>``, for
+        example ``sample:0.1+access:debug``.
+
+        Raises:
+            ConfigurationError: If the spec is malformed
+        """
+        pattern = pattern.strip()
+        if not pattern.startswith("/"):
+            raise ConfigurationError(
+                f"Route log policy pattern '{pattern}' must start with '/'",
+                "route_log_policies",
+                pattern,
+                "path, prefix ending in '*' or route template",
+            )
+
+        options: Dict[str, Any] = {}
+        for action in spec.split("+"):
+            name, _, value = action.strip().partition(":")
+            name = name.strip().lower()
+            if name == "suppress" and not value:
+                options["suppress"] = True
+            elif name == "sample" and value:
+                try:
+                    rate = float(value)
+                except ValueError:
+                    rate = -1.0
+                if not 0.0 <= rate <= 1.0:
+                    raise ConfigurationError(
+                        f"Invalid sample rate '{value}' in route log policy "
+                        f"for '{pattern}'",
+                        "route_log_policies",
+                        value,
+                        "float between 0.0 and 1.0",
+                    )
+                options["sample_rate"] = rate
+            elif name == "level" and value:
+                options["min_level"] = _validate_level(value, pattern)
+            elif name == "access" and value:
+                options["access_level"] = _validate_level(value, pattern)
+            else:
+                raise ConfigurationError(
+                    f"Invalid route log policy action '{action}' for '{pattern}'",
+                    "route_log_policies",
+                    spec,
+                    "suppress, sample:<rate>, level:<level> or access:<level>",
+                )
+        return cls(pattern=pattern, **options)
+
+
+@dataclass(frozen=True)
+class LogDecision:
+    """Outcome of matching a request against the policy table.
+
+    Attributes:
+        policy: The matching policy
+        dropped: Whether non-error events of this request are dropped
+            (suppressed or not sampled)
+        min_level_no: Numeric minimum level for in-request events
+    """
+
+    policy: RoutePolicy
+    dropped: bool
+    min_level_no: int
+
+    @property
+    def access_level(self) -> str:
+        """Level the access log should be emitted at."""
+        return self.policy.access_level or "info"
+
+    def allows(self, method_name: str) -> bool:
+        """Return whether an event at ``method_name`` level is kept."""
+        level_no = LEVEL_NUMBERS.get(method_name, _ERROR_LEVEL)
+        if level_no >= _ERROR_LEVEL:
+            return True
+        if self.dropped:
+            return False
+        return level_no >= self.min_level_no
+
+
+class RoutePolicyTable:
+    """Compiled route policy table with a bounded per-path match cache.
+
+    Matching prefers an exact path, then route templates in declaration
+    order, then the longest matching prefix.
+    """
+
+    def __init__(self, policies: Iterable[RoutePolicy], cache_size: int = 1024):
+        """Compile the policy table.
+
+        Args:
+            policies: Policies to compile
+            cache_size: Maximum number of distinct paths whose match is cached
+        """
+        self._exact: Dict[str, RoutePolicy] = {}
+        self._templates: List[Tuple[Pattern[str], RoutePolicy]] = []
+        self._prefixes: List[Tuple[str, RoutePolicy]] = []
+
+        for policy in policies:
+            pattern = policy.pattern
+            if pattern.endswith("*"):
+                self._prefixes.append((pattern[:-1], policy))
+            elif "{" in pattern:
+                self._templates.append((self._compile_template(pattern), policy))
+            else:
+                self._exact[pattern] = policy
+
+        self._prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+        self._cache: OrderedDict[str, Optional[RoutePolicy]] = OrderedDict()
+        self._cache_size = cache_size
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, str]) -> "RoutePolicyTable":
+        """Build a table from ``pattern -> spec`` pairs (see RoutePolicy.parse)."""
+        return cls(
+            RoutePolicy.parse(pattern, spec) for pattern, spec in mapping.items()
+        )
+
+    @staticmethod
+    def _compile_template(template: str) -> Pattern[str]:
+        """Compile a route template such as ``/items/{item_id}`` to a regex."""
+        parts = []
+        position = 0
+        for match in _TEMPLATE_PARAM.finditer(template):
+            parts.append(re.escape(template[position : match.start()]))
+            parts.append(".+" if match.group(2) == "path" else "[^/]+")
+            position = match.end()
+        parts.append(re.escape(template[position:]))
+        return re.compile("^" + "".join(parts) + "$")
+
+    def __len__(self) -> int:
+        return len(self._exact) + len(self._templates) + len(self._prefixes)
+
+    def match(self, path: str) -> Optional[RoutePolicy]:
+        """Return the policy for ``path``, or None if no policy matches."""
+        cache = self._cache
+        if path in cache:
+            cache.move_to_end(path)
+            return cache[path]
+
+        policy = self._exact.get(path)
+        if policy is None:
+            for regex, candidate in self._templates:
+                if regex.match(path):
+                    policy = candidate
+                    break
+        if policy is None:
+            for prefix, candidate in self._prefixes:
+                if path.startswith(prefix):
+                    policy = candidate
+                    break
+
+        cache[path] = policy
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return policy
+
+    def decide(self, path: str) -> Optional[LogDecision]:
+        """Match ``path`` and make the per-request logging decision."""
+        policy = self.match(path)
+        if policy is None:
+            return None
+        dropped = policy.suppress or (
+            policy.sample_rate < 1.0 and random.random() >= policy.sample_rate
+        )
+        min_level_no = LEVEL_NUMBERS[policy.min_level] if policy.min_level else 0
+        return LogDecision(policy=policy, dropped=dropped, min_level_no=min_level_no)
+
+
+def get_log_decision() -> Optional[LogDecision]:
+    """Get the route log decision for the current request, if any."""
+    return log_decision_ctx.get()
+
+
+def set_log_decision(decision: Optional[LogDecision]) -> None:
+    """Set the route log decision for the current request."""
+    log_decision_ctx.set(decision)
+
+
+def route_policy_processor(
+    logger: Any, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Drop events that the current request's route policy filters out.
+
+    Runs first in the processor chain so dropped events skip all later work.
+    """
+    decision = log_decision_ctx.get()
+    if decision is not None and not decision.allows(method_name):
+        raise structlog.DropEvent
+    return event_dict
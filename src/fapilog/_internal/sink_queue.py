@@ -0,0 +1,311 @@
+"""Per-sink delivery queue used by the queue worker.
+
+In shared delivery the worker writes each event to every sink and retries
+the event as a whole, so one slow or failing sink delays the others and
+retries rewrite the event to sinks that already succeeded. A ``SinkQueue``
+gives one sink its own bounded buffer, consumer task, retry state and
+overflow policy; the worker only fans events out to the queues.
+
+With a spill store attached, events beyond the spill watermark, or
+arriving while the sink's circuit breaker is open, are written to disk
+instead of the buffer and replayed once the sink is delivering again.
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
+
+from .circuit_breaker import CLOSED, CircuitBreaker
+from .error_handling import retry_with_backoff_async
+from .ring_buffer import RingBuffer
+from .spill_store import SpillStore
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+logger = logging.getLogger(__name__)
+
+SinkOverflow = Literal["drop", "drop_oldest"]
+
+
+class SinkQueue:
+    """Bounded buffer and consumer task delivering events to one sink.
+
+    When the buffer is full, ``drop`` discards the new event and
+    ``drop_oldest`` discards the oldest buffered event to make room. Events
+    still failing after ``max_retries`` retries are dropped for this sink
+    only. Both are recorded in the container's drop ledger as
+    ``sink_overflow`` and ``sink_failed``; events skipped while the sink's
+    circuit breaker is open are recorded as ``circuit_open``.
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        name: str,
+        maxsize: int = 1000,
+        overflow: SinkOverflow = "drop",
+        batch_size: int = 10,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        container: Optional["LoggingContainer"] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        spill: Optional[SpillStore] = None,
+        spill_watermark: float = 0.8,
+    ) -> None:
+        """Initialize the sink queue.
+
+        Args:
+            sink: The sink to deliver to
+            name: Name used to label the sink's metrics
+            maxsize: Number of events the sink may fall behind by
+            overflow: Policy when the buffer is full
+            batch_size: Maximum events taken from the buffer per wakeup
+            max_retries: Maximum retries per event
+            retry_delay: Base delay between retries (doubled on each retry)
+            container: Optional LoggingContainer for metrics and drop counts
+            breaker: Optional circuit breaker gating writes to the sink
+            spill: Optional opened spill store for events the buffer
+                cannot take
+            spill_watermark: Fraction of ``maxsize`` at which new events
+                go to the spill store
+        """
+        self.sink = sink
+        self.name = name
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._container = container
+        self.breaker = breaker
+        self.spill = spill
+        self._spill_mark = max(1, int(maxsize * spill_watermark))
+        # Events refused by the open breaker, delivered first once it allows
+        self._held: List[Tuple[Dict[str, Any], Optional[float]]] = []
+        # Items are (event, queue capture stamp) so end-to-end latency is
+        # measured from the worker's queue, not from the fan-out
+        self.queue = RingBuffer(maxsize)
+        self._task: Optional[asyncio.Task[None]] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def offer(self, event: Dict[str, Any], captured_at: Optional[float]) -> bool:
+        """Buffer an event for the sink without waiting.
+
+        Returns:
+            True if the event was buffered or spilled, False if it was
+            dropped
+        """
+        if self.spill is not None and self._should_spill():
+            if self.spill.append(event):
+                return True
+        if self.queue.full():
+            self._record_drop("sink_overflow")
+            if self.overflow != "drop_oldest":
+                return False
+            self.queue.drain(1)
+        self.queue.put_nowait((event, captured_at))
+        self._idle.clear()
+        self._record_backlog()
+        return True
+
+    def _sink_down(self) -> bool:
+        return self.breaker is not None and self.breaker.state != CLOSED
+
+    def _should_spill(self) -> bool:
+        """Check whether new events go to the spill store.
+
+        Once events have spilled, later ones follow them to disk until the
+        store is replayed, so the sink receives events in order.
+        """
+        return bool(
+            self.spill.pending  # type: ignore[union-attr]
+            or self.queue.qsize() >= self._spill_mark
+            or self._sink_down()
+        )
+
+    async def _run(self) -> None:
+        """Deliver buffered events to the sink until cancelled."""
+        while True:
+            if self.spill is None:
+                await self.queue.wait()
+            elif not await self._wait_with_spill():
+                continue
+
+            # While the breaker is not closed, deliver one event as the probe
+            limit = 1 if self._sink_down() else self.batch_size
+            batch: List[Tuple[Dict[str, Any], Optional[float]]]
+            if self._held:
+                batch, self._held = self._held[:limit], self._held[limit:]
+            else:
+                batch = self.queue.drain(limit)
+            for index, (event, captured_at) in enumerate(batch):
+                if not await self._deliver(event, captured_at):
+                    # Hold the rest of the batch until the breaker allows
+                    self._held[:0] = batch[index:]
+                    break
+            self._record_backlog()
+            if self.queue.empty() and not self._held:
+                self._idle.set()
+
+    async def _wait_with_spill(self) -> bool:
+        """Wait for deliverable events while a spill store is attached.
+
+        Delivery pauses while the circuit breaker is open, so new events
+        spill to disk instead of being dropped. Spilled events are moved
+        back into the buffer, at the store's replay rate, whenever it is
+        below the spill watermark.
+
+        Returns:
+            True if events are ready to deliver
+        """
+        spill: SpillStore = self.spill  # type: ignore[assignment]
+        pause = self.breaker.retry_in() if self.breaker is not None else 0.0
+        if pause > 0:
+            await asyncio.sleep(pause)
+            return False
+        if self._held:
+            return True
+
+        if spill.pending:
+            room = self._spill_mark - self.queue.qsize()
+            if self._sink_down():
+                room = min(room, 1)
+            replayed = spill.take(room)
+            for event in replayed:
+                self.queue.put_nowait((event, None))
+            if replayed:
+                self._idle.clear()
+                self._record_backlog()
+        if not self.queue.empty():
+            return True
+        if spill.pending:
+            await asyncio.sleep(max(spill.next_replay_in(), 0.001))
+            return False
+        return await self.queue.wait()
+
+    async def _deliver(
+        self, event: Dict[str, Any], captured_at: Optional[float]
+    ) -> bool:
+        """Write one event to the sink, retrying only this sink.
+
+        Returns:
+            False if the circuit breaker is open and a spill store is
+            attached, so the event must be held; True otherwise
+        """
+        metrics = self._container.get_metrics_collector() if self._container else None
+        breaker = self.breaker
+        attempts = 0
+        skipped = False
+
+        async def write() -> None:
+            nonlocal attempts, skipped
+            if breaker is not None and not breaker.allow():
+                # Fail fast: no write, and no further retries
+                skipped = True
+                return
+            if attempts and metrics:
+                metrics.record_sink_retry(self.name)
+            attempts += 1
+            write_start = time.perf_counter()
+            try:
+                await self.sink.write(event)
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            if metrics and captured_at is not None:
+                metrics.record_sink_delivery(
+                    self.name,
+                    dwell_ms=(write_start - captured_at) * 1000,
+                    end_to_end_ms=(time.perf_counter() - captured_at) * 1000,
+                )
+
+        try:
+            await retry_with_backoff_async(
+                write, max_retries=self.max_retries, base_delay=self.retry_delay
+            )
+        except Exception as e:
+            if self.spill is not None and self._sink_down():
+                # The failure opened the breaker: keep the event for later
+                return False
+            logger.warning(f"Dropping event for sink {self.name} after retries: {e}")
+            self._record_drop("sink_failed")
+            return True
+        if skipped:
+            if self.spill is not None:
+                return False
+            self._record_drop("circuit_open")
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every buffered event has been delivered or dropped."""
+        if self._task is None or self._task.done():
+            return
+        await self._idle.wait()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Flush the buffer for up to ``timeout`` seconds, then stop.
+
+        With a spill store attached, events that could not be delivered
+        (for example because the breaker is open) are spilled to disk.
+        """
+        if self.spill is None or self.breaker is None or not self.breaker.retry_in():
+            try:
+                await asyncio.wait_for(self.flush(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Sink {self.name} did not flush {self.queue.qsize()} events "
+                    "before shutdown"
+                )
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._spill_backlog()
+
+    def cancel(self) -> None:
+        """Stop the consumer task without flushing."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._spill_backlog()
+
+    def _spill_backlog(self) -> None:
+        """Move undelivered events to the spill store at shutdown.
+
+        They are older than any events already spilled but are appended
+        after them, so the sink may see them out of order.
+        """
+        if self.spill is None:
+            return
+        backlog = self._held + self.queue.drain(self.queue.qsize())
+        self._held = []
+        for event, _ in backlog:
+            if not self.spill.append(event):
+                self._record_drop("sink_overflow")
+        self._record_backlog()
+
+    def _record_backlog(self) -> None:
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_sink_backlog(self.name, self.queue.qsize() + len(self._held))
+
+    def _record_drop(self, reason: str) -> None:
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_sink_dropped(self.name)
+        ledger = self._container.get_drop_ledger() if self._container else None
+        if ledger is not None:
+            ledger.record(reason)
@@ -0,0 +1,458 @@
+"""Disk-backed spill store for events the in-memory queues cannot hold.
+
+During a sink outage or a traffic spike the worker's ring buffer and the
+per-sink queues fill up, and their overflow policy drops events. A
+``SpillStore`` is a write-ahead log those queues spill to instead: events
+are appended to segment files and replayed, oldest first and at a bounded
+rate, once the queue has drained.
+
+Each record is a 16-byte header followed by the JSON-serialized event::
+
+    <uint32 payload length> <uint32 CRC-32> <float64 spill time>
+
+The CRC covers the spill time and the payload. Segments are named after
+their sequence number and are deleted once fully replayed; the replay
+position is kept in a ``cursor`` file so a restart resumes where the
+previous process stopped. Opening the store scans the unreplayed segments
+and truncates a record torn by a crash.
+
+Disk writes are batched to keep them off the logging and replay paths.
+Appended records are buffered and written when the buffer fills, at the
+next replay, or at the next append once ``_FLUSH_INTERVAL`` seconds have
+passed. The cursor is saved when replay finishes a segment or after
+``_CURSOR_SAVE_INTERVAL`` seconds. A crash can therefore lose the events
+appended since the last flush, and replays again the events handed out
+since the last cursor save.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .utils import safe_json_serialize
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<IId")
+_SUFFIX = ".seg"
+_CURSOR = "cursor"
+
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Seconds appended records may stay in the write buffer
+_FLUSH_INTERVAL = 1.0
+# Seconds between cursor saves while replay stays within one segment
+_CURSOR_SAVE_INTERVAL = 1.0
+
+
+def _segment_name(seq: int) -> str:
+    return f"{seq:012d}{_SUFFIX}"
+
+
+def _checksum(spilled_at: float, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(struct.pack("<d", spilled_at)))
+
+
+def _read_record(
+    handle: IO[bytes],
+) -> Optional[Tuple[float, bytes]]:
+    """Read the record at the handle's position.
+
+    Returns:
+        ``(spill time, payload)``, or None at the end of the segment or at a
+        torn or corrupt record
+    """
+    header = handle.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    length, crc, spilled_at = _HEADER.unpack(header)
+    payload = handle.read(length)
+    if len(payload) < length or _checksum(spilled_at, payload) != crc:
+        return None
+    return spilled_at, payload
+
+
+class SpillStore:
+    """Append-only segment log of spilled events with rate-limited replay.
+
+    ``append`` may be called from any thread; ``take`` is called by the one
+    consumer that replays the store.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: Optional[str] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        replay_rate: float = 1000.0,
+        container: Optional["LoggingContainer"] = None,
+    ) -> None:
+        """Initialize the store; ``open`` must be called before use.
+
+        Args:
+            directory: Directory holding the segment files
+            name: Name used to label the store's metrics (defaults to the
+                directory's base name)
+            max_bytes: Unreplayed bytes at which ``append`` starts refusing
+                events
+            segment_bytes: Size at which a new segment file is started
+            replay_rate: Maximum events per second returned by ``take``
+                (0 for no limit)
+            container: Optional LoggingContainer for spill metrics
+        """
+        self.directory = directory
+        self.name = name or os.path.basename(os.path.normpath(directory))
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.replay_rate = replay_rate
+        self._container = container
+        self._lock = threading.Lock()
+
+        # Segment sequence number -> size in bytes, oldest first
+        self._segments: Dict[int, int] = {}
+        self._writer: Optional[IO[bytes]] = None
+        self._write_seq = 0
+        self._reader: Optional[IO[bytes]] = None
+        self._read_seq = 0
+        self._read_offset = 0
+        self.pending = 0
+        self.bytes = 0
+        self.replay_lag = 0.0
+        self._flushed_at = time.monotonic()
+        self._cursor_saved_at = time.monotonic()
+
+        # Replay token bucket, holding at most one second of tokens
+        self._tokens = max(replay_rate, 1.0)
+        self._refilled_at = time.monotonic()
+
+    # Lifecycle
+    def open(self) -> None:
+        """Create the directory and recover spilled events left on disk.
+
+        Segments before the replay cursor are deleted, and every unreplayed
+        record is checked; the first torn or corrupt record and everything
+        after it in that segment are truncated away.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            read_seq, read_offset = self._load_cursor()
+            segments = sorted(
+                int(entry[: -len(_SUFFIX)])
+                for entry in os.listdir(self.directory)
+                if entry.endswith(_SUFFIX) and entry[: -len(_SUFFIX)].isdigit()
+            )
+
+            self._segments = {}
+            self.pending = 0
+            for seq in segments:
+                path = self._path(seq)
+                if seq < read_seq:
+                    os.unlink(path)
+                    continue
+                start = read_offset if seq == read_seq else 0
+                self.pending += self._scan(path, start)
+                self._segments[seq] = os.path.getsize(path)
+
+            if self._segments:
+                first = next(iter(self._segments))
+                self._read_seq = first
+                self._read_offset = read_offset if first == read_seq else 0
+                self._write_seq = max(self._segments)
+            else:
+                self._read_seq = self._write_seq = max(read_seq, 0)
+                self._read_offset = 0
+            self.bytes = sum(self._segments.values()) - self._read_offset
+            self._writer = None
+            self._reader = None
+            self._cursor_saved_at = time.monotonic()
+
+        if self.pending:
+            logger.info(
+                f"Recovered {self.pending} spilled events from {self.directory}"
+            )
+        self._record_metrics()
+
+    def close(self) -> None:
+        """Close the segment files and persist the replay position."""
+        with self._lock:
+            for handle in (self._writer, self._reader):
+                if handle is not None:
+                    handle.close()
+            self._writer = None
+            self._reader = None
+            if self._segments:
+                self._save_cursor()
+
+    # Spilling
+    def append(self, event: Dict[str, Any]) -> bool:
+        """Append an event to the newest segment.
+
+        The record is buffered; it reaches the file when the buffer fills,
+        at the next replay, or with an append once ``_FLUSH_INTERVAL`` has
+        passed.
+
+        Returns:
+            True if the event was written, False if the store is full or the
+            write failed
+        """
+        payload = safe_json_serialize(event).encode("utf-8")
+        spilled_at = time.time()
+        record = (
+            _HEADER.pack(len(payload), _checksum(spilled_at, payload), spilled_at)
+            + payload
+        )
+
+        with self._lock:
+            if self.bytes + len(record) > self.max_bytes:
+                return False
+            try:
+                writer = self._tail_writer(len(record))
+                writer.write(record)
+                now = time.monotonic()
+                if now - self._flushed_at >= _FLUSH_INTERVAL:
+                    writer.flush()
+                    self._flushed_at = now
+            except OSError as e:
+                logger.warning(f"Failed to spill event to {self.directory}: {e}")
+                return False
+            self._segments[self._write_seq] += len(record)
+            self.pending += 1
+            self.bytes += len(record)
+        self._record_metrics()
+        return True
+
+    # Replay
+    def next_replay_in(self) -> float:
+        """Seconds until ``take`` may return another event."""
+        if self.replay_rate <= 0:
+            return 0.0
+        self._refill()
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.replay_rate
+
+    def take(self, limit: int) -> List[Dict[str, Any]]:
+        """Remove and return up to ``limit`` of the oldest spilled events.
+
+        Fewer events are returned when the replay rate allows fewer. See
+        ``replay`` for when the replay position is persisted.
+        """
+        events: List[Dict[str, Any]] = []
+
+        def collect(event: Dict[str, Any]) -> bool:
+            events.append(event)
+            return True
+
+        self.replay(limit, collect)
+        return events
+
+    def replay(self, limit: int, put: Callable[[Dict[str, Any]], bool]) -> int:
+        """Hand up to ``limit`` of the oldest spilled events to ``put``.
+
+        Replay stops at the first event ``put`` refuses by returning False;
+        that event stays in the store, first in line for the next replay.
+        Like ``take``, fewer events are replayed when the replay rate allows
+        fewer. The replay position is persisted when a segment has been
+        replayed completely or ``_CURSOR_SAVE_INTERVAL`` has passed, so a
+        restart after a crash may replay up to that many seconds of events
+        again.
+
+        Returns:
+            The number of events ``put`` accepted
+        """
+        if self.replay_rate > 0:
+            self._refill()
+            limit = min(limit, int(self._tokens))
+        if limit <= 0 or not self.pending:
+            return 0
+
+        replayed = 0
+        with self._lock:
+            # Make the buffered records readable
+            self._flush()
+            read_seq = self._read_seq
+            while replayed < limit and self.pending:
+                record = self._next_record()
+                if record is None:
+                    logger.warning(
+                        f"Discarding {self.pending} unreadable spilled events "
+                        f"in {self.directory}"
+                    )
+                    self.pending = 0
+                    break
+                spilled_at, payload = record
+                try:
+                    event = json.loads(payload)
+                except ValueError as e:
+                    logger.warning(f"Skipping unreadable spilled event: {e}")
+                    self.pending -= 1
+                    continue
+                if not put(event):
+                    self._unread(_HEADER.size + len(payload))
+                    break
+                replayed += 1
+                self.pending -= 1
+                self.replay_lag = max(time.time() - spilled_at, 0.0)
+            if not self.pending:
+                self.replay_lag = 0.0
+            self._release_replayed()
+            now = time.monotonic()
+            if (
+                self._read_seq != read_seq
+                or now - self._cursor_saved_at >= _CURSOR_SAVE_INTERVAL
+            ):
+                self._save_cursor()
+
+        if self.replay_rate > 0:
+            self._tokens -= replayed
+        self._record_metrics()
+        return replayed
+
+    # Internals (called with the lock held unless noted)
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, _segment_name(seq))
+
+    def _scan(self, path: str, start: int) -> int:
+        """Count the intact records of a segment, truncating a torn tail."""
+        count = 0
+        with open(path, "r+b") as handle:
+            handle.seek(start)
+            end = start
+            while _read_record(handle) is not None:
+                count += 1
+                end = handle.tell()
+            size = os.fstat(handle.fileno()).st_size
+            if end < size:
+                logger.warning(
+                    f"Truncating {size - end} bytes of torn or corrupt spill "
+                    f"records in {path}"
+                )
+                handle.truncate(end)
+        return count
+
+    def _tail_writer(self, record_size: int) -> IO[bytes]:
+        """The newest segment's writer, starting a new segment when full."""
+        size = self._segments.get(self._write_seq)
+        if size is not None and size and size + record_size > self.segment_bytes:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._write_seq += 1
+            size = None
+        if size is None:
+            self._segments[self._write_seq] = 0
+        if self._writer is None:
+            self._writer = open(self._path(self._write_seq), "ab")
+        return self._writer
+
+    def _flush(self) -> None:
+        """Write the buffered records of the newest segment to disk."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.flush()
+        except OSError as e:
+            logger.warning(f"Failed to spill events to {self.directory}: {e}")
+        self._flushed_at = time.monotonic()
+
+    def _next_record(self) -> Optional[Tuple[float, bytes]]:
+        """Read the record at the replay position, advancing past it."""
+        while True:
+            if self._reader is None:
+                if self._read_seq not in self._segments:
+                    return None
+                self._reader = open(self._path(self._read_seq), "rb")
+                self._reader.seek(self._read_offset)
+            record = _read_record(self._reader)
+            if record is not None:
+                self._read_offset = self._reader.tell()
+                self.bytes -= _HEADER.size + len(record[1])
+                return record
+            if self._read_seq >= self._write_seq:
+                return None
+            # End of a finished segment: move on to the next one
+            self._reader.close()
+            self._reader = None
+            self._read_seq += 1
+            self._read_offset = 0
+
+    def _unread(self, record_size: int) -> None:
+        """Step the replay position back over the record just read.
+
+        A record starting a segment leaves the previous segment fully read,
+        so stepping back within the current segment is always enough.
+        """
+        self._read_offset -= record_size
+        self.bytes += record_size
+        self._reader.seek(self._read_offset)  # type: ignore[union-attr]
+
+    def _release_replayed(self) -> None:
+        """Delete segments that have been replayed completely."""
+        for seq in [seq for seq in self._segments if seq < self._read_seq]:
+            del self._segments[seq]
+            try:
+                os.unlink(self._path(seq))
+            except OSError:
+                pass
+        if not self.pending and self._read_seq == self._write_seq:
+            # Fully caught up: let the next spill start a fresh segment
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._segments.pop(self._read_seq, None)
+            try:
+                os.unlink(self._path(self._read_seq))
+            except OSError:
+                pass
+            self._read_seq = self._write_seq = self._read_seq + 1
+            self._read_offset = 0
+            self.bytes = 0
+
+    def _load_cursor(self) -> Tuple[int, int]:
+        try:
+            with open(os.path.join(self.directory, _CURSOR)) as handle:
+                seq, offset = handle.read().split()
+            return int(seq), int(offset)
+        except (OSError, ValueError):
+            return 0, 0
+
+    def _save_cursor(self) -> None:
+        path = os.path.join(self.directory, _CURSOR)
+        try:
+            with open(path + ".tmp", "w") as handle:
+                handle.write(f"{self._read_seq} {self._read_offset}\n")
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.warning(f"Failed to save spill replay position: {e}")
+        self._cursor_saved_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add replay tokens for the time elapsed (consumer only)."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._refilled_at) * self.replay_rate,
+            max(self.replay_rate, 1.0),
+        )
+        self._refilled_at = now
+
+    def _record_metrics(self) -> None:
+        """Publish the store's gauges (called without the lock)."""
+        metrics = self._container.get_metrics_collector() if self._container else None
+        if metrics:
+            metrics.record_spill(
+                self.name,
+                spilled_bytes=self.bytes,
+                segments=len(self._segments),
+                pending=self.pending,
+                replay_lag_seconds=self.replay_lag,
+            )
@@ -0,0 +1,74 @@
+"""Bounded-memory heavy-hitter counting with the space-saving algorithm."""
+
+from typing import Dict, List, Tuple
+
+
+class SpaceSavingCounter:
+    """Track event and byte counts for the most frequent keys.
+
+    At most ``capacity`` keys are kept. When a new key arrives and the
+    counter is full, the key with the fewest events is evicted and the new
+    key inherits its counts (Metwally et al., "space-saving"). Counts are
+    therefore upper bounds; ``error`` records how much of a key's event
+    count may have been inherited. Any key with more than ``N / capacity``
+    events out of ``N`` is guaranteed to be tracked.
+
+    Hits on tracked keys are O(1); evictions scan the tracked keys. Not
+    thread-safe on its own; callers keep one counter per recording thread
+    and merge them on read.
+    """
+
+    __slots__ = ("capacity", "entries")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Space-saving capacity must be at least 1")
+        self.capacity = capacity
+        # key -> [events, bytes, error]
+        self.entries: Dict[str, List[int]] = {}
+
+    def add(self, key: str, size_bytes: int = 0) -> None:
+        """Count one event of ``size_bytes`` for ``key``."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += size_bytes
+            return
+
+        if len(self.entries) < self.capacity:
+            self.entries[key] = [1, size_bytes, 0]
+            return
+
+        victim = min(self.entries, key=lambda k: self.entries[k][0])
+        events, nbytes, _ = self.entries.pop(victim)
+        self.entries[key] = [events + 1, nbytes + size_bytes, events]
+
+    def merge(self, other: "SpaceSavingCounter") -> None:
+        """Add another counter's entries, keeping the top ``capacity`` keys.
+
+        ``other`` may still be recording on its own thread: its entries are
+        snapshotted, and each entry copied, before they are read.
+        """
+        for key, other_entry in list(other.entries.items()):
+            events, nbytes, error = list(other_entry)
+            entry = self.entries.get(key)
+            if entry is None:
+                self.entries[key] = [events, nbytes, error]
+            else:
+                entry[0] += events
+                entry[1] += nbytes
+                entry[2] += error
+
+        if len(self.entries) > self.capacity:
+            self.entries = dict(
+                sorted(self.entries.items(), key=lambda item: -item[1][0])[
+                    : self.capacity
+                ]
+            )
+
+    def top(self) -> List[Tuple[str, int, int, int]]:
+        """Tracked keys as ``(key, events, bytes, error)``, most events first."""
+        return sorted(
+            ((key, *entry) for key, entry in self.entries.items()),
+            key=lambda item: (-item[1], item[0]),
+        )
@@ -19,6 +19,7 @@ Breaking Changes from Previous Version:
 See CONTAINER_MIGRATION_NOTES.md for detailed migration guide.
 """
 
+import asyncio
 import atexit
 import logging
 import threading
@@ -30,6 +31,7 @@ import structlog
 from ._internal.async_lock_manager import ProcessorLockManager
 from ._internal.component_factory import ComponentFactory
 from ._internal.component_registry import ComponentRegistry
+from ._internal.drop_ledger import DropLedger
 from ._internal.error_handling import (
     handle_configuration_error,
 )
@@ -101,6 +103,10 @@ class LoggingContainer:
         # Metrics components
         self._metrics_collector: Optional[Any] = None
         self._prometheus_exporter: Optional[Any] = None
+        self._loop_monitor: Optional[Any] = None
+        self._logging_thread: Optional[Any] = None
+        # Sink forwarding to the shipper, closed with its fallbacks on shutdown
+        self._shipper_sink: Optional[Any] = None
 
     def __enter__(self) -> "LoggingContainer":
         """Context manager entry - configure the container if not already done."""
@@ -160,6 +166,7 @@ class LoggingContainer:
                 # Still register middleware if app is provided
                 if app is not None:
                     self._register_middleware(app)
+                    self._mount_metrics_endpoint(app)
                 return structlog.get_logger()  # type: ignore[no-any-return]
 
             # Determine final configuration values from settings
@@ -176,6 +183,10 @@ class LoggingContainer:
             # Initialize metrics if enabled
             self._configure_metrics()
 
+            # Move the queue worker to its own thread and loop if requested
+            if self._queue_worker is not None and self._settings.queue_dedicated_thread:
+                self._start_logging_thread()
+
             # Configure structlog with pure dependency injection
             self._configure_structlog(console_format, log_level)
 
@@ -185,6 +196,7 @@ class LoggingContainer:
             # Register middleware if app is provided
             if app is not None:
                 self._register_middleware(app)
+                self._mount_metrics_endpoint(app)
 
             # Mark as configured
             self._configured = True
@@ -336,28 +348,57 @@ class LoggingContainer:
                         f"Unknown sink type: {sink_uri}", "unknown", context
                     ) from e
 
+        # Forward events to a local shipper process; the sinks become fallbacks
+        if self._settings.shipper_socket:
+            self._sinks = [self._create_shipper_sink(self._settings.shipper_socket)]
+
         # Create queue worker with error handling
         try:
             worker = QueueWorker(
                 sinks=self._sinks,
                 queue_max_size=self._settings.queue_maxsize,
+                queue_priority_size=self._settings.queue_priority_size,
+                queue_max_bytes=self._settings.queue_max_bytes,
                 batch_size=self._settings.queue_batch_size,
                 batch_timeout=self._settings.queue_batch_timeout,
+                adaptive_batching=self._settings.queue_adaptive_batching,
+                min_batch_size=self._settings.queue_batch_size_min,
+                max_batch_size=self._settings.queue_batch_size_max,
+                min_flush_timeout=self._settings.queue_flush_timeout_min,
+                max_flush_timeout=self._settings.queue_flush_timeout_max,
                 retry_delay=self._settings.queue_retry_delay,
                 max_retries=self._settings.queue_max_retries,
                 overflow_strategy=self._settings.queue_overflow,
                 sampling_rate=self._settings.sampling_rate,
+                block_timeout=self._settings.queue_block_timeout,
                 container=self,
+                enricher_timeout=self._settings.async_enricher_timeout,
+                drop_summary_interval=self._settings.drop_summary_interval,
+                sink_queue_size=self._settings.sink_queue_size,
+                sink_queue_overflow=self._settings.sink_queue_overflow,
+                circuit_breaker_threshold=self._settings.sink_circuit_breaker_threshold,
+                circuit_breaker_reset_timeout=(
+                    self._settings.sink_circuit_breaker_reset_timeout
+                ),
+                spill_dir=self._settings.spill_dir,
+                spill_watermark=self._settings.spill_watermark,
+                spill_max_bytes=self._settings.spill_max_bytes,
+                spill_replay_rate=self._settings.spill_replay_rate,
             )
         except Exception as e:
             queue_config = {
                 "queue_max_size": self._settings.queue_maxsize,
+                "queue_priority_size": self._settings.queue_priority_size,
+                "queue_max_bytes": self._settings.queue_max_bytes,
                 "batch_size": self._settings.queue_batch_size,
                 "batch_timeout": self._settings.queue_batch_timeout,
                 "retry_delay": self._settings.queue_retry_delay,
                 "max_retries": self._settings.queue_max_retries,
                 "overflow_strategy": self._settings.queue_overflow,
                 "sampling_rate": self._settings.sampling_rate,
+                "enricher_timeout": self._settings.async_enricher_timeout,
+                "sink_queue_size": self._settings.sink_queue_size,
+                "spill_dir": self._settings.spill_dir,
             }
             raise handle_configuration_error(
                 e, "queue_worker", queue_config, "valid queue configuration"
@@ -365,6 +406,49 @@ class LoggingContainer:
 
         return worker
 
+    def _create_shipper_sink(self, socket_path: str) -> Sink:
+        """Create the sink that forwards events to the log shipper."""
+        from .sinks.shipper import ShipperSink
+
+        sink = ShipperSink(
+            socket_path,
+            fallback_sinks=self._sinks,
+            reconnect_interval=self._settings.shipper_reconnect_interval,
+            container=self,
+            spawn=self._settings.shipper_spawn,
+        )
+        if sink.spawn:
+            sink.start_shipper()
+        self._shipper_sink = sink
+        return sink
+
+    def _close_shipper_sink_sync(self) -> None:
+        """Close the shipper sink from synchronous code."""
+        close = self._shipper_sink.close()  # type: ignore[union-attr]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(close)
+        else:
+            # Called from a running loop: close in the background
+            asyncio.ensure_future(close)
+
+    def _start_logging_thread(self) -> None:
+        """Start the dedicated thread that runs the queue worker."""
+        from ._internal.logging_thread import LoggingThread
+
+        self._logging_thread = LoggingThread(self._queue_worker)
+        try:
+            self._logging_thread.start()
+        except Exception as e:
+            self._logging_thread = None
+            raise handle_configuration_error(
+                e,
+                "queue_dedicated_thread",
+                True,
+                "a logging thread that can start the queue worker",
+            ) from e
+
     def _configure_structlog(self, console_format: str, log_level: str) -> None:
         """Configure structlog with pure dependency injection."""
         # Build structlog processor chain using the pipeline
@@ -407,6 +491,25 @@ class LoggingContainer:
             self._metrics_collector = MetricsCollector(
                 enabled=True,
                 sample_window=self._settings.metrics_sample_window,
+                histogram_buckets=self._settings.metrics_histogram_buckets,
+                top_k=self._settings.metrics_top_k,
+            )
+            # Export the pipeline's drop counts with the container's metrics
+            self.get_metrics_collector().drop_ledger = self.get_drop_ledger()
+
+        # Initialize event loop lag monitor if enabled
+        if self._settings.metrics_enabled and self._settings.loop_lag_monitor_enabled:
+            from ._internal.loop_monitor import LoopLagMonitor
+
+            self._loop_monitor = LoopLagMonitor(
+                self.get_metrics_collector(),
+                interval=self._settings.loop_lag_monitor_interval,
+                # Batches on the logging thread never block the app loop
+                worker=(
+                    None
+                    if self._settings.queue_dedicated_thread
+                    else self._queue_worker
+                ),
             )
 
         # Initialize Prometheus exporter if enabled
@@ -419,6 +522,8 @@ class LoggingContainer:
                 path="/metrics",
                 enabled=True,
                 container=self,
+                mode=self._settings.metrics_prometheus_mode,
+                cache_ttl=self._settings.metrics_prometheus_cache_ttl,
             )
 
     def _configure_httpx_trace_propagation(self) -> None:
@@ -430,12 +535,35 @@ class LoggingContainer:
     def _register_middleware(self, app: Any) -> None:
         """Register middleware with the FastAPI app."""
         app.add_middleware(
-            TraceIDMiddleware, trace_id_header=self._settings.trace_id_header
+            TraceIDMiddleware,
+            trace_id_header=self._settings.trace_id_header,
+            route_policies=self._settings.route_log_policies or None,
+            buffer_max_events=(
+                self._settings.request_buffer_max_events
+                if self._settings.request_buffer_enabled
+                else None
+            ),
+            buffer_slow_ms=self._settings.request_buffer_slow_ms,
+            metrics_collector=self.get_metrics_collector(),
+            access_log_sample_rate=self._settings.access_log_sample_rate,
         )
+        # Start the loop lag probe on the app's own event loop
+        if self._loop_monitor is not None:
+            app.add_event_handler("startup", self._loop_monitor.start)
         # Register shutdown event for graceful queue worker shutdown
         if self._queue_worker is not None:
             app.add_event_handler("shutdown", self.shutdown)
 
+    def _mount_metrics_endpoint(self, app: Any) -> None:
+        """Serve the metrics endpoint from the app when configured to mount."""
+        exporter = self._prometheus_exporter
+        if (
+            exporter is not None
+            and exporter.mode == "mount"
+            and not exporter.is_running()
+        ):
+            exporter.mount(app)
+
     async def shutdown(self) -> None:
         """Shutdown the container gracefully (async version)."""
         with self._lock:
@@ -445,6 +573,14 @@ class LoggingContainer:
             except Exception as e:
                 logger.warning(f"Error during component registry cleanup: {e}")
 
+            if self._loop_monitor is not None:
+                try:
+                    await self._loop_monitor.stop()
+                except Exception as e:
+                    logger.warning(f"Error during loop lag monitor shutdown: {e}")
+                finally:
+                    self._loop_monitor = None
+
             # Shutdown Prometheus exporter
             if self._prometheus_exporter is not None:
                 try:
@@ -454,6 +590,15 @@ class LoggingContainer:
                 finally:
                     self._prometheus_exporter = None
 
+            if self._logging_thread is not None:
+                try:
+                    await self._logging_thread.shutdown()
+                except Exception as e:
+                    logger.warning(f"Error during logging thread shutdown: {e}")
+                finally:
+                    self._logging_thread = None
+                    self._queue_worker = None
+
             if self._queue_worker is not None:
                 try:
                     await self._queue_worker.shutdown()
@@ -462,6 +607,14 @@ class LoggingContainer:
                 finally:
                     self._queue_worker = None
 
+            if self._shipper_sink is not None:
+                try:
+                    await self._shipper_sink.close()
+                except Exception as e:
+                    logger.warning(f"Error closing log shipper sink: {e}")
+                finally:
+                    self._shipper_sink = None
+
             if self._httpx_propagation is not None:
                 try:
                     self._httpx_propagation.cleanup()
@@ -487,6 +640,18 @@ class LoggingContainer:
             # Reset metrics components (sync version doesn't need to stop Prometheus)
             self._prometheus_exporter = None
             self._metrics_collector = None
+            if self._loop_monitor is not None:
+                self._loop_monitor.cancel()
+                self._loop_monitor = None
+
+            if self._logging_thread is not None:
+                try:
+                    self._logging_thread.stop()
+                except Exception as e:
+                    logger.warning(f"Error during logging thread shutdown: {e}")
+                finally:
+                    self._logging_thread = None
+                    self._queue_worker = None
 
             if self._queue_worker is not None:
                 try:
@@ -496,6 +661,14 @@ class LoggingContainer:
                 finally:
                     self._queue_worker = None
 
+            if self._shipper_sink is not None:
+                try:
+                    self._close_shipper_sink_sync()
+                except Exception as e:
+                    logger.warning(f"Error closing log shipper sink: {e}")
+                finally:
+                    self._shipper_sink = None
+
             if self._httpx_propagation is not None:
                 try:
                     self._httpx_propagation.cleanup()
@@ -566,6 +739,9 @@ class LoggingContainer:
         This should be called after configure() if using async components.
         """
         with self._lock:
+            if self._loop_monitor is not None:
+                self._loop_monitor.start()
+
             # Start Prometheus exporter if configured
             if self._prometheus_exporter is not None:
                 try:
@@ -604,6 +780,16 @@ class LoggingContainer:
             ProcessorMetrics, self._factory.create_processor_metrics
         )
 
+    def get_drop_ledger(self) -> DropLedger:
+        """Get container-scoped DropLedger instance.
+
+        Returns:
+            DropLedger instance scoped to this container
+        """
+        return self._registry.get_or_create_component(
+            DropLedger, self._factory.create_drop_ledger
+        )
+
     def get_metrics_collector(self) -> Optional[MetricsCollector]:
         """Get container-scoped MetricsCollector instance.
 
@@ -48,6 +48,10 @@ __all__ = [
     "register_enricher",
     "clear_enrichers",
     "run_registered_enrichers",
+    # Async batch enricher registry
+    "register_async_enricher",
+    "clear_async_enrichers",
+    "run_async_enrichers",
 ]
 
 
@@ -487,12 +491,12 @@ def body_size_enricher(
     This processor reads from context variables populated by TraceIDMiddleware
     and adds request/response body size metadata to every event:
     - req_bytes: Size of request body in bytes (0 if no body or streaming)
-    - res_bytes: Size of response body in bytes (0 if streaming)
+    - res_bytes: Size of response body in bytes
 
     These values are extracted by TraceIDMiddleware and stored in contextvars.
     Works for standard JSON, form, and plain requests; req_bytes falls back to
-    Content-Length header if body not read. res_bytes is set based on
-    len(response.body) (when available).
+    Content-Length header if body not read. res_bytes is counted from the
+    body chunks sent by the application, including streaming responses.
 
     Args:
         logger: The logger instance
@@ -528,7 +532,7 @@ def request_response_enricher(
     - status_code: HTTP status integer
     - latency_ms: Request latency in milliseconds
     - req_bytes: Size of request body in bytes (0 if no body or streaming)
-    - res_bytes: Size of response body in bytes (0 if streaming)
+    - res_bytes: Size of response body in bytes
     - user_agent: Value of User-Agent header or "-"
 
     Args:
@@ -789,6 +793,134 @@ def run_registered_enrichers(
     return result
 
 
+# Async batch enricher registry
+_registered_async_enrichers: List[Callable[..., Any]] = []
+
+
+def register_async_enricher(fn: Callable[..., Any]) -> None:
+    """Register an async batch enricher.
+
+    Async batch enrichers run inside the QueueWorker, off the request path,
+    once per batch before events are written to sinks. They are intended for
+    enrichment that needs I/O (GeoIP lookups, tenant resolution, feature-flag
+    snapshots). They follow the signature:
+    `async (events, cache) -> events`
+
+    `events` is the list of event dictionaries in the batch and `cache` is the
+    container's AsyncSmartCache, so expensive lookups can be memoized with
+    `await cache.get_or_compute(key, compute_func)` and amortized across the
+    batch. Returning None keeps the (possibly mutated) input list.
+
+    Args:
+        fn: The async enricher function to register
+
+    Raises:
+        ConfigurationError: If the function is not async or doesn't have the
+            correct signature
+    """
+    import inspect
+
+    if not asyncio.iscoroutinefunction(fn):
+        raise ConfigurationError(
+            "Async enricher must be an async function",
+            "enricher_signature",
+            getattr(fn, "__name__", str(fn)),
+            "async (events, cache)",
+        )
+
+    params = list(inspect.signature(fn).parameters.keys())
+    if params != ["events", "cache"]:
+        raise ConfigurationError(
+            f"Async enricher function must have signature "
+            f"(events, cache), got {params}",
+            "enricher_signature",
+            params,
+            "(events, cache)",
+        )
+
+    # Check if function is already registered (by reference)
+    if fn not in _registered_async_enrichers:
+        _registered_async_enrichers.append(fn)
+
+
+def clear_async_enrichers() -> None:
+    """Clear all registered async batch enrichers.
+
+    This is primarily used for test isolation.
+    """
+    _registered_async_enrichers.clear()
+
+
+async def run_async_enrichers(
+    events: List[Dict[str, Any]],
+    cache: Optional[AsyncSmartCache] = None,
+    timeout: Optional[float] = None,
+    health_monitor: Optional[EnricherHealthMonitor] = None,
+    error_handler: Optional[EnricherErrorHandler] = None,
+) -> List[Dict[str, Any]]:
+    """Run all registered async batch enrichers in registration order.
+
+    The timeout is a deadline for the whole batch, shared by all enrichers.
+    An enricher that exceeds the remaining time is cancelled and handled like
+    any other enricher failure; the batch continues unenriched by it.
+
+    Args:
+        events: The batch of event dictionaries to enrich
+        cache: AsyncSmartCache used for memoization. If None, a per-call cache
+            is created, so results are only shared within this batch.
+        timeout: Per-batch deadline in seconds, or None for no deadline
+        health_monitor: Optional EnricherHealthMonitor for execution stats
+        error_handler: Optional EnricherErrorHandler for failure handling
+
+    Returns:
+        The enriched list of events
+    """
+    if not _registered_async_enrichers or not events:
+        return events
+
+    # Fall back to per-call instances to avoid global state
+    cache = cache if cache is not None else AsyncSmartCache()
+    health_monitor = health_monitor or EnricherHealthMonitor()
+    error_handler = error_handler or EnricherErrorHandler()
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+
+    result = events
+    for enricher in list(_registered_async_enrichers):
+        enricher_name = getattr(enricher, "__name__", str(enricher))
+        start_time = datetime.now()
+
+        try:
+            if deadline is None:
+                enriched = await enricher(result, cache)
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        f"Batch enrichment deadline of {timeout}s exceeded"
+                    )
+                enriched = await asyncio.wait_for(enricher(result, cache), remaining)
+
+            if enriched is not None:
+                result = enriched
+
+            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+            health_monitor.record_enricher_execution(enricher_name, True, duration_ms)
+
+        except Exception as e:
+            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+            health_monitor.record_enricher_execution(enricher_name, False, duration_ms)
+
+            should_continue = error_handler.handle_enricher_error(
+                enricher, e, {"batch_size": len(result)}
+            )
+            if not should_continue:
+                break
+
+    return result
+
+
 def clear_smart_cache() -> None:
     """Clear async smart cache for testing purposes.
 
@@ -1,8 +1,9 @@
 """FastAPI middleware for request correlation and timing."""
 
+import random
 import time
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional, Union
 
 try:
     from fastapi import Request, Response, status
@@ -18,14 +19,23 @@ except ImportError:  # pragma: no cover
     FastAPIRequest = Any
     status = type("status", (), {"HTTP_500_INTERNAL_SERVER_ERROR": 500})()
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request as StarletteRequest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ._internal.context import (
     bind_context,
+    bind_request_buffer,
     clear_context,
 )
 from ._internal.error_handling import handle_middleware_error
+from ._internal.metrics import MetricsCollector
+from ._internal.request_buffer import RequestLogBuffer
+from ._internal.route_policy import (
+    RoutePolicyTable,
+    get_log_decision,
+    set_log_decision,
+)
 
 
 def add_trace_exception_handler(
@@ -62,9 +72,13 @@ def add_trace_exception_handler(
         return response
 
 
-class TraceIDMiddleware(BaseHTTPMiddleware):
+class TraceIDMiddleware:
     """Middleware that injects trace_id and span_id into request context.
 
+    This is a pure ASGI middleware: it wraps ``send`` instead of subclassing
+    Starlette's ``BaseHTTPMiddleware``, so requests are not copied into extra
+    tasks and memory streams and streaming responses keep their back-pressure.
+
     This middleware:
     - Generates or forwards trace_id from configurable header
       (default: X-Request-ID)
@@ -73,20 +87,56 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
     - Captures request/response metadata (body sizes, status code, user-agent)
     - Captures request details (method, path, client_ip) for context
       enrichment
+    - Counts response bytes as body chunks are sent, so res_bytes is also
+      correct for StreamingResponse
     - Echoes trace_id in X-Trace-Id response header
+    - Applies route log policies (suppress, sample, level-adjust) once per
+      request and stores the decision on the request context
+    - Optionally buffers DEBUG/INFO events per request and emits them only
+      if the request fails, returns 5xx or is slow
+    - Optionally records latency in per-route, per-status histograms of a
+      MetricsCollector, so the access log can be sampled or disabled
     - Cleans up context variables after request completion
     """
 
-    def __init__(self, app: ASGIApp, trace_id_header: str = "X-Request-ID") -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        trace_id_header: str = "X-Request-ID",
+        route_policies: Optional[Union[RoutePolicyTable, Mapping[str, str]]] = None,
+        buffer_max_events: Optional[int] = None,
+        buffer_slow_ms: float = 1000.0,
+        metrics_collector: Optional[MetricsCollector] = None,
+        access_log_sample_rate: float = 1.0,
+    ) -> None:
         """Initialize the middleware.
 
         Args:
             app: The ASGI application to wrap
             trace_id_header: The HTTP header name for trace ID
                            (default: X-Request-ID)
+            route_policies: Route log policy table, or a pattern -> spec
+                           mapping to compile into one
+            buffer_max_events: Per-request log buffer size; None disables
+                           tail-based buffering
+            buffer_slow_ms: Latency (ms) at or above which buffered events
+                           are emitted
+            metrics_collector: Collector receiving per-route latency
+                           histograms
+            access_log_sample_rate: Fraction of non-5xx requests that emit
+                           the "Request processed" access log (0 disables it)
         """
-        super().__init__(app)
+        self.app = app
         self.trace_id_header = trace_id_header
+        if route_policies is not None and not isinstance(
+            route_policies, RoutePolicyTable
+        ):
+            route_policies = RoutePolicyTable.from_mapping(route_policies)
+        self.route_policies = route_policies or None
+        self.buffer_max_events = buffer_max_events
+        self.buffer_slow_ms = buffer_slow_ms
+        self.metrics_collector = metrics_collector
+        self.access_log_sample_rate = access_log_sample_rate
 
     def _extract_request_metadata(self, request: Request) -> Dict[str, Any]:
         """Extract metadata from the request.
@@ -186,69 +236,62 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
         request.state.trace_id = trace_id
         request.state.span_id = span_id
 
-    def _calculate_response_size(self, response: Any) -> int:
-        """Calculate response body size.
+    def _add_correlation_headers(
+        self, headers: Any, trace_id: str, span_id: str, duration: float
+    ) -> None:
+        """Add correlation headers to the response headers.
 
         Args:
-            response: The response object
+            headers: Mutable response headers
+            trace_id: Trace ID to add to headers
+            span_id: Span ID to add to headers
+            duration: Request duration in milliseconds
+        """
+        headers[self.trace_id_header] = trace_id
+        headers["X-Span-Id"] = span_id
+        headers["X-Response-Time-ms"] = str(duration)
 
-        Returns:
-            Size of response body in bytes
+    def _finish_request_buffer(
+        self, buffer: RequestLogBuffer, status_code: int, start_time: float
+    ) -> int:
+        """Stop buffering and emit or discard the request's buffered events.
 
-        Raises:
-            MiddlewareError: If response size calculation fails
-        """
-        try:
-            res_size = 0
-            if hasattr(response, "body"):
-                if response.body:
-                    res_size = len(response.body)
-                elif (
-                    hasattr(response, "media_type")
-                    and response.media_type == "application/json"
-                ):
-                    # For JSONResponse, try to get body size
-                    try:
-                        import json
-
-                        body_str = json.dumps(response.body) if response.body else ""
-                        res_size = len(body_str.encode("utf-8"))
-                    except (TypeError, ValueError):  # pragma: no cover
-                        # This branch is not testable via FastAPI/Starlette's
-                        # public API because setting response.body to
-                        # non-serializable types causes framework-level errors
-                        # before reaching this middleware logic
-                        res_size = 0
-            return res_size
-        except Exception as e:
-            response_info = {
-                "response_type": type(response).__name__,
-                "has_body": hasattr(response, "body"),
-                "has_media_type": hasattr(response, "media_type"),
-            }
-            raise handle_middleware_error(
-                e, response_info, "calculate_response_size"
-            ) from e
+        Args:
+            buffer: The request log buffer
+            status_code: The response status code (500 on failure)
+            start_time: perf_counter() value at the start of the request
 
-    def _add_correlation_headers(
-        self, response: Any, trace_id: str, span_id: str, duration: float
+        Returns:
+            Number of buffered events that were discarded
+        """
+        bind_request_buffer(None)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if status_code >= 500 or elapsed_ms >= self.buffer_slow_ms:
+            buffer.flush()
+            return buffer.evicted
+        return buffer.discard()
+
+    def _record_request_metrics(
+        self, scope: Scope, method: str, status_code: int, duration: float
     ) -> None:
-        """Add correlation headers to response.
+        """Record the request latency in the route's histogram.
 
         Args:
-            response: The response object
-            trace_id: Trace ID to add to headers
-            span_id: Span ID to add to headers
+            scope: The ASGI scope, carrying the matched route after routing
+            method: HTTP method
+            status_code: The response status code
             duration: Request duration in milliseconds
         """
-        response.headers[self.trace_id_header] = trace_id
-        response.headers["X-Span-Id"] = span_id
-        response.headers["X-Response-Time-ms"] = str(duration)
+        if self.metrics_collector is None:
+            return
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+        self.metrics_collector.record_request(method, route, status_code, duration)
 
     def _log_request_success(
         self,
         request: Request,
-        response: Any,
+        status_code: int,
         trace_id: str,
         span_id: str,
         duration: float,
@@ -257,23 +300,46 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
 
         Args:
             request: The incoming request
-            response: The response object
+            status_code: The response status code
             trace_id: Trace ID for the request
             span_id: Span ID for the request
             duration: Request duration in milliseconds
         """
+        # Successful requests may be sampled; 5xx responses are always logged
+        if (
+            status_code < 500
+            and self.access_log_sample_rate < 1.0
+            and random.random() >= self.access_log_sample_rate
+        ):
+            return
+
+        # Route policy may demote or drop the access log
+        level = "info"
+        decision = get_log_decision()
+        if decision is not None:
+            level = decision.access_level
+            if not decision.allows(level):
+                return
+
+        # Summarize events dropped by tail-based buffering
+        extra = {}
+        dropped = getattr(request.state, "buffered_events_dropped", 0)
+        if dropped:
+            extra["buffered_events_dropped"] = dropped
+
         # Import log here to avoid circular import
         from . import log
 
         # Log request details with correlation IDs
-        log.info(
+        getattr(log, level)(
             "Request processed",
             trace_id=trace_id,
             span_id=span_id,
             path=request.url.path,
             method=request.method,
-            status_code=response.status_code,
+            status_code=status_code,
             latency_ms=duration,
+            **extra,
         )
 
     def _log_request_error(
@@ -308,16 +374,20 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
             exc_info=True,
         )
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and add correlation IDs and timing.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or application in the chain
-
-        Returns:
-            The response with correlation headers added
+            scope: The ASGI connection scope
+            receive: The ASGI receive callable
+            send: The ASGI send callable
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = StarletteRequest(scope)
+
         # Extract request metadata
         metadata = self._extract_request_metadata(request)
 
@@ -327,47 +397,89 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
         # Set request context
         self._set_request_context(request, trace_id, span_id, metadata)
 
+        # Match the route log policy once for the whole request
+        if self.route_policies is not None:
+            decision = self.route_policies.decide(metadata["path"])
+            set_log_decision(decision)
+            request.state.log_decision = decision
+
+        # Hold DEBUG/INFO events until the request outcome is known
+        buffer = None
+        if self.buffer_max_events is not None:
+            buffer = RequestLogBuffer(self.buffer_max_events)
+            bind_request_buffer(buffer)
+
         # Record start time
         start_time = time.perf_counter()
 
-        try:
-            # Process the request
-            response = await call_next(request)
+        # Response state captured from the wrapped send
+        status_code = 500
+        res_size = 0
+        duration = 0.0
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, res_size, duration, response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+
+                # Latency is measured to the start of the response
+                duration = round((time.perf_counter() - start_time) * 1000, 2)
+
+                # Store latency in request.state for exception handler
+                request.state.latency_ms = duration
 
-            # Calculate latency
-            duration = round((time.perf_counter() - start_time) * 1000, 2)
+                # Add correlation headers to response
+                self._add_correlation_headers(
+                    MutableHeaders(scope=message), trace_id, span_id, duration
+                )
+            elif message["type"] == "http.response.body":
+                res_size += len(message.get("body", b""))
 
-            # Calculate response body size
-            res_size = self._calculate_response_size(response)
+            await send(message)
+
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
 
             # Set response metadata context variables
             bind_context(
                 res_bytes=res_size,
-                status_code=response.status_code,
+                status_code=status_code,
                 latency_ms=duration,
             )
 
-            # Store latency in request.state for exception handler
-            request.state.latency_ms = duration
-
-            # Log successful request
-            self._log_request_success(request, response, trace_id, span_id, duration)
+            self._record_request_metrics(
+                scope, metadata["method"], status_code, duration
+            )
 
-            # Add correlation headers to response
-            self._add_correlation_headers(response, trace_id, span_id, duration)
+            if buffer is not None:
+                request.state.buffered_events_dropped = self._finish_request_buffer(
+                    buffer, status_code, start_time
+                )
 
-            return response
+            # Log successful request
+            self._log_request_success(request, status_code, trace_id, span_id, duration)
 
         except Exception as e:
             # Calculate latency even on error
-            duration = round((time.perf_counter() - start_time) * 1000, 2)
+            if not response_started:
+                duration = round((time.perf_counter() - start_time) * 1000, 2)
 
-            # Set response metadata for error case (status 500, no body)
-            bind_context(res_bytes=0, status_code=500, latency_ms=duration)
+            # Set response metadata for error case (status 500)
+            bind_context(res_bytes=res_size, status_code=500, latency_ms=duration)
 
             # Store latency in request.state for exception handler
             request.state.latency_ms = duration
 
+            self._record_request_metrics(scope, metadata["method"], 500, duration)
+
+            # A failed request keeps its full buffered detail
+            if buffer is not None:
+                self._finish_request_buffer(buffer, 500, start_time)
+
             # Log error
             self._log_request_error(request, trace_id, span_id, duration, e)
 
@@ -378,3 +490,5 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
         finally:
             # Always clean up context variables
             clear_context()
+            if self.route_policies is not None:
+                set_log_decision(None)
@@ -1,28 +1,52 @@
 """Monitoring and metrics export for fapilog."""
 
 import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING, Optional
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 if TYPE_CHECKING:
     from .container import LoggingContainer
 
 try:
-    import uvicorn
-    from fastapi import FastAPI, Response
-    from fastapi.responses import PlainTextResponse
+    from starlette.responses import Response
 except ImportError:
-    FastAPI = None
     Response = None
-    PlainTextResponse = None
-    uvicorn = None
 
 
 logger = logging.getLogger(__name__)
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+EXPORTER_MODES = ("thread", "asyncio", "mount")
+
+_HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
 
 class PrometheusExporter:
-    """Prometheus metrics exporter with HTTP endpoint."""
+    """Prometheus metrics exporter with a lightweight HTTP endpoint.
+
+    The endpoint is served in one of three modes:
+
+    - ``thread``: a stdlib ``ThreadingHTTPServer`` on a daemon thread, so
+      scrapes never compete with the application's event loop
+    - ``asyncio``: a minimal HTTP/1.1 responder on ``asyncio.start_server``
+      in the running loop
+    - ``mount``: no server at all; :meth:`mount` adds the route to the
+      application's own Starlette/FastAPI app
+
+    The rendered exposition text is cached for ``cache_ttl`` seconds, so a
+    burst of scrapers triggers a single render.
+    """
 
     def __init__(
         self,
@@ -31,6 +55,8 @@ class PrometheusExporter:
         path: str = "/metrics",
         enabled: bool = True,
         container: Optional["LoggingContainer"] = None,
+        mode: str = "thread",
+        cache_ttl: float = 1.0,
     ):
         """Initialize the Prometheus exporter.
 
@@ -40,98 +66,143 @@ class PrometheusExporter:
             path: HTTP path for metrics endpoint
             enabled: Whether the exporter is enabled
             container: Optional LoggingContainer for metrics collection
+            mode: How the endpoint is served: "thread", "asyncio" or "mount"
+            cache_ttl: Seconds to reuse rendered metrics text (0 disables)
         """
+        if mode not in EXPORTER_MODES:
+            raise ValueError(
+                f"Invalid exporter mode '{mode}'. "
+                f"Must be one of: {', '.join(EXPORTER_MODES)}"
+            )
+
         self.host = host
         self.port = port
         self.path = path
         self.enabled = enabled
+        self.mode = mode
+        self.cache_ttl = cache_ttl
         self._container = container
-        self._app: Optional[FastAPI] = None
-        self._server_task: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._http_server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._mounted = False
 
-        if not enabled:
-            return
-
-        if FastAPI is None:
-            logger.warning(
-                "FastAPI not available. Prometheus exporter disabled. "
-                "Install with: pip install 'fapilog[prometheus]'"
-            )
-            self.enabled = False
-            return
+        # Rendered exposition text shared by all scrapers until it expires
+        self._cache_lock = threading.Lock()
+        self._cached: Optional[Tuple[int, str]] = None
+        self._cached_at = 0.0
 
-        self._setup_app()
+    def render_metrics(self) -> Tuple[int, str]:
+        """Render the metrics exposition text, reusing a fresh cached copy.
 
-    def _setup_app(self) -> None:
-        """Setup the FastAPI application."""
-        if not self.enabled:
-            return
-
-        self._app = FastAPI(
-            title="fapilog Metrics",
-            description="Prometheus metrics for fapilog",
-            version="1.0.0",
-            docs_url=None,
-            redoc_url=None,
-        )
+        Returns:
+            Tuple of (HTTP status code, body)
+        """
+        with self._cache_lock:
+            now = time.monotonic()
+            if self._cached is not None and now - self._cached_at < self.cache_ttl:
+                return self._cached
 
-        @self._app.get(self.path, response_class=PlainTextResponse)
-        async def metrics_endpoint():
-            """Metrics endpoint returning Prometheus format."""
             metrics_collector = (
                 self._container.get_metrics_collector() if self._container else None
             )
             if not metrics_collector or not metrics_collector.is_enabled():
-                return PlainTextResponse(
-                    "# Metrics collection is disabled\n", status_code=503
-                )
+                result = (503, "# Metrics collection is disabled\n")
+            else:
+                try:
+                    result = (200, metrics_collector.get_prometheus_metrics())
+                except Exception as e:
+                    logger.error(f"Error generating Prometheus metrics: {e}")
+                    # Errors are not cached so the next scrape retries
+                    return 500, f"# Error generating metrics: {e}\n"
+
+            self._cached = result
+            self._cached_at = now
+            return result
+
+    def handle_request(self, method: str, path: str) -> Tuple[int, str, str]:
+        """Route a request to the metrics, health or info endpoint.
+
+        Returns:
+            Tuple of (HTTP status code, content type, body)
+        """
+        if method not in ("GET", "HEAD"):
+            return 405, "text/plain; charset=utf-8", "Method not allowed\n"
+
+        path = path.split("?", 1)[0]
+        if path == self.path:
+            status, body = self.render_metrics()
+            return status, PROMETHEUS_CONTENT_TYPE, body
+        if path == "/health":
+            body = json.dumps({"status": "healthy", "metrics_enabled": self.enabled})
+            return 200, "application/json", body
+        if path == "/":
+            body = json.dumps(
+                {
+                    "service": "fapilog-metrics",
+                    "metrics_path": self.path,
+                    "health_path": "/health",
+                }
+            )
+            return 200, "application/json", body
+        return 404, "text/plain; charset=utf-8", "Not found\n"
 
-            try:
-                prometheus_metrics = metrics_collector.get_prometheus_metrics()
-                return PlainTextResponse(prometheus_metrics)
-            except Exception as e:
-                logger.error(f"Error generating Prometheus metrics: {e}")
-                return PlainTextResponse(
-                    f"# Error generating metrics: {e}\n", status_code=500
-                )
+    def mount(self, app: Any) -> None:
+        """Serve the metrics endpoint from an existing Starlette/FastAPI app.
 
-        @self._app.get("/health")
-        async def health_endpoint():
-            """Health check endpoint."""
-            return {"status": "healthy", "metrics_enabled": self.enabled}
+        Args:
+            app: Application exposing ``add_route``
+        """
+        if not self.enabled:
+            return
 
-        @self._app.get("/")
-        async def root_endpoint():
-            """Root endpoint with basic info."""
-            return {
-                "service": "fapilog-metrics",
-                "metrics_path": self.path,
-                "health_path": "/health",
-            }
+        if Response is None:
+            logger.warning(
+                "Starlette not available. Cannot mount metrics endpoint. "
+                "Install with: pip install 'fapilog[fastapi]'"
+            )
+            return
+
+        async def metrics_endpoint(request: Any) -> Any:
+            status, body = self.render_metrics()
+            return Response(
+                body, status_code=status, media_type=PROMETHEUS_CONTENT_TYPE
+            )
+
+        app.add_route(
+            self.path, metrics_endpoint, methods=["GET"], include_in_schema=False
+        )
+        self._mounted = True
+        logger.info(f"Prometheus metrics endpoint mounted at {self.path}")
 
     async def start(self) -> None:
         """Start the Prometheus metrics server."""
-        if not self.enabled or self._app is None:
+        if not self.enabled or self.mode == "mount":
             logger.debug("Prometheus exporter not enabled or not configured")
             return
 
-        if self._server_task is not None and not self._server_task.done():
+        if self.is_running():
             logger.debug("Prometheus exporter already running")
             return
 
         try:
-            # Configure uvicorn to run in the current event loop
-            config = uvicorn.Config(
-                app=self._app,
-                host=self.host,
-                port=self.port,
-                log_level="error",  # Reduce log noise
-                access_log=False,
-            )
-            server = uvicorn.Server(config)
-
-            # Start the server as a background task
-            self._server_task = asyncio.create_task(server.serve())
+            if self.mode == "asyncio":
+                self._server = await asyncio.start_server(
+                    self._handle_connection, self.host, self.port
+                )
+            else:
+                http_server = ThreadingHTTPServer(
+                    (self.host, self.port), _MetricsRequestHandler
+                )
+                http_server.daemon_threads = True
+                http_server.exporter = self  # type: ignore[attr-defined]
+                self._http_server = http_server
+                self._thread = threading.Thread(
+                    target=http_server.serve_forever,
+                    name="fapilog-metrics",
+                    daemon=True,
+                )
+                self._thread.start()
             logger.info(
                 f"Prometheus metrics server started on "
                 f"http://{self.host}:{self.port}{self.path}"
@@ -143,36 +214,112 @@ class PrometheusExporter:
 
     async def stop(self) -> None:
         """Stop the Prometheus metrics server."""
-        if self._server_task is None:
+        if self._server is None and self._http_server is None:
             return
 
-        if not self._server_task.done():
-            self._server_task.cancel()
-            try:
-                await self._server_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.error(f"Error stopping Prometheus metrics server: {e}")
+        try:
+            if self._server is not None:
+                self._server.close()
+                await self._server.wait_closed()
+            if self._http_server is not None:
+                # shutdown() blocks until serve_forever notices; keep it off the loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._http_server.shutdown)
+                self._http_server.server_close()
+                if self._thread is not None:
+                    self._thread.join(timeout=1.0)
+        except Exception as e:
+            logger.error(f"Error stopping Prometheus metrics server: {e}")
 
-        self._server_task = None
+        self._server = None
+        self._http_server = None
+        self._thread = None
         logger.info("Prometheus metrics server stopped")
 
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer a single HTTP request on an asyncio stream and close it."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Skip the request headers; the endpoints take no input
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2:
+                status, content_type, body = 400, "text/plain", "Bad request\n"
+                method = "GET"
+            else:
+                method = parts[0]
+                status, content_type, body = self.handle_request(method, parts[1])
+
+            payload = body.encode("utf-8")
+            head = (
+                f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            writer.write(head if method == "HEAD" else head + payload)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.debug(f"Error serving metrics request: {e}")
+        finally:
+            writer.close()
+
     def is_running(self) -> bool:
-        """Check if the metrics server is running."""
-        return (
-            self.enabled
-            and self._server_task is not None
-            and not self._server_task.done()
-        )
+        """Check if the metrics endpoint is being served."""
+        if not self.enabled:
+            return False
+        if self._server is not None and self._server.is_serving():
+            return True
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        return self._mounted
 
     def get_metrics_url(self) -> Optional[str]:
-        """Get the full URL for the metrics endpoint."""
+        """Get the full URL for the metrics endpoint.
+
+        In ``mount`` mode only the path is known, so the path is returned.
+        """
         if not self.enabled:
             return None
+        if self.mode == "mount":
+            return self.path
         return f"http://{self.host}:{self.port}{self.path}"
 
 
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for the threaded metrics server."""
+
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self) -> None:
+        self._respond(head_only=False)
+
+    def do_HEAD(self) -> None:
+        self._respond(head_only=True)
+
+    def _respond(self, head_only: bool) -> None:
+        exporter: PrometheusExporter = self.server.exporter  # type: ignore[attr-defined]
+        status, content_type, body = exporter.handle_request(self.command, self.path)
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence the default per-request stderr logging."""
+
+
 # Global Prometheus exporter instance
 _prometheus_exporter: Optional[PrometheusExporter] = None
 
@@ -193,6 +340,8 @@ def create_prometheus_exporter(
     port: int = 8000,
     path: str = "/metrics",
     enabled: bool = True,
+    mode: str = "thread",
+    cache_ttl: float = 1.0,
 ) -> PrometheusExporter:
     """Create and set a new global Prometheus exporter."""
     exporter = PrometheusExporter(
@@ -200,6 +349,8 @@ def create_prometheus_exporter(
         port=port,
         path=path,
         enabled=enabled,
+        mode=mode,
+        cache_ttl=cache_ttl,
     )
     set_prometheus_exporter(exporter)
     return exporter
@@ -270,12 +421,15 @@ def get_metrics_dict() -> dict:
     return {"_note": "Metrics collection disabled - use container-scoped access"}
 
 
-def get_processor_performance_stats() -> dict:
+def get_processor_performance_stats(container: Optional[Any] = None) -> dict:
     """Get processor performance statistics.
 
-    Note: This function uses a per-call ProcessorMetrics instance and will
-    return empty stats unless processors have been wrapped with metrics collection.
-    For container-scoped metrics, use container.get_processor_metrics().get_all_stats().
+    With a container, the per-thread buffers of the container's
+    ProcessorMetrics are merged on read. Without one, this uses a per-call
+    ProcessorMetrics instance and returns empty stats.
+
+    Args:
+        container: Optional LoggingContainer whose processor metrics to read
 
     Returns:
         Dictionary containing performance stats for all processors
@@ -283,6 +437,9 @@ def get_processor_performance_stats() -> dict:
     try:
         from ._internal.processor_metrics import ProcessorMetrics
 
+        if container is not None:
+            return container.get_processor_metrics().get_all_stats()
+
         # Create a new instance per call to avoid global state
         # This will return empty stats since metrics aren't shared
         metrics = ProcessorMetrics()
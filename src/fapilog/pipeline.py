@@ -1,6 +1,6 @@
 """Default processor pipeline for fapilog structured logging."""
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import structlog
 
@@ -25,6 +25,8 @@ from ._internal.processors import (
     SamplingProcessor,
     ThrottleProcessor,
 )
+from ._internal.request_buffer import RequestBufferProcessor
+from ._internal.route_policy import route_policy_processor
 from .redactors import field_redactor
 from .settings import LoggingSettings
 
@@ -46,6 +48,34 @@ def _create_safe_processor(
     return create_simple_processor_wrapper(processor)
 
 
+def _count_drops(
+    processor: Any, container: Optional["LoggingContainer"], reason: str
+) -> Any:
+    """Record events a processor drops in the container's drop ledger.
+
+    Args:
+        processor: Processor callable in the structlog chain
+        container: Container owning the drop ledger; without one the
+            processor is returned unchanged
+        reason: Drop reason to record when the processor returns None
+
+    Returns:
+        The processor, wrapped to count the events it drops
+    """
+    if container is None:
+        return processor
+
+    def counted(
+        logger: Any, method_name: str, event_dict: Any
+    ) -> Optional[Dict[str, Any]]:
+        result = processor(logger, method_name, event_dict)
+        if result is None and event_dict is not None:
+            container.get_drop_ledger().record(reason)
+        return result
+
+    return counted
+
+
 def build_processor_chain(
     settings: LoggingSettings,
     pretty: bool = False,
@@ -64,6 +94,10 @@ def build_processor_chain(
     """
     processors = []
 
+    # 0. Route log policies - first so dropped events skip all later work
+    if settings.route_log_policies:
+        processors.append(route_policy_processor)
+
     # 1. Add log level
     processors.append(structlog.processors.add_log_level)
 
@@ -137,7 +171,11 @@ def build_processor_chain(
         if container is not None:
             throttle_config["container"] = container
         throttle_processor = ThrottleProcessor(**throttle_config)
-        processors.append(_create_safe_processor(throttle_processor))
+        processors.append(
+            _count_drops(
+                _create_safe_processor(throttle_processor), container, "throttled"
+            )
+        )
 
     # 15. Deduplication processor - class-based with error handling (if enabled)
     if settings.enable_deduplication:
@@ -150,11 +188,15 @@ def build_processor_chain(
         if container is not None:
             dedupe_config["container"] = container
         dedupe_processor = DeduplicationProcessor(**dedupe_config)
-        processors.append(_create_safe_processor(dedupe_processor))
+        processors.append(
+            _count_drops(_create_safe_processor(dedupe_processor), container, "deduped")
+        )
 
     # 16. Sampling processor - class-based with error handling
     sampling_processor = SamplingProcessor(rate=settings.sampling_rate)
-    processors.append(_create_safe_processor(sampling_processor))
+    processors.append(
+        _count_drops(_create_safe_processor(sampling_processor), container, "sampled")
+    )
 
     # 17. Filter None processor - class-based with error handling
     filter_processor = FilterNoneProcessor()
@@ -184,4 +226,9 @@ def build_processor_chain(
             renderer = structlog.processors.JSONRenderer()
         processors.append(renderer)
 
+    # 19. Request log buffer - just before the queue sink or renderer, which
+    # buffered events are replayed through when the buffer is flushed
+    if settings.request_buffer_enabled:
+        processors.insert(-1, RequestBufferProcessor(processors[-1:]))
+
     return processors
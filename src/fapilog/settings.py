@@ -1,10 +1,12 @@
 """Configuration settings for fapilog."""
 
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ._internal.histogram import DEFAULT_LATENCY_BUCKETS_MS
+from ._internal.route_policy import RoutePolicy
 from .exceptions import ConfigurationError
 
 # Forward declaration to avoid circular imports
@@ -66,10 +68,29 @@ class LoggingSettings(BaseSettings):
         default=1000,
         description="Maximum size of the async log queue",
     )
-    queue_overflow: Literal["drop", "block", "sample"] = Field(
+    queue_max_bytes: int = Field(
+        default=0,
+        description="Budget of estimated event bytes the queue may hold; "
+        "events that would exceed it are handled by queue_overflow (0 bounds "
+        "the queue by queue_maxsize only)",
+    )
+    queue_priority_size: int = Field(
+        default=0,
+        description="Slots of a separate high-priority queue lane for ERROR "
+        "and CRITICAL events, drained first and evicting lower-priority events "
+        "when full (0 disables)",
+    )
+    queue_overflow: Literal["drop", "block", "sample", "adaptive"] = Field(
         default="drop",
         description="Strategy for handling queue overflow: drop (discard), "
-        "block (wait), or sample (probabilistic)",
+        "block (wait), sample (probabilistic) or adaptive (shed DEBUG and INFO "
+        "as the queue backs up)",
+    )
+    queue_block_timeout: float = Field(
+        default=1.0,
+        description="Maximum time a caller on another thread blocks waiting "
+        "for queue space under the block strategy before its event is dropped "
+        "(seconds, 0 never blocks)",
     )
     queue_batch_size: int = Field(
         default=10,
@@ -79,6 +100,29 @@ class LoggingSettings(BaseSettings):
         default=1.0,
         description="Maximum time to wait for batch completion (seconds)",
     )
+    queue_adaptive_batching: bool = Field(
+        default=False,
+        description="Tune the batch size and flush timeout from queue depth "
+        "and sink time per event instead of using queue_batch_size",
+    )
+    queue_batch_size_min: int = Field(
+        default=1,
+        description="Smallest batch size under adaptive batching",
+    )
+    queue_batch_size_max: int = Field(
+        default=1000,
+        description="Largest batch size under adaptive batching",
+    )
+    queue_flush_timeout_min: float = Field(
+        default=0.0,
+        description="Shortest time a partial batch waits for more events under "
+        "adaptive batching (seconds)",
+    )
+    queue_flush_timeout_max: float = Field(
+        default=0.05,
+        description="Longest time a partial batch waits for more events under "
+        "adaptive batching (seconds)",
+    )
     queue_retry_delay: float = Field(
         default=1.0,
         description="Delay between retries on sink failures (seconds)",
@@ -87,6 +131,77 @@ class LoggingSettings(BaseSettings):
         default=3,
         description="Maximum number of retries per event",
     )
+    sink_queue_size: int = Field(
+        default=0,
+        description="Per-sink queue size; when positive each sink gets its own "
+        "bounded queue, consumer task and retries (0 writes to all sinks "
+        "together)",
+    )
+    sink_queue_overflow: Literal["drop", "drop_oldest"] = Field(
+        default="drop",
+        description="Policy when a sink's queue is full: drop (discard the new "
+        "event) or drop_oldest (discard the oldest buffered event)",
+    )
+    sink_circuit_breaker_threshold: int = Field(
+        default=0,
+        description="Consecutive write failures after which a sink's circuit "
+        "breaker opens and its writes fail fast (0 disables)",
+    )
+    sink_circuit_breaker_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds an open sink circuit breaker waits before "
+        "probing the sink with a single write",
+    )
+    spill_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for disk spill stores; when set, events beyond "
+        "the spill watermark of the queue or a sink queue are written to disk "
+        "and replayed later instead of being dropped",
+    )
+    spill_watermark: float = Field(
+        default=0.8,
+        description="Fraction of a queue's size at which new events spill to disk",
+    )
+    spill_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum unreplayed bytes per spill store",
+    )
+    spill_replay_rate: float = Field(
+        default=1000.0,
+        description="Maximum events per second replayed from each spill store "
+        "(0 for no limit)",
+    )
+    queue_dedicated_thread: bool = Field(
+        default=False,
+        description="Run the queue worker and sinks on a dedicated daemon "
+        "thread with its own event loop instead of the application loop",
+    )
+    shipper_socket: Optional[str] = Field(
+        default=None,
+        description="Unix socket of a local log shipper process; when set, "
+        "events are forwarded to it and the sinks are used only as a fallback",
+    )
+    shipper_spawn: bool = Field(
+        default=False,
+        description="Start a shipper process on shipper_socket if none is "
+        "running when the container is configured or a reconnect fails; it "
+        "receives these settings (URI sinks only) and outlives the worker",
+    )
+    shipper_reconnect_interval: float = Field(
+        default=5.0,
+        description="Seconds between attempts to reconnect to the log shipper "
+        "while writing to the fallback sinks",
+    )
+    drop_summary_interval: float = Field(
+        default=60.0,
+        description="Seconds between summary events reporting dropped log "
+        "events by reason (0 disables the summary)",
+    )
+    async_enricher_timeout: float = Field(
+        default=0.5,
+        description="Per-batch deadline for async batch enrichers run by the "
+        "queue worker (seconds)",
+    )
     enable_resource_metrics: bool = Field(
         default=False,
         description="Enable memory and CPU usage metrics in log entries",
@@ -167,6 +282,16 @@ class LoggingSettings(BaseSettings):
         description="Number of recent samples to keep for averaging "
         "metrics (default: 100)",
     )
+    metrics_histogram_buckets: Union[List[float], str] = Field(
+        default_factory=lambda: list(DEFAULT_LATENCY_BUCKETS_MS),
+        description="Latency histogram bucket upper bounds in milliseconds "
+        "(comma-separated or list, strictly increasing)",
+    )
+    metrics_top_k: int = Field(
+        default=50,
+        description="Number of levels, logger names and event names whose "
+        "event and byte volume is tracked",
+    )
     metrics_prometheus_enabled: bool = Field(
         default=False,
         description="Enable Prometheus metrics exporter (default: False)",
@@ -179,6 +304,31 @@ class LoggingSettings(BaseSettings):
         default="0.0.0.0",
         description="Host for Prometheus metrics HTTP endpoint (default: 0.0.0.0)",
     )
+    loop_lag_monitor_enabled: bool = Field(
+        default=False,
+        description="Probe event loop scheduling delay and export it as a "
+        "histogram (requires metrics_enabled)",
+    )
+    loop_lag_monitor_interval: float = Field(
+        default=0.1,
+        description="Seconds between event loop lag probes",
+    )
+    metrics_prometheus_mode: Literal["thread", "asyncio", "mount"] = Field(
+        default="thread",
+        description="How the metrics endpoint is served: thread (stdlib HTTP "
+        "server thread), asyncio (server in the app's loop) or mount (route on "
+        "the app passed to configure)",
+    )
+    metrics_prometheus_cache_ttl: float = Field(
+        default=1.0,
+        description="Seconds to reuse rendered metrics text across scrapes "
+        "(0 disables caching)",
+    )
+    processor_metrics_sample_every: int = Field(
+        default=1,
+        description="Profile latency and event size of one in N processor "
+        "executions (1 profiles every execution)",
+    )
     # Validation settings
     enable_validation: bool = Field(
         default=False,
@@ -196,6 +346,31 @@ class LoggingSettings(BaseSettings):
         default_factory=dict,
         description="Expected types for specific fields (field -> type mapping)",
     )
+    # Route log policy settings
+    route_log_policies: Union[Dict[str, str], str] = Field(
+        default_factory=dict,
+        description="Per-route log policies (pattern -> spec mapping, or "
+        "comma-separated pattern=spec pairs, e.g. '/health=suppress')",
+    )
+    # Tail-based request log buffering settings
+    request_buffer_enabled: bool = Field(
+        default=False,
+        description="Buffer DEBUG/INFO events per request and emit them only "
+        "for failed, 5xx or slow requests",
+    )
+    request_buffer_max_events: int = Field(
+        default=200,
+        description="Maximum number of events buffered per request",
+    )
+    request_buffer_slow_ms: float = Field(
+        default=1000.0,
+        description="Request latency (ms) at or above which the buffer is flushed",
+    )
+    access_log_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction of non-5xx requests that emit the access log "
+        "(0.0 disables it; latency is still recorded in request histograms)",
+    )
     # Processor metrics settings
     enable_processor_metrics: bool = Field(
         default=False,
@@ -319,6 +494,42 @@ class LoggingSettings(BaseSettings):
             )
         return v
 
+    @field_validator("queue_max_bytes")
+    @classmethod
+    def validate_queue_max_bytes(cls, v: int) -> int:
+        if v < 0:
+            raise ConfigurationError(
+                "Queue max bytes must be non-negative",
+                "queue_max_bytes",
+                v,
+                "non-negative integer",
+            )
+        return v
+
+    @field_validator("queue_priority_size")
+    @classmethod
+    def validate_queue_priority_size(cls, v: int) -> int:
+        if v < 0:
+            raise ConfigurationError(
+                "Queue priority size must be non-negative",
+                "queue_priority_size",
+                v,
+                "non-negative integer",
+            )
+        return v
+
+    @field_validator("queue_block_timeout")
+    @classmethod
+    def validate_queue_block_timeout(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Queue block timeout must be non-negative",
+                "queue_block_timeout",
+                v,
+                "non-negative float",
+            )
+        return v
+
     @field_validator("queue_batch_size")
     @classmethod
     def validate_queue_batch_size(cls, v: int) -> int:
@@ -343,6 +554,56 @@ class LoggingSettings(BaseSettings):
             )
         return v
 
+    @field_validator("queue_batch_size_min")
+    @classmethod
+    def validate_queue_batch_size_min(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigurationError(
+                "Minimum batch size must be positive",
+                "queue_batch_size_min",
+                v,
+                "positive integer",
+            )
+        return v
+
+    @field_validator("queue_batch_size_max")
+    @classmethod
+    def validate_queue_batch_size_max(cls, v: int, info: ValidationInfo) -> int:
+        minimum = info.data.get("queue_batch_size_min", 1)
+        if v < minimum:
+            raise ConfigurationError(
+                "Maximum batch size must not be below the minimum",
+                "queue_batch_size_max",
+                v,
+                f"integer >= queue_batch_size_min ({minimum})",
+            )
+        return v
+
+    @field_validator("queue_flush_timeout_min")
+    @classmethod
+    def validate_queue_flush_timeout_min(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Minimum flush timeout must be non-negative",
+                "queue_flush_timeout_min",
+                v,
+                "non-negative float",
+            )
+        return v
+
+    @field_validator("queue_flush_timeout_max")
+    @classmethod
+    def validate_queue_flush_timeout_max(cls, v: float, info: ValidationInfo) -> float:
+        minimum = info.data.get("queue_flush_timeout_min", 0.0)
+        if v < minimum:
+            raise ConfigurationError(
+                "Maximum flush timeout must not be below the minimum",
+                "queue_flush_timeout_max",
+                v,
+                f"float >= queue_flush_timeout_min ({minimum})",
+            )
+        return v
+
     @field_validator("queue_retry_delay")
     @classmethod
     def validate_queue_retry_delay(cls, v: float) -> float:
@@ -367,10 +628,118 @@ class LoggingSettings(BaseSettings):
             )
         return v
 
+    @field_validator("sink_queue_size")
+    @classmethod
+    def validate_sink_queue_size(cls, v: int) -> int:
+        if v < 0:
+            raise ConfigurationError(
+                "Sink queue size must be non-negative",
+                "sink_queue_size",
+                v,
+                "non-negative integer",
+            )
+        return v
+
+    @field_validator("sink_circuit_breaker_threshold")
+    @classmethod
+    def validate_sink_circuit_breaker_threshold(cls, v: int) -> int:
+        if v < 0:
+            raise ConfigurationError(
+                "Sink circuit breaker threshold must be non-negative",
+                "sink_circuit_breaker_threshold",
+                v,
+                "non-negative integer",
+            )
+        return v
+
+    @field_validator("sink_circuit_breaker_reset_timeout")
+    @classmethod
+    def validate_sink_circuit_breaker_reset_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ConfigurationError(
+                "Sink circuit breaker reset timeout must be positive",
+                "sink_circuit_breaker_reset_timeout",
+                v,
+                "positive float",
+            )
+        return v
+
+    @field_validator("spill_watermark")
+    @classmethod
+    def validate_spill_watermark(cls, v: float) -> float:
+        if not 0.0 < v <= 1.0:
+            raise ConfigurationError(
+                "Spill watermark must be in (0, 1]",
+                "spill_watermark",
+                v,
+                "float greater than 0.0 and at most 1.0",
+            )
+        return v
+
+    @field_validator("spill_max_bytes")
+    @classmethod
+    def validate_spill_max_bytes(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigurationError(
+                "Spill max bytes must be positive",
+                "spill_max_bytes",
+                v,
+                "positive integer",
+            )
+        return v
+
+    @field_validator("spill_replay_rate")
+    @classmethod
+    def validate_spill_replay_rate(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Spill replay rate must be non-negative",
+                "spill_replay_rate",
+                v,
+                "non-negative float",
+            )
+        return v
+
+    @field_validator("shipper_reconnect_interval")
+    @classmethod
+    def validate_shipper_reconnect_interval(cls, v: float) -> float:
+        if v <= 0:
+            raise ConfigurationError(
+                "Shipper reconnect interval must be positive",
+                "shipper_reconnect_interval",
+                v,
+                "positive float",
+            )
+        return v
+
+    @field_validator("drop_summary_interval")
+    @classmethod
+    def validate_drop_summary_interval(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Drop summary interval must be non-negative",
+                "drop_summary_interval",
+                v,
+                "non-negative float",
+            )
+        return v
+
+    @field_validator("async_enricher_timeout")
+    @classmethod
+    def validate_async_enricher_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ConfigurationError(
+                "Async enricher timeout must be positive",
+                "async_enricher_timeout",
+                v,
+                "positive float",
+            )
+        return v
+
     @field_validator("queue_overflow")
     @classmethod
     def validate_queue_overflow(cls, v: str) -> str:
-        valid_strategies = {"drop", "block", "sample"}
+        valid_strategies = {"drop", "block", "sample", "adaptive"}
         if v.lower() not in valid_strategies:
             valid_list = ", ".join(sorted(valid_strategies))
             raise ConfigurationError(
@@ -415,6 +784,142 @@ class LoggingSettings(BaseSettings):
             return result
         return dict(v) if isinstance(v, dict) else {}
 
+    @field_validator("route_log_policies", mode="before")
+    @classmethod
+    def parse_route_log_policies(cls, v: Any) -> Dict[str, str]:
+        if isinstance(v, str):
+            # Parse comma-separated pattern=spec pairs
+            result = {}
+            for item in v.split(","):
+                if "=" in item:
+                    pattern, spec = item.split("=", 1)
+                    result[pattern.strip()] = spec.strip()
+            v = result
+        if not isinstance(v, dict):
+            raise ConfigurationError(
+                "Route log policies must be a mapping of pattern to spec",
+                "route_log_policies",
+                v,
+                "dict or comma-separated pattern=spec pairs",
+            )
+        # Validate every spec up front so bad policies fail at configuration
+        for pattern, spec in v.items():
+            RoutePolicy.parse(pattern, spec)
+        return {str(pattern).strip(): spec for pattern, spec in v.items()}
+
+    @field_validator("metrics_histogram_buckets", mode="before")
+    @classmethod
+    def parse_metrics_histogram_buckets(cls, v: Any) -> List[float]:
+        if isinstance(v, str):
+            v = [item.strip() for item in v.split(",") if item.strip()]
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        try:
+            buckets = [float(item) for item in v]
+        except (TypeError, ValueError):
+            raise ConfigurationError(
+                "Histogram buckets must be numbers",
+                "metrics_histogram_buckets",
+                v,
+                "list of positive numbers",
+            ) from None
+        if (
+            not buckets
+            or buckets[0] <= 0
+            or any(lower >= upper for lower, upper in zip(buckets, buckets[1:]))
+        ):
+            raise ConfigurationError(
+                "Histogram buckets must be positive and strictly increasing",
+                "metrics_histogram_buckets",
+                v,
+                "non-empty, strictly increasing list of positive numbers",
+            )
+        return buckets
+
+    @field_validator("loop_lag_monitor_interval")
+    @classmethod
+    def validate_loop_lag_monitor_interval(cls, v: float) -> float:
+        if v <= 0:
+            raise ConfigurationError(
+                "Loop lag monitor interval must be positive",
+                "loop_lag_monitor_interval",
+                v,
+                "positive float",
+            )
+        return v
+
+    @field_validator("metrics_prometheus_cache_ttl")
+    @classmethod
+    def validate_metrics_prometheus_cache_ttl(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Metrics cache TTL must be non-negative",
+                "metrics_prometheus_cache_ttl",
+                v,
+                "non-negative float",
+            )
+        return v
+
+    @field_validator("metrics_top_k")
+    @classmethod
+    def validate_metrics_top_k(cls, v: int) -> int:
+        if v < 1:
+            raise ConfigurationError(
+                "Metrics top-K must be at least 1",
+                "metrics_top_k",
+                v,
+                "integer >= 1",
+            )
+        return v
+
+    @field_validator("processor_metrics_sample_every")
+    @classmethod
+    def validate_processor_metrics_sample_every(cls, v: int) -> int:
+        if v < 1:
+            raise ConfigurationError(
+                "Processor metrics sample interval must be at least 1",
+                "processor_metrics_sample_every",
+                v,
+                "integer >= 1",
+            )
+        return v
+
+    @field_validator("access_log_sample_rate")
+    @classmethod
+    def validate_access_log_sample_rate(cls, v: float) -> float:
+        if not 0.0 <= v <= 1.0:
+            raise ConfigurationError(
+                "Access log sample rate must be between 0.0 and 1.0",
+                "access_log_sample_rate",
+                v,
+                "float between 0.0 and 1.0",
+            )
+        return v
+
+    @field_validator("request_buffer_max_events")
+    @classmethod
+    def validate_request_buffer_max_events(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigurationError(
+                "Request buffer max events must be positive",
+                "request_buffer_max_events",
+                v,
+                "positive integer",
+            )
+        return v
+
+    @field_validator("request_buffer_slow_ms")
+    @classmethod
+    def validate_request_buffer_slow_ms(cls, v: float) -> float:
+        if v < 0:
+            raise ConfigurationError(
+                "Request buffer slow threshold must be non-negative",
+                "request_buffer_slow_ms",
+                v,
+                "non-negative number",
+            )
+        return v
+
     @field_validator("processor_metrics_reset_interval")
     @classmethod
     def validate_processor_metrics_reset_interval(cls, v: int) -> int:
@@ -0,0 +1,242 @@
+"""Out-of-process log shipper for multi-worker deployments.
+
+When several worker processes run on one host, each would otherwise hold
+its own queue, sink connections and batches. In shipper mode the workers
+send their events over a Unix domain socket (see ``ShipperSink``) to one
+``LogShipper`` process, which owns the configured sinks, batching and
+retries.
+
+Run standalone with::
+
+    python -m fapilog.shipper --socket /run/fapilog.sock
+
+The shipper reads its sinks and queue settings from the usual ``FAPILOG_``
+environment variables. When ``LoggingContainer`` spawns it
+(``shipper_spawn``), the container's settings are passed to the child in
+``FAPILOG_SHIPPER_SETTINGS`` instead.
+"""
+
+import argparse
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+from typing import IO, List, Optional, Set
+
+from .container import LoggingContainer
+from .exceptions import ConfigurationError
+from .settings import LoggingSettings
+
+logger = logging.getLogger(__name__)
+
+# Largest single event line accepted from a worker
+_MAX_LINE_BYTES = 16 * 1024 * 1024
+
+# Environment variable carrying a spawning container's settings as JSON
+SETTINGS_ENV = "FAPILOG_SHIPPER_SETTINGS"
+
+
+def shipper_available(socket_path: str) -> bool:
+    """Check whether a shipper is accepting connections on ``socket_path``."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _settings_json(settings: LoggingSettings) -> str:
+    """Serialize settings for a spawned shipper.
+
+    Sink instances live in the calling process and cannot be passed on;
+    only sinks given as URIs are kept.
+    """
+    sinks = [sink for sink in settings.sinks if isinstance(sink, str)]
+    if len(sinks) != len(settings.sinks):
+        logger.warning(
+            "Sink instances cannot be passed to a spawned log shipper; "
+            "it writes only to the sinks configured by URI"
+        )
+    payload = settings.model_dump(mode="json", exclude={"sinks"})
+    payload["sinks"] = sinks
+    return json.dumps(payload)
+
+
+def spawn_shipper(
+    socket_path: str, settings: Optional[LoggingSettings] = None
+) -> subprocess.Popen:
+    """Start a shipper process for ``socket_path`` in a new session.
+
+    Args:
+        socket_path: Path of the Unix domain socket the shipper listens on
+        settings: Sinks and queue settings for the shipper, passed to the
+            child in ``FAPILOG_SHIPPER_SETTINGS``; if None the child reads
+            its settings from the inherited ``FAPILOG_`` environment
+
+    Returns:
+        The shipper process; it keeps running after the caller exits
+        until it is sent SIGTERM
+    """
+    env = None
+    if settings is not None:
+        env = {**os.environ, SETTINGS_ENV: _settings_json(settings)}
+    return subprocess.Popen(
+        [sys.executable, "-m", "fapilog.shipper", "--socket", socket_path],
+        stdin=subprocess.DEVNULL,
+        env=env,
+        start_new_session=True,
+    )
+
+
+class LogShipper:
+    """Receive events from worker processes and write them to the sinks."""
+
+    def __init__(
+        self, socket_path: str, settings: Optional[LoggingSettings] = None
+    ) -> None:
+        """Initialize the shipper.
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+            settings: Sinks and queue settings; created from the environment
+                if None. Shipper settings are ignored so the shipper writes
+                to the sinks itself, and events are not sampled again after
+                the workers sampled them.
+        """
+        settings = settings or LoggingSettings()
+        self.socket_path = socket_path
+        self.settings = settings.model_copy(
+            update={
+                "queue_enabled": True,
+                "shipper_socket": None,
+                "sampling_rate": 1.0,
+            }
+        )
+        self._container = LoggingContainer(self.settings)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._lock_file: Optional[IO[str]] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self.events_received = 0
+
+    async def start(self) -> None:
+        """Start the sinks' queue worker and listen on the socket.
+
+        Raises:
+            ConfigurationError: If another shipper already owns the socket
+        """
+        # Held for the shipper's lifetime; the kernel releases it on exit
+        lock_file = open(f"{self.socket_path}.lock", "w")  # noqa: SIM115
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise ConfigurationError(
+                "A log shipper is already running for this socket",
+                "shipper_socket",
+                self.socket_path,
+                "a socket path not in use",
+            ) from None
+        self._lock_file = lock_file
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # Left behind by a dead shipper
+
+        self._container.configure()
+        await self._container.queue_worker.start()  # type: ignore[union-attr]
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path, limit=_MAX_LINE_BYTES
+        )
+        logger.info(f"Log shipper listening on {self.socket_path}")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Queue each event line sent by one worker process."""
+        if self._server is None:
+            writer.close()  # Accepted while stopping
+            return
+        worker = self._container.queue_worker
+        self._connections.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    logger.warning("Log shipper discarded a malformed event")
+                    continue
+                # Overflow, spill and drop accounting follow the shipper's
+                # queue settings; with the block strategy, waiting for space
+                # pushes back on the worker's socket writes
+                await worker.enqueue(event)  # type: ignore[union-attr]
+                self.events_received += 1
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Log shipper connection error: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def stop(self) -> None:
+        """Stop listening, then drain the queue into the sinks."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            # Workers keep their connections open; end them so handlers exit
+            for writer in list(self._connections):
+                writer.close()
+            await server.wait_closed()
+        await self._container.shutdown()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def serve_forever(self) -> None:
+        """Run until SIGINT or SIGTERM, then stop."""
+        await self.start()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            await stop.wait()
+        finally:
+            await self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for a standalone shipper."""
+    parser = argparse.ArgumentParser(
+        prog="python -m fapilog.shipper",
+        description="Ship log events from local worker processes to the sinks.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("FAPILOG_SHIPPER_SOCKET"),
+        help="Unix socket path (default: $FAPILOG_SHIPPER_SOCKET)",
+    )
+    args = parser.parse_args(argv)
+    if not args.socket:
+        parser.error("--socket or FAPILOG_SHIPPER_SOCKET is required")
+
+    settings_json = os.environ.get(SETTINGS_ENV)
+    settings = LoggingSettings(**json.loads(settings_json)) if settings_json else None
+    try:
+        asyncio.run(LogShipper(args.socket, settings).serve_forever())
+    except ConfigurationError as e:
+        # Another worker's shipper won the race for the socket
+        logger.info(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Available sinks:
 - StdoutSink: Outputs logs to stdout with configurable formatting
 - FileSink: Outputs logs to files with rotation support
 - LokiSink: Outputs logs to Grafana Loki for centralized logging
+- ShipperSink: Forwards logs to a local shipper process over a Unix socket
 
 Sinks are automatically configured based on the 'sinks' setting in LoggingSettings.
 """
@@ -15,12 +16,14 @@ Sinks are automatically configured based on the 'sinks' setting in LoggingSettin
 from .base import Sink
 from .file import FileSink, create_file_sink_from_uri
 from .loki import LokiSink, create_loki_sink_from_uri
+from .shipper import ShipperSink
 from .stdout import StdoutSink
 
 __all__ = [
     "Sink",
     "FileSink",
     "LokiSink",
+    "ShipperSink",
     "StdoutSink",
     "create_file_sink_from_uri",
     "create_loki_sink_from_uri",
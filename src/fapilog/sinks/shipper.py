@@ -0,0 +1,172 @@
+"""Sink that forwards log events to a local shipper process."""
+
+import asyncio
+import inspect
+import logging
+import subprocess
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .._internal.utils import safe_json_serialize
+from .base import Sink
+
+if TYPE_CHECKING:
+    from ..container import LoggingContainer
+
+logger = logging.getLogger(__name__)
+
+
+class ShipperSink(Sink):
+    """Sink that sends events to a ``LogShipper`` over a Unix domain socket.
+
+    Events are written as newline-delimited JSON. Writes go straight to the
+    socket and only wait when the transport's buffer is over its high-water
+    mark, which pushes back on the queue worker if the shipper falls behind.
+    While the shipper is unreachable, events go to the
+    ``fallback_sinks`` and the connection is retried every
+    ``reconnect_interval`` seconds. With ``spawn`` set, a failed attempt
+    also starts a new shipper, so the shared shipper is restarted by
+    whichever worker notices it is gone first.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        fallback_sinks: Optional[List[Sink]] = None,
+        reconnect_interval: float = 5.0,
+        container: Optional["LoggingContainer"] = None,
+        spawn: bool = False,
+    ) -> None:
+        """Initialize the shipper sink.
+
+        Args:
+            socket_path: Path of the shipper's Unix domain socket
+            fallback_sinks: Sinks written in-process while the shipper is
+                unavailable
+            reconnect_interval: Seconds between connection attempts
+            container: Optional LoggingContainer for metrics collection;
+                its settings are passed to a spawned shipper
+            spawn: Start a shipper process when none is running
+        """
+        super().__init__(container=container)
+        self.socket_path = socket_path
+        self.fallback_sinks = list(fallback_sinks or [])
+        self.reconnect_interval = reconnect_interval
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._retry_at = 0.0
+        self.spawn = spawn
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def connected(self) -> bool:
+        """Check whether the sink has an open connection to the shipper."""
+        return self._writer is not None
+
+    async def write(self, event_dict: Dict[str, Any]) -> None:
+        """Send a log event to the shipper, or to the fallback sinks.
+
+        Args:
+            event_dict: The structured log event dictionary
+        """
+        writer = await self._connection()
+        if writer is not None:
+            try:
+                writer.write(safe_json_serialize(event_dict).encode("utf-8") + b"\n")
+                await writer.drain()
+                return
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Lost connection to log shipper: {e}")
+                self._disconnect()
+
+        for sink in self.fallback_sinks:
+            await sink.write(event_dict)
+
+    def start_shipper(self) -> None:
+        """Start a shipper on ``socket_path`` unless one is running.
+
+        The shipper runs in its own session and is shared by every worker
+        on the socket, so it is never stopped here. If several workers
+        start one at once, the lock file leaves a single shipper serving
+        the socket and the others exit.
+        """
+        from ..shipper import shipper_available, spawn_shipper
+
+        if self._process is not None:
+            if self._process.poll() is None:
+                # Ours is still starting up or holds the socket
+                return
+            self._process = None
+        if shipper_available(self.socket_path):
+            return
+        settings = self._container.settings if self._container else None
+        try:
+            self._process = spawn_shipper(self.socket_path, settings)
+        except Exception as e:
+            # Keep logging through the fallback sinks
+            logger.warning(f"Failed to start log shipper: {e}")
+
+    async def _connection(self) -> Optional[asyncio.StreamWriter]:
+        """Return the open connection, reconnecting when the retry is due."""
+        if self._writer is not None:
+            if not self._writer.is_closing() and not self._reader.at_eof():  # type: ignore[union-attr]
+                return self._writer
+            self._disconnect()
+
+        now = time.monotonic()
+        if now < self._retry_at:
+            return None
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.socket_path
+            )
+        except (OSError, NotImplementedError) as e:
+            if self._retry_at == 0.0:
+                logger.warning(
+                    f"Log shipper unavailable at {self.socket_path}, "
+                    f"writing to fallback sinks: {e}"
+                )
+            self._retry_at = now + self.reconnect_interval
+            if self.spawn:
+                self.start_shipper()
+            return None
+        return self._writer
+
+    def _disconnect(self) -> None:
+        writer = self._writer
+        self._reader = self._writer = None
+        self._retry_at = time.monotonic() + self.reconnect_interval
+        if writer is not None:
+            writer.close()
+
+    async def close(self) -> None:
+        """Flush and close the connection to the shipper and the fallbacks."""
+        writer = self._writer
+        self._reader = self._writer = None
+        if writer is not None:
+            try:
+                await writer.drain()
+            except (OSError, RuntimeError):
+                pass
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (OSError, RuntimeError):
+                pass
+
+        if self._process is not None:
+            # Reap a shipper that has exited; a running one is left alone
+            self._process.poll()
+
+        for sink in self.fallback_sinks:
+            close = getattr(sink, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(
+                    f"Error closing fallback sink {type(sink).__name__}: {e}"
+                )
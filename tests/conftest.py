@@ -0,0 +1,58 @@
+"""Shared fixtures for the queue worker, sink queue and spill tests."""
+
+import asyncio
+
+import pytest
+
+from fapilog._internal.drop_ledger import DropLedger
+from fapilog._internal.metrics import MetricsCollector
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+class StubContainer:
+    """The parts of ``LoggingContainer`` the queue components use."""
+
+    def __init__(self):
+        self.metrics = MetricsCollector()
+        self.ledger = DropLedger()
+        self.queue_worker = None
+
+    def get_metrics_collector(self):
+        return self.metrics
+
+    def get_drop_ledger(self):
+        return self.ledger
+
+
+class FlakySink(RecordingSink):
+    """Recording sink that fails while ``down`` is set or ``failures`` remain."""
+
+    def __init__(self, failures=0, down=False, delay=0.0):
+        super().__init__()
+        self.failures = failures
+        self.down = down
+        self.delay = delay
+        self.calls = 0
+
+    async def write(self, event_dict):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.down:
+            raise RuntimeError("sink down")
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("sink down")
+        await super().write(event_dict)
+
+
+@pytest.fixture
+def container():
+    """A container stub with a fresh metrics collector and drop ledger."""
+    return StubContainer()
+
+
+@pytest.fixture
+def flaky_sink():
+    """Factory for recording sinks that fail, recover or write slowly."""
+    return FlakySink
@@ -0,0 +1,132 @@
+"""Tests for adaptive batch sizing."""
+
+import asyncio
+
+import pytest
+
+from fapilog._internal.adaptive_batcher import AdaptiveBatcher
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+class TestAdaptiveBatcher:
+    """Test the batch size and flush timeout controller."""
+
+    def test_grows_while_deep_and_cheaper_per_event(self):
+        batcher = AdaptiveBatcher(1, 16, 0.0, 0.08, initial_size=2)
+
+        batcher.observe(2, 100, 0.002)
+        batcher.observe(4, 100, 0.002)
+
+        assert batcher.size == 8
+        assert batcher.flush_timeout == pytest.approx(0.02)
+
+        batcher.observe(8, 100, 0.002)
+        batcher.observe(16, 100, 0.002)
+        assert batcher.size == 16
+
+    def test_holds_when_time_per_event_rises(self):
+        batcher = AdaptiveBatcher(1, 64, initial_size=4)
+        batcher.observe(4, 100, 0.004)
+
+        batcher.observe(8, 100, 0.04)
+
+        assert batcher.size == 8
+
+    def test_shrinks_when_traffic_is_light(self):
+        batcher = AdaptiveBatcher(2, 64, 0.0, 0.08, initial_size=32)
+        batcher.flush_timeout = 0.08
+
+        batcher.observe(3, 0, 0.001)
+        assert batcher.size == 16
+        assert batcher.flush_timeout == pytest.approx(0.04)
+
+        for _ in range(5):
+            batcher.observe(1, 0, 0.001)
+        assert batcher.size == 2
+        assert batcher.flush_timeout == 0.0
+
+    def test_bounds_clamp_initial_size(self):
+        assert AdaptiveBatcher(5, 10, initial_size=100).size == 10
+        assert AdaptiveBatcher(5, 10, initial_size=1).size == 5
+
+    def test_values_exported_as_gauges(self, container):
+        batcher = AdaptiveBatcher(1, 16, initial_size=4, container=container)
+        batcher.observe(4, 10, 0.001)
+
+        tuning = container.metrics.get_all_metrics()["queue"]["batch_tuning"]
+        text = container.metrics.get_prometheus_metrics()
+        assert tuning["batch_size"] == 8
+        assert "fapilog_queue_batch_size 8" in text
+        assert "fapilog_queue_flush_timeout_seconds" in text
+
+
+class TestWorkerAdaptiveBatching:
+    """Test the worker driving its batches from the batcher."""
+
+    @pytest.mark.asyncio
+    async def test_backlog_written_in_growing_batches(self):
+        sink = RecordingSink()
+        worker = QueueWorker(
+            sinks=[sink],
+            queue_max_size=1000,
+            batch_size=2,
+            batch_timeout=0.01,
+            adaptive_batching=True,
+            max_batch_size=256,
+            drop_summary_interval=0,
+        )
+        batches = []
+        process_batch = worker._process_batch
+
+        async def record_batch(batch, capture_times=None):
+            batches.append(len(batch))
+            await process_batch(batch, capture_times)
+
+        worker._process_batch = record_batch
+        for n in range(600):
+            await worker.enqueue({"event": n})
+
+        await worker.start()
+        for _ in range(200):
+            if len(sink.events) == 600:
+                break
+            await asyncio.sleep(0.01)
+        await worker.shutdown()
+
+        assert len(sink.events) == 600
+        assert batches[0] == 2
+        assert max(batches) > 2
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_written_once_full(self):
+        worker = QueueWorker(
+            sinks=[],
+            batch_size=4,
+            adaptive_batching=True,
+            min_flush_timeout=5.0,
+            max_flush_timeout=5.0,
+            drop_summary_interval=0,
+        )
+        await worker.enqueue({"event": 0})
+        collect = asyncio.ensure_future(worker._collect_batch())
+        await asyncio.sleep(0.01)
+        assert not collect.done()
+
+        for n in range(1, 4):
+            await worker.enqueue({"event": n})
+        batch = await asyncio.wait_for(collect, 1.0)
+
+        assert [e["event"] for e in batch] == [0, 1, 2, 3]
+
+    def test_bounds_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_batch_size_min=0)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_batch_size_min=10, queue_batch_size_max=5)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_flush_timeout_min=-1)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_flush_timeout_min=0.1, queue_flush_timeout_max=0.05)
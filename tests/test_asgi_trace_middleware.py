@@ -0,0 +1,144 @@
+"""Tests for the pure ASGI TraceIDMiddleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.testclient import TestClient
+
+from fapilog._internal.context import get_context
+from fapilog.middleware import TraceIDMiddleware
+
+
+def _build_app(captured):
+    """Build an app that captures the access log call arguments."""
+    app = FastAPI()
+
+    @app.get("/plain")
+    async def plain():
+        return PlainTextResponse("Hello, World!")
+
+    @app.get("/stream")
+    async def stream():
+        def generate():
+            yield b"chunk-one;"
+            yield b"chunk-two;"
+            yield b"chunk-three"
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom():
+        raise ValueError("kaboom")
+
+    app.add_middleware(TraceIDMiddleware)
+    return app
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Capture response metadata bound by the middleware."""
+    records = []
+
+    def fake_success(self, request, status_code, trace_id, span_id, duration):
+        records.append({"status_code": status_code, **get_context()})
+
+    monkeypatch.setattr(TraceIDMiddleware, "_log_request_success", fake_success)
+    monkeypatch.setattr(
+        TraceIDMiddleware,
+        "_log_request_error",
+        lambda self, request, trace_id, span_id, duration, error: records.append(
+            {"error": str(error), **get_context()}
+        ),
+    )
+    return records
+
+
+def test_is_pure_asgi_middleware():
+    """The middleware must not depend on BaseHTTPMiddleware."""
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    assert not issubclass(TraceIDMiddleware, BaseHTTPMiddleware)
+
+
+def test_res_bytes_counted_from_send(captured):
+    """res_bytes reflects the bytes actually sent."""
+    client = TestClient(_build_app(captured))
+
+    response = client.get("/plain")
+
+    assert response.status_code == 200
+    assert captured[0]["res_bytes"] == len(b"Hello, World!")
+    assert captured[0]["status_code"] == 200
+
+
+def test_res_bytes_for_streaming_response(captured):
+    """Streaming responses are counted chunk by chunk."""
+    client = TestClient(_build_app(captured))
+
+    response = client.get("/stream")
+
+    assert response.text == "chunk-one;chunk-two;chunk-three"
+    assert captured[0]["res_bytes"] == len(response.content)
+    assert "X-Response-Time-ms" in response.headers
+    assert "X-Span-Id" in response.headers
+
+
+def test_error_binds_status_500(captured):
+    """Failures are logged with status 500 and re-raised."""
+    client = TestClient(_build_app(captured), raise_server_exceptions=False)
+
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert captured[0]["error"] == "kaboom"
+    assert captured[0]["status_code"] == 500
+
+
+@pytest.mark.asyncio
+async def test_non_http_scopes_pass_through():
+    """Lifespan and websocket scopes are forwarded untouched."""
+    seen = []
+
+    async def inner_app(scope, receive, send):
+        seen.append(scope["type"])
+
+    middleware = TraceIDMiddleware(inner_app)
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
+    assert all(value is None for value in get_context().values())
+
+
+@pytest.mark.asyncio
+async def test_headers_added_to_response_start():
+    """Correlation headers are injected into http.response.start."""
+    sent = []
+
+    async def inner_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "headers": [(b"x-request-id", b"abc123")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+        "scheme": "http",
+    }
+    middleware = TraceIDMiddleware(inner_app)
+    middleware._log_request_success = lambda *args: None
+
+    await middleware(scope, None, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-request-id"] == b"abc123"
+    assert b"x-span-id" in headers
+    assert b"x-response-time-ms" in headers
+    assert scope["state"]["trace_id"] == "abc123"
@@ -0,0 +1,213 @@
+"""Tests for async batch enrichers executed in the queue worker."""
+
+import asyncio
+
+import pytest
+
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog.container import LoggingContainer
+from fapilog.enrichers import (
+    AsyncSmartCache,
+    EnricherErrorHandler,
+    EnricherErrorStrategy,
+    EnricherHealthMonitor,
+    clear_async_enrichers,
+    register_async_enricher,
+    run_async_enrichers,
+)
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.sinks import Sink
+
+
+class CollectingSink(Sink):
+    """Sink that records every event it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    async def write(self, event_dict):
+        self.events.append(event_dict)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    clear_async_enrichers()
+    yield
+    clear_async_enrichers()
+
+
+class TestRegistration:
+    """Test async enricher registration and validation."""
+
+    def test_rejects_sync_function(self):
+        def sync_enricher(events, cache):
+            return events
+
+        with pytest.raises(ConfigurationError):
+            register_async_enricher(sync_enricher)
+
+    def test_rejects_wrong_signature(self):
+        async def bad_enricher(logger, method_name, event_dict):
+            return event_dict
+
+        with pytest.raises(ConfigurationError):
+            register_async_enricher(bad_enricher)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_registration_ignored(self):
+        calls = []
+
+        async def enricher(events, cache):
+            calls.append(len(events))
+
+        register_async_enricher(enricher)
+        register_async_enricher(enricher)
+
+        await run_async_enrichers([{"event": "a"}])
+        assert calls == [1]
+
+
+class TestRunAsyncEnrichers:
+    """Test batch execution, memoization and deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_enriches_whole_batch_in_order(self):
+        order = []
+
+        async def first(events, cache):
+            order.append("first")
+            for event in events:
+                event["first"] = True
+            return events
+
+        async def second(events, cache):
+            order.append("second")
+            for event in events:
+                event["second"] = True
+
+        register_async_enricher(first)
+        register_async_enricher(second)
+
+        result = await run_async_enrichers([{"event": "a"}, {"event": "b"}])
+
+        assert order == ["first", "second"]
+        assert all(e["first"] and e["second"] for e in result)
+
+    @pytest.mark.asyncio
+    async def test_lookups_memoized_across_batch(self):
+        lookups = []
+
+        async def tenant_enricher(events, cache):
+            for event in events:
+                user = event["user_id"]
+
+                async def resolve(user=user):
+                    lookups.append(user)
+                    return f"tenant-{user}"
+
+                event["tenant"] = await cache.get_or_compute(f"tenant:{user}", resolve)
+
+        register_async_enricher(tenant_enricher)
+        cache = AsyncSmartCache()
+        events = [{"user_id": "u1"}, {"user_id": "u2"}, {"user_id": "u1"}]
+
+        await run_async_enrichers(events, cache=cache)
+        await run_async_enrichers([{"user_id": "u2"}], cache=cache)
+
+        assert lookups == ["u1", "u2"]
+        assert events[2]["tenant"] == "tenant-u1"
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_slow_enricher(self):
+        monitor = EnricherHealthMonitor()
+        handler = EnricherErrorHandler(EnricherErrorStrategy.SILENT)
+
+        async def slow_enricher(events, cache):
+            await asyncio.sleep(1.0)
+            for event in events:
+                event["slow"] = True
+
+        register_async_enricher(slow_enricher)
+
+        events = [{"event": "a"}]
+        result = await run_async_enrichers(
+            events, timeout=0.01, health_monitor=monitor, error_handler=handler
+        )
+
+        assert "slow" not in result[0]
+        stats = monitor.get_health_report()["enrichers"]["slow_enricher"]
+        assert stats["failed_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_later_enrichers(self):
+        async def broken(events, cache):
+            raise RuntimeError("lookup failed")
+
+        async def working(events, cache):
+            for event in events:
+                event["ok"] = True
+
+        register_async_enricher(broken)
+        register_async_enricher(working)
+
+        handler = EnricherErrorHandler(EnricherErrorStrategy.SILENT)
+        result = await run_async_enrichers([{"event": "a"}], error_handler=handler)
+
+        assert result[0]["ok"] is True
+
+
+class TestQueueWorkerIntegration:
+    """Test that the queue worker enriches batches before the sinks."""
+
+    @pytest.mark.asyncio
+    async def test_worker_enriches_before_sinks(self):
+        async def geo_enricher(events, cache):
+            for event in events:
+                event["country"] = "NZ"
+
+        register_async_enricher(geo_enricher)
+        sink = CollectingSink()
+        worker = QueueWorker([sink])
+
+        await worker._process_batch([{"event": "a"}, {"event": "b"}])
+
+        assert [e["country"] for e in sink.events] == ["NZ", "NZ"]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_still_delivers_batch(self):
+        async def broken(events, cache):
+            raise RuntimeError("boom")
+
+        register_async_enricher(broken)
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        container.get_enricher_error_handler().strategy = (
+            EnricherErrorStrategy.FAIL_FAST
+        )
+        sink = CollectingSink()
+        worker = QueueWorker([sink], container=container)
+
+        await worker._process_batch([{"event": "a"}])
+
+        assert sink.events == [{"event": "a"}]
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_container_cache(self):
+        async def cached_enricher(events, cache):
+            for event in events:
+                event["flag"] = await cache.get_or_compute("flags", lambda: "on")
+
+        register_async_enricher(cached_enricher)
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        worker = QueueWorker([CollectingSink()], container=container)
+
+        await worker._process_batch([{"event": "a"}])
+
+        stats = await container.get_async_smart_cache().get_cache_stats()
+        assert stats["total_entries"] == 1
+
+    def test_timeout_setting_validated(self):
+        assert LoggingSettings().async_enricher_timeout == 0.5
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(async_enricher_timeout=0)
@@ -0,0 +1,136 @@
+"""Tests for bounded blocking enqueue under the block overflow strategy."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import structlog
+
+from fapilog._internal.lane_queue import LaneQueue
+from fapilog._internal.queue_integration import create_queue_sink
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.ring_buffer import RingBuffer
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+
+
+async def _in_thread(func):
+    """Run ``func`` on a new thread while this loop keeps running."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    while thread.is_alive():
+        await asyncio.sleep(0.005)
+    return result[0]
+
+
+class TestBlockingHandoff:
+    """Test blocking put_threadsafe on the ring buffer."""
+
+    @pytest.mark.asyncio
+    async def test_blocked_put_completes_when_slot_frees(self):
+        queue = RingBuffer(1)
+        queue.bind(asyncio.get_running_loop())
+        queue.put_nowait("first")
+        asyncio.get_running_loop().call_later(0.05, queue.drain, 1)
+
+        accepted = await _in_thread(lambda: queue.put_threadsafe("second", timeout=5.0))
+
+        assert accepted
+        assert queue.drain(10) == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_blocked_put_gives_up_at_deadline(self):
+        queue = RingBuffer(1)
+        queue.bind(asyncio.get_running_loop())
+        queue.put_nowait("first")
+
+        start = time.monotonic()
+        accepted = await _in_thread(lambda: queue.put_threadsafe("x", timeout=0.1))
+
+        assert not accepted
+        assert time.monotonic() - start >= 0.1
+        assert queue._blocked == 0
+
+    @pytest.mark.asyncio
+    async def test_lane_queue_blocks_per_lane(self):
+        queue = LaneQueue(1, 1)
+        queue.bind(asyncio.get_running_loop())
+        queue.put_nowait({"level": "error", "event": 0})
+        asyncio.get_running_loop().call_later(0.05, queue.drain, 1)
+
+        accepted = await _in_thread(
+            lambda: queue.put_threadsafe({"level": "error", "event": 1}, timeout=5.0)
+        )
+
+        assert accepted
+
+
+class TestQueueSinkBlocking:
+    """Test the queue sink's block strategy for callers on other threads."""
+
+    def _worker(self, container, strategy, timeout=5.0):
+        worker = QueueWorker(
+            sinks=[],
+            queue_max_size=1,
+            overflow_strategy=strategy,
+            block_timeout=timeout,
+            container=container,
+        )
+        worker._running = True
+        worker._loop = asyncio.get_running_loop()
+        worker.queue.bind(worker._loop)
+        worker.queue.put_nowait({"event": "filler"})
+        container.queue_worker = worker
+        return worker
+
+    def _log_from_thread(self, container):
+        queue_sink = create_queue_sink(container)
+
+        def log():
+            try:
+                queue_sink(None, "info", {"level": "info", "event": "audit"})
+            except structlog.DropEvent:
+                pass
+
+        return log
+
+    @pytest.mark.asyncio
+    async def test_caller_waits_for_space(self, container):
+        worker = self._worker(container, "block")
+        asyncio.get_running_loop().call_later(0.05, worker.queue.drain, 1)
+
+        await _in_thread(self._log_from_thread(container))
+
+        assert [e["event"] for e in worker.queue.drain(10)] == ["audit"]
+        assert container.ledger.totals()["overflow"] == 0
+        queue = container.metrics.get_all_metrics()["queue"]
+        assert queue["total_blocked"] == 1
+        assert queue["blocked_seconds"] >= 0.04
+        text = container.metrics.get_prometheus_metrics()
+        assert "fapilog_queue_blocked_total 1" in text
+
+    @pytest.mark.asyncio
+    async def test_caller_dropped_after_deadline(self, container):
+        worker = self._worker(container, "block", timeout=0.05)
+
+        await _in_thread(self._log_from_thread(container))
+
+        assert worker.queue.qsize() == 1
+        assert container.ledger.totals()["overflow"] == 1
+        assert container.metrics.get_all_metrics()["queue"]["total_blocked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_strategy_never_waits(self, container):
+        self._worker(container, "drop")
+
+        await _in_thread(self._log_from_thread(container))
+
+        assert container.ledger.totals()["overflow"] == 1
+        assert container.metrics.get_all_metrics()["queue"]["total_blocked"] == 0
+
+    def test_block_timeout_validated(self):
+        assert LoggingSettings(queue_block_timeout=0).queue_block_timeout == 0
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_block_timeout=-1)
@@ -0,0 +1,146 @@
+"""Tests for per-sink circuit breakers."""
+
+import pytest
+
+from fapilog._internal.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.sink_queue import SinkQueue
+from fapilog.exceptions import ConfigurationError, QueueError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import FailingSink
+
+
+class TestCircuitBreaker:
+    """Test the state machine."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("s", failure_threshold=3, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("s", failure_threshold=1, reset_timeout=0.001)
+        breaker.record_failure()
+        breaker._opened_at -= 1
+
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("s", failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        breaker._opened_at -= 120
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    def test_transitions_exported(self, container):
+        breaker = CircuitBreaker(
+            "LokiSink", failure_threshold=1, reset_timeout=60, container=container
+        )
+        breaker.record_failure()
+
+        sinks = container.metrics.get_all_metrics()["sinks"]
+        text = container.metrics.get_prometheus_metrics()
+
+        assert sinks["LokiSink"]["circuit_state"] == OPEN
+        assert sinks["LokiSink"]["circuit_transitions"] == {OPEN: 1}
+        assert 'fapilog_sink_circuit_state{sink="LokiSink"} 1' in text
+        assert (
+            'fapilog_sink_circuit_transitions_total{sink="LokiSink",state="open"} 1'
+            in text
+        )
+
+
+class TestWorkerBreakers:
+    """Test breakers in both delivery modes."""
+
+    @pytest.mark.asyncio
+    async def test_shared_delivery_skips_open_sink(self, container):
+        sink = FailingSink()
+        worker = QueueWorker(
+            [sink],
+            max_retries=0,
+            container=container,
+            circuit_breaker_threshold=2,
+            circuit_breaker_reset_timeout=60,
+        )
+
+        for _ in range(2):
+            with pytest.raises(QueueError):
+                await worker._process_event({"event": "x"})
+        for _ in range(3):
+            await worker._process_event({"event": "y"})
+
+        assert sink.get_stats()["attempts"] == 2
+        assert container.ledger.totals()["circuit_open"] == 3
+
+    @pytest.mark.asyncio
+    async def test_sink_queue_stops_retrying_when_open(self, container):
+        sink = FailingSink()
+        breaker = CircuitBreaker("s", failure_threshold=2, reset_timeout=60)
+        sink_queue = SinkQueue(
+            sink,
+            "s",
+            max_retries=5,
+            retry_delay=0.001,
+            container=container,
+            breaker=breaker,
+        )
+        sink_queue.start()
+
+        sink_queue.offer({"event": "x"}, None)
+        sink_queue.offer({"event": "y"}, None)
+        await sink_queue.close()
+
+        assert sink.get_stats()["attempts"] == 2
+        assert container.ledger.totals()["circuit_open"] == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_recovers_sink(self, flaky_sink):
+        sink = flaky_sink(down=True)
+        worker = QueueWorker(
+            [sink],
+            max_retries=0,
+            circuit_breaker_threshold=1,
+            circuit_breaker_reset_timeout=60,
+        )
+        with pytest.raises(QueueError):
+            await worker._process_event({"event": "x"})
+        breaker = worker._breaker(sink)
+        breaker._opened_at -= 120
+        sink.down = False
+
+        await worker._process_event({"event": "probe"})
+
+        assert breaker.state == CLOSED
+        assert [e["event"] for e in sink.events] == ["probe"]
+
+    def test_settings_validated(self):
+        assert LoggingSettings().sink_circuit_breaker_threshold == 0
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(sink_circuit_breaker_threshold=-1)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(sink_circuit_breaker_reset_timeout=0)
@@ -210,6 +210,22 @@ class TestContainerMetricsIntegration:
         # Metrics should still exist globally but container should be reset
         assert not container.is_configured
 
+    def test_container_metrics_use_top_k_setting(self):
+        """Test that the container's collector tracks metrics_top_k keys."""
+        container = LoggingContainer(
+            LoggingSettings(sinks=[], metrics_enabled=True, metrics_top_k=3)
+        )
+        try:
+            container.configure()
+            metrics = container.get_metrics_collector()
+            assert metrics.top_k == 3
+
+            for key in "abcde":
+                metrics.record_event_volume("info", "app", key, 1)
+            assert len(metrics.event_volume["event"].top()) == 3
+        finally:
+            container.reset()
+
 
 class TestMetricsIntegrationScenarios:
     """Test real-world metrics integration scenarios."""
@@ -0,0 +1,210 @@
+"""Tests for drop accounting and the periodic drop summary."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+import structlog
+
+from fapilog._internal.drop_ledger import DropLedger
+from fapilog._internal.metrics import MetricsCollector
+from fapilog._internal.queue_integration import create_queue_sink
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
+from fapilog.pipeline import build_processor_chain
+from fapilog.settings import LoggingSettings
+
+
+class RecordingSink:
+    """Sink that keeps every event written to it."""
+
+    def __init__(self):
+        self.events = []
+
+    async def write(self, event_dict):
+        self.events.append(event_dict)
+
+
+class TestDropLedger:
+    """Test counting and summaries."""
+
+    def test_totals_include_every_reason(self):
+        ledger = DropLedger()
+        ledger.record("overflow")
+        ledger.record("overflow", 2)
+
+        totals = ledger.totals()
+
+        assert totals["overflow"] == 3
+        assert totals["shutdown"] == 0
+
+    def test_summary_reports_only_new_drops(self):
+        ledger = DropLedger()
+        ledger.record("sampled", 5)
+        assert ledger.take_summary() == {"sampled": 5}
+        assert ledger.take_summary() == {}
+
+        ledger.record("throttled")
+        assert ledger.take_summary() == {"throttled": 1}
+        assert ledger.totals()["sampled"] == 5
+
+    def test_threads_merge_on_read(self):
+        ledger = DropLedger()
+
+        def record():
+            for _ in range(250):
+                ledger.record("deduped")
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ledger.totals()["deduped"] == 1000
+
+        ledger.reset()
+        assert ledger.totals()["deduped"] == 0
+
+    def test_exited_threads_counters_are_retired(self):
+        ledger = DropLedger()
+
+        for _ in range(20):
+            thread = threading.Thread(target=ledger.record, args=("overflow",))
+            thread.start()
+            thread.join()
+        ledger.record("shed")
+
+        assert len(ledger._counters) == 1
+        assert ledger.take_summary() == {"overflow": 20, "shed": 1}
+
+        ledger.reset()
+        assert ledger.totals()["overflow"] == 0
+
+    def test_exported_with_metrics(self):
+        ledger = DropLedger()
+        ledger.record("no_loop")
+        collector = MetricsCollector(enabled=True, drop_ledger=ledger)
+
+        assert collector.get_all_metrics()["drops"]["no_loop"] == 1
+        text = collector.get_prometheus_metrics()
+        assert 'fapilog_events_dropped_total{reason="no_loop"} 1' in text
+        assert 'fapilog_events_dropped_total{reason="overflow"} 0' in text
+
+
+class TestDropSources:
+    """Test that each drop path records its reason."""
+
+    def _container(self, **worker_attrs):
+        container = Mock()
+        container.get_drop_ledger.return_value = DropLedger()
+        container.get_metrics_collector.return_value = None
+        worker = Mock(_running=True, _stopping=False, sampling_rate=1.0)
+        for name, value in worker_attrs.items():
+            setattr(worker, name, value)
+        container.queue_worker = worker
+        return container
+
+    @pytest.mark.parametrize(
+        "worker_attrs,reason",
+        [
+            ({"_stopping": True}, "shutdown"),
+            ({"_running": False}, "no_loop"),
+            ({"overflow_strategy": "sample", "sampling_rate": 0.0}, "sampled"),
+        ],
+    )
+    def test_queue_sink_reasons(self, worker_attrs, reason):
+        container = self._container(**worker_attrs)
+
+        with pytest.raises(structlog.DropEvent):
+            create_queue_sink(container)(None, "info", {"event": "x"})
+
+        assert container.get_drop_ledger().totals()[reason] == 1
+
+    def test_queue_sink_overflow(self):
+        container = self._container(overflow_strategy="drop")
+        container.queue_worker.queue.put_nowait.side_effect = asyncio.QueueFull()
+
+        with pytest.raises(structlog.DropEvent):
+            create_queue_sink(container)(None, "info", {"event": "x"})
+
+        assert container.get_drop_ledger().totals()["overflow"] == 1
+
+    def test_sampling_processor_drops_counted(self):
+        container = LoggingContainer(LoggingSettings(sinks=[], sampling_rate=0.0))
+        chain = build_processor_chain(
+            LoggingSettings(sampling_rate=0.0, queue_enabled=False),
+            container=container,
+        )
+        sampler = chain[-3]
+
+        assert sampler(None, "info", {"event": "x"}) is None
+        assert container.get_drop_ledger().totals()["sampled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_enqueue_reasons(self):
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        worker = QueueWorker(sinks=[], queue_max_size=1, container=container)
+
+        assert await worker.enqueue({"event": "a"})
+        assert not await worker.enqueue({"event": "b"})
+        worker._stopping = True
+        assert not await worker.enqueue({"event": "c"})
+
+        totals = container.get_drop_ledger().totals()
+        assert totals["overflow"] == 1
+        assert totals["shutdown"] == 1
+
+
+class TestDropSummary:
+    """Test the summary event written to the sinks."""
+
+    @pytest.mark.asyncio
+    async def test_summary_written_to_sinks(self):
+        sink = RecordingSink()
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        worker = QueueWorker(sinks=[sink], container=container)
+        container.get_drop_ledger().record("overflow", 3)
+        container.get_drop_ledger().record("sampled")
+
+        await worker._emit_drop_summary()
+        await worker._emit_drop_summary()
+
+        (event,) = sink.events
+        assert event["event"] == "Log events dropped"
+        assert event["level"] == "warning"
+        assert event["dropped"] == {"overflow": 3, "sampled": 1}
+        assert event["dropped_total"] == 4
+        assert event["timestamp"].endswith("Z")
+
+    @pytest.mark.asyncio
+    async def test_summary_emitted_periodically_and_on_drain(self):
+        sink = RecordingSink()
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        worker = QueueWorker(
+            sinks=[sink],
+            batch_timeout=0.01,
+            container=container,
+            drop_summary_interval=0.02,
+        )
+        await worker.start()
+        try:
+            container.get_drop_ledger().record("throttled")
+            for _ in range(50):
+                if sink.events:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            container.get_drop_ledger().record("shutdown")
+            await worker.shutdown()
+
+        assert [e["dropped"] for e in sink.events] == [
+            {"throttled": 1},
+            {"shutdown": 1},
+        ]
+
+    def test_interval_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(drop_summary_interval=-1)
@@ -0,0 +1,146 @@
+"""Tests for the priority lanes of the queue."""
+
+import asyncio
+import threading
+
+import pytest
+
+from fapilog._internal.lane_queue import LaneQueue, is_high_priority
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+def _event(level, n):
+    return {"level": level, "event": n}
+
+
+class TestLaneQueue:
+    """Test lane admission and draining."""
+
+    def test_classifies_levels(self):
+        assert is_high_priority(_event("error", 0))
+        assert is_high_priority(_event("CRITICAL", 0))
+        assert not is_high_priority(_event("warning", 0))
+        assert not is_high_priority({"event": "no level"})
+
+    def test_drains_high_priority_first(self):
+        queue = LaneQueue(10, 10)
+        queue.put_nowait(_event("info", 1))
+        queue.put_nowait(_event("error", 2))
+        queue.put_nowait(_event("debug", 3))
+        queue.put_nowait(_event("critical", 4))
+
+        assert [e["event"] for e in queue.drain(10)] == [2, 4, 1, 3]
+
+    def test_error_evicts_oldest_low_priority_event(self):
+        evicted = []
+        queue = LaneQueue(3, 1, on_evict=evicted.append)
+        for n in range(3):
+            queue.put_nowait(_event("info", n))
+        queue.put_nowait(_event("error", "e1"))
+        queue.put_nowait(_event("error", "e2"))
+
+        assert [e["event"] for e in evicted] == [0]
+        assert [e["event"] for e in queue.drain(10)] == ["e1", "e2", 1, 2]
+
+    def test_error_rejected_only_without_low_priority_events(self):
+        queue = LaneQueue(1, 1)
+        queue.put_nowait(_event("info", 0))
+        queue.put_nowait(_event("error", 1))
+        queue.put_nowait(_event("error", 2))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event("error", 3))
+        # The evicted slot still counts against the low lane
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event("info", 4))
+
+    def test_starvation_guard_drains_low_lane(self):
+        queue = LaneQueue(10, 10, starvation_limit=2)
+        queue.put_nowait(_event("info", "low"))
+        for n in range(6):
+            queue.put_nowait(_event("error", n))
+
+        batches = [[e["event"] for e in queue.drain(1)] for _ in range(4)]
+
+        assert batches == [[0], [1], ["low"], [2]]
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_either_lane(self):
+        queue = LaneQueue(10, 10)
+        waiter = asyncio.ensure_future(queue.wait())
+        await asyncio.sleep(0)
+        queue.put_nowait(_event("error", 1))
+
+        assert await asyncio.wait_for(waiter, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_count_across_lanes(self):
+        queue = LaneQueue(10, 10)
+        queue.put_nowait(_event("error", 0))
+        waiter = asyncio.ensure_future(queue.wait(5.0, count=3))
+        await asyncio.sleep(0)
+
+        queue.put_nowait(_event("info", 1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        queue.put_nowait(_event("info", 2))
+        assert await asyncio.wait_for(waiter, 1.0)
+
+        # An error ends the wait before the count is reached
+        waiter = asyncio.ensure_future(queue.wait(5.0, count=10))
+        await asyncio.sleep(0)
+        queue.put_nowait(_event("error", 3))
+        assert await asyncio.wait_for(waiter, 1.0) is False
+
+    @pytest.mark.asyncio
+    async def test_threadsafe_puts_cannot_evict(self):
+        queue = LaneQueue(1, 1)
+        queue.bind(asyncio.get_running_loop())
+        queue.put_nowait(_event("info", 0))
+        results = []
+
+        def producer():
+            results.append(queue.put_threadsafe(_event("error", 1)))
+            results.append(queue.put_threadsafe(_event("error", 2)))
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        thread.join()
+
+        assert results == [True, False]
+        assert [e["event"] for e in queue.drain(10)] == [1, 0]
+
+
+class TestWorkerLanes:
+    """Test the worker with priority lanes enabled."""
+
+    @pytest.mark.asyncio
+    async def test_errors_survive_overflow(self, container):
+        sink = RecordingSink()
+        worker = QueueWorker(
+            sinks=[sink],
+            queue_max_size=5,
+            queue_priority_size=2,
+            batch_timeout=0.01,
+            container=container,
+            drop_summary_interval=0,
+        )
+        for n in range(10):
+            await worker.enqueue(_event("info", n))
+        for n in range(4):
+            assert await worker.enqueue(_event("error", f"e{n}"))
+
+        await worker.start()
+        await worker.shutdown()
+
+        assert [e["event"] for e in sink.events] == ["e0", "e1", "e2", "e3", 2, 3, 4]
+        totals = container.ledger.totals()
+        assert totals["overflow"] == 5
+        assert totals["evicted"] == 2
+
+    def test_priority_size_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_priority_size=-1)
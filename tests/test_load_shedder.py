@@ -0,0 +1,124 @@
+"""Tests for adaptive load shedding."""
+
+import pytest
+import structlog
+
+from fapilog._internal.load_shedder import LoadShedder
+from fapilog._internal.queue_integration import create_queue_sink
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.ring_buffer import RingBuffer
+from fapilog.settings import LoggingSettings
+
+
+def _fill(queue, count):
+    for n in range(count):
+        queue.put_nowait({"event": n})
+
+
+def _step(shedder, admitted=0, drained=0):
+    shedder._admitted = admitted
+    shedder._drained = drained
+    shedder._update(0.0)
+
+
+class TestLoadShedder:
+    """Test the AIMD controller."""
+
+    def test_sheds_debug_before_info(self):
+        queue = RingBuffer(10)
+        _fill(queue, 8)
+        shedder = LoadShedder(queue, min_rate=0.25)
+
+        _step(shedder, admitted=5)
+        assert shedder.rates == {"debug": 0.5, "info": 1.0}
+        _step(shedder, admitted=5)
+        _step(shedder, admitted=5)
+        assert shedder.rates == {"debug": 0.25, "info": 0.5}
+
+    def test_holds_when_queue_is_not_growing_fast(self):
+        queue = RingBuffer(10)
+        _fill(queue, 3)
+        shedder = LoadShedder(queue)
+        shedder.rates["debug"] = 0.5
+
+        _step(shedder, admitted=5)
+
+        assert shedder.rates["debug"] == 0.5
+
+    def test_recovers_info_first_when_draining(self):
+        queue = RingBuffer(10)
+        _fill(queue, 8)
+        shedder = LoadShedder(queue)
+        shedder.rates.update(debug=0.5, info=0.9)
+
+        _step(shedder, admitted=1, drained=5)
+        assert shedder.rates == {"debug": 0.5, "info": pytest.approx(0.95)}
+        _step(shedder, admitted=1, drained=5)
+        _step(shedder, admitted=1, drained=5)
+        assert shedder.rates == {"debug": pytest.approx(0.55), "info": 1.0}
+
+    def test_warnings_and_errors_always_admitted(self):
+        shedder = LoadShedder(RingBuffer(10), interval=3600)
+        shedder.rates.update(debug=0.0, info=0.0)
+
+        assert not shedder.admit("debug")
+        assert not shedder.admit("INFO")
+        assert shedder.admit("warning")
+        assert shedder.admit("error")
+        assert shedder.admit(None)
+
+    def test_rates_exported(self, container):
+        queue = RingBuffer(10)
+        _fill(queue, 8)
+        shedder = LoadShedder(queue, container=container)
+
+        _step(shedder, admitted=5)
+
+        rates = container.metrics.get_all_metrics()["queue"]["admission_rates"]
+        text = container.metrics.get_prometheus_metrics()
+        assert rates == {"debug": 0.5, "info": 1.0}
+        assert 'fapilog_queue_admission_rate{level="debug"} 0.5' in text
+
+
+class TestAdaptiveStrategy:
+    """Test the adaptive overflow strategy end to end."""
+
+    @pytest.mark.asyncio
+    async def test_worker_sheds_under_sustained_overload(self, container):
+        worker = QueueWorker(
+            sinks=[],
+            queue_max_size=100,
+            overflow_strategy="adaptive",
+            container=container,
+        )
+        worker.shedder.interval = 0
+
+        results = [await worker.enqueue({"level": "debug"}) for _ in range(200)]
+        assert await worker.enqueue({"level": "error"})
+
+        totals = container.ledger.totals()
+        assert totals["shed"] > 0
+        assert totals["overflow"] < 100
+        assert results.count(True) <= 100
+
+    @pytest.mark.asyncio
+    async def test_queue_sink_records_shed_events(self, container):
+        worker = QueueWorker(
+            sinks=[], overflow_strategy="adaptive", container=container
+        )
+        worker._running = True
+        worker.shedder.interval = 3600
+        worker.shedder.rates["info"] = 0.0
+        container.queue_worker = worker
+        queue_sink = create_queue_sink(container)
+
+        with pytest.raises(structlog.DropEvent):
+            queue_sink(None, "info", {"level": "info", "event": "x"})
+        with pytest.raises(structlog.DropEvent):
+            queue_sink(None, "error", {"level": "error", "event": "y"})
+
+        assert container.ledger.totals()["shed"] == 1
+        assert worker.queue.qsize() == 1
+
+    def test_setting_accepted(self):
+        assert LoggingSettings(queue_overflow="adaptive").queue_overflow == "adaptive"
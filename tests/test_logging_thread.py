@@ -0,0 +1,118 @@
+"""Tests for running the queue worker on a dedicated logging thread."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fapilog._internal.logging_thread import LoggingThread
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog.container import LoggingContainer
+from fapilog.settings import LoggingSettings
+from fapilog.sinks import Sink
+
+
+class ThreadRecordingSink(Sink):
+    """Sink that records each event with the thread that wrote it."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    async def write(self, event_dict):
+        self.events.append((threading.current_thread().name, event_dict))
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestLoggingThread:
+    """Test the thread lifecycle."""
+
+    def test_worker_runs_on_own_loop(self):
+        sink = ThreadRecordingSink()
+        worker = QueueWorker(sinks=[sink], batch_timeout=0.01)
+        thread = LoggingThread(worker)
+
+        thread.start()
+        try:
+            assert thread.is_running()
+            assert worker._running
+            assert worker._loop is thread.loop
+            assert worker.queue.put_threadsafe({"event": "from main"})
+            _wait_for(lambda: sink.events)
+        finally:
+            thread.stop()
+
+        assert not thread.is_running()
+        assert thread.loop is None
+        assert sink.events[0] == ("fapilog-worker", {"event": "from main"})
+
+    @pytest.mark.asyncio
+    async def test_async_shutdown_drains_queue(self):
+        sink = ThreadRecordingSink()
+        worker = QueueWorker(sinks=[sink], batch_timeout=5.0, batch_size=100)
+        thread = LoggingThread(worker)
+        thread.start()
+
+        for i in range(5):
+            assert worker.queue.put_threadsafe({"event": i})
+        await thread.shutdown()
+
+        assert [e["event"] for _, e in sink.events] == list(range(5))
+        assert not thread.is_running()
+
+
+class TestContainerWiring:
+    """Test the container's dedicated thread mode."""
+
+    def test_logs_written_off_the_caller_thread(self):
+        sink = ThreadRecordingSink()
+        container = LoggingContainer(
+            LoggingSettings(
+                sinks=[sink],
+                queue_dedicated_thread=True,
+                queue_batch_timeout=0.01,
+            )
+        )
+        try:
+            logger = container.configure()
+            assert container._logging_thread.is_running()
+
+            # No event loop in this thread: events are still handed off
+            logger.info("sync hello")
+            _wait_for(lambda: sink.events)
+        finally:
+            container.shutdown_sync()
+
+        assert container._logging_thread is None
+        assert container.queue_worker is None
+        thread_name, event = sink.events[0]
+        assert thread_name == "fapilog-worker"
+        assert event["event"] == "sync hello"
+
+    @pytest.mark.asyncio
+    async def test_async_shutdown_stops_thread(self):
+        container = LoggingContainer(
+            LoggingSettings(sinks=[], queue_dedicated_thread=True)
+        )
+        container.configure()
+        thread = container._logging_thread
+
+        await container.shutdown()
+
+        assert not thread.is_running()
+        assert container._logging_thread is None
+        assert asyncio.get_running_loop().is_running()
+
+    def test_disabled_by_default(self):
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        try:
+            container.configure()
+            assert container._logging_thread is None
+        finally:
+            container.reset()
@@ -0,0 +1,98 @@
+"""Tests for the event loop lag monitor."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+
+from fapilog._internal.loop_monitor import LoopLagMonitor
+from fapilog._internal.metrics import MetricsCollector
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+
+
+async def _block_loop(seconds):
+    """Hold the event loop without yielding, then let the probe run."""
+    time.sleep(seconds)
+    await asyncio.sleep(0.05)
+
+
+class TestLoopLagMonitor:
+    """Test lag sampling and attribution."""
+
+    @pytest.mark.asyncio
+    async def test_records_lag_when_loop_is_blocked(self):
+        collector = MetricsCollector()
+        monitor = LoopLagMonitor(collector, interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            await _block_loop(0.05)
+        finally:
+            await monitor.stop()
+
+        lag = collector.loop_lag
+        assert lag["app"].count > 0
+        assert lag["app"].max >= 30
+        assert lag["logging"].count == 0
+        assert not monitor.is_running()
+
+    @pytest.mark.asyncio
+    async def test_attributes_lag_to_worker_batches(self):
+        collector = MetricsCollector()
+        worker = SimpleNamespace(batches_started=0, in_batch=False)
+        monitor = LoopLagMonitor(collector, interval=0.01, worker=worker)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            worker.in_batch = True
+            await _block_loop(0.05)
+        finally:
+            await monitor.stop()
+
+        assert collector.loop_lag["logging"].max >= 30
+
+    def test_prometheus_export(self):
+        collector = MetricsCollector(histogram_buckets=[1.0, 10.0])
+        collector.record_loop_lag(5.0)
+        collector.record_loop_lag(0.5, during_batch=True)
+
+        text = collector.get_prometheus_metrics()
+
+        assert "# TYPE fapilog_event_loop_lag_ms histogram" in text
+        assert 'fapilog_event_loop_lag_ms_bucket{source="app",le="10"} 1' in text
+        assert 'fapilog_event_loop_lag_ms_count{source="logging"} 1' in text
+        assert collector.get_all_metrics()["loop_lag"]["app"]["max"] == 5.0
+
+
+class TestContainerWiring:
+    """Test that the container creates and starts the monitor."""
+
+    def test_monitor_started_on_app_startup(self):
+        container = LoggingContainer(
+            LoggingSettings(
+                sinks=[],
+                metrics_enabled=True,
+                loop_lag_monitor_enabled=True,
+                loop_lag_monitor_interval=0.05,
+            )
+        )
+        app = FastAPI()
+        try:
+            container.configure(app=app)
+            monitor = container._loop_monitor
+
+            assert monitor.interval == 0.05
+            assert monitor.metrics is container.get_metrics_collector()
+            assert monitor.start in app.router.on_startup
+        finally:
+            container.reset()
+
+        assert container._loop_monitor is None
+
+    def test_interval_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(loop_lag_monitor_interval=0)
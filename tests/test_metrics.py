@@ -1,6 +1,7 @@
 """Tests for metrics collection system."""
 
 import asyncio
+import threading
 from typing import Any, Dict
 from unittest.mock import patch
 
@@ -12,6 +13,7 @@ from fapilog._internal.metrics import (
     QueueMetrics,
 )
 from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.top_k import SpaceSavingCounter
 from fapilog.monitoring import (
     PrometheusExporter,
     get_metrics_dict,
@@ -118,9 +120,9 @@ class TestMetricsCollector:
         assert metrics.last_error == "Connection error"
         assert metrics.last_error_time is not None
 
-        # Test retry recording
+        # Test retry recording (metrics are snapshots, so read them again)
         collector.record_sink_retry("TestSink")
-        assert metrics.total_retries == 1
+        assert collector.get_sink_metrics("TestSink").total_retries == 1
 
     def test_performance_metrics(self):
         """Test performance metrics recording."""
@@ -211,6 +213,218 @@ class TestMetricsCollector:
         assert len(metrics_after["sinks"]) == 0
         assert metrics_after["performance"]["total_log_events"] == 0
 
+    def test_sliding_window_evicts_with_running_sum(self):
+        """Averages cover only the last sample_window samples."""
+        collector = MetricsCollector(enabled=True, sample_window=3)
+
+        for latency in (100.0, 1.0, 2.0, 3.0):
+            collector.record_enqueue(latency)
+
+        assert collector.queue_metrics.total_enqueued == 4
+        assert collector.queue_metrics.enqueue_latency_ms == pytest.approx(2.0)
+
+    def test_running_sum_does_not_drift(self):
+        """Long runs of evictions keep the running sum exact."""
+        collector = MetricsCollector(enabled=True, sample_window=10)
+
+        for i in range(10_000):
+            collector.record_log_event(0.1 * (i % 7) + 1e9 * (i % 2))
+        for _ in range(10):
+            collector.record_log_event(0.5)
+
+        avg = collector.performance_metrics.avg_processing_time_ms
+        assert avg == pytest.approx(0.5, abs=1e-9)
+
+    def test_per_thread_shards_are_aggregated(self):
+        """Counts recorded from several threads are merged on read."""
+        collector = MetricsCollector(enabled=True)
+
+        def record():
+            for _ in range(1000):
+                collector.record_enqueue(1.0)
+                collector.record_sink_write("TestSink", 2.0, True, 1)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert collector.queue_metrics.total_enqueued == 4000
+        assert collector.get_sink_metrics("TestSink").total_writes == 4000
+        assert collector.get_sink_metrics("TestSink").avg_write_latency_ms == 2.0
+
+    def test_exited_threads_shards_are_retired(self):
+        """Shards of finished threads are folded in when a thread registers."""
+        collector = MetricsCollector(enabled=True)
+
+        def record():
+            collector.record_enqueue(1.0)
+            collector.record_sink_write("TestSink", 2.0, False, 1, error="boom")
+            collector.record_request("GET", "/", 200, 5.0)
+
+        for _ in range(20):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+        collector.record_enqueue(1.0)
+
+        assert len(collector._shards) == 2
+        assert collector.queue_metrics.total_enqueued == 21
+        sink = collector.get_sink_metrics("TestSink")
+        assert sink.total_failures == 20
+        assert sink.last_error == "boom"
+        assert collector.request_latency[("GET", "/", 200)].count == 20
+
+    def test_latency_histograms_use_configured_buckets(self):
+        """Enqueue, dwell, batch and sink latencies land in histograms."""
+        collector = MetricsCollector(enabled=True, histogram_buckets=[1.0, 10.0])
+
+        collector.record_enqueue(0.5)
+        collector.record_queue_dwell(4.0)
+        collector.record_batch_processing(20.0)
+        collector.record_sink_write("TestSink", 5.0, True, 1)
+
+        histograms = collector.latency_histograms
+        assert histograms["enqueue"].counts == [1, 0, 0]
+        assert histograms["dwell"].counts == [0, 1, 0]
+        assert histograms["batch_processing"].counts == [0, 0, 1]
+        assert collector.sink_latency["TestSink"].counts == [0, 1, 0]
+
+        metrics = collector.get_all_metrics()
+        assert metrics["latency"]["batch_processing"]["max"] == 20.0
+        assert metrics["sinks"]["TestSink"]["write_latency"]["count"] == 1
+
+    def test_prometheus_latency_histograms(self):
+        """Latency histograms are exported as _bucket/_sum/_count series."""
+        collector = MetricsCollector(enabled=True, histogram_buckets=[1.0, 10.0])
+        collector.record_queue_dwell(4.0)
+        collector.record_sink_write("StdoutSink", 3.0, True, 1)
+
+        text = collector.get_prometheus_metrics()
+
+        assert "# TYPE fapilog_queue_dwell_ms histogram" in text
+        assert 'fapilog_queue_dwell_ms_bucket{le="1"} 0' in text
+        assert 'fapilog_queue_dwell_ms_bucket{le="10"} 1' in text
+        assert 'fapilog_queue_dwell_ms_bucket{le="+Inf"} 1' in text
+        assert "fapilog_queue_dwell_ms_sum 4.0" in text
+        assert "fapilog_queue_enqueue_duration_ms_count 0" in text
+        assert (
+            'fapilog_sink_write_duration_ms_bucket{sink="StdoutSink",le="10"} 1'
+        ) in text
+
+    def test_sink_delivery_histograms(self):
+        """Per-sink dwell and end-to-end times are exported per sink."""
+        collector = MetricsCollector(enabled=True, histogram_buckets=[1.0, 10.0])
+        collector.record_sink_delivery("FileSink", dwell_ms=0.5, end_to_end_ms=4.0)
+
+        assert collector.sink_dwell_latency["FileSink"].counts == [1, 0, 0]
+        assert collector.sink_end_to_end_latency["FileSink"].counts == [0, 1, 0]
+
+        text = collector.get_prometheus_metrics()
+        assert 'fapilog_sink_dwell_ms_count{sink="FileSink"} 1' in text
+        assert 'fapilog_event_end_to_end_ms_bucket{sink="FileSink",le="10"} 1' in text
+        # No writes were recorded for the sink, so it has no write series
+        assert 'fapilog_sink_write_duration_ms_count{sink="FileSink"}' not in text
+
+    def test_event_volume_by_source(self):
+        """Events and bytes are broken down by level, logger and event."""
+        collector = MetricsCollector(enabled=True, top_k=2)
+        collector.record_event_volume("info", "app.db", "query", 100)
+        collector.record_event_volume("info", "app.db", "query", 100)
+        collector.record_event_volume("error", "app.api", 'bad "input"', 40)
+
+        volume = collector.get_all_metrics()["volume"]
+        assert volume["level"][0] == {
+            "key": "info",
+            "events": 2,
+            "bytes": 200,
+            "error": 0,
+        }
+        assert [entry["key"] for entry in volume["logger"]] == ["app.db", "app.api"]
+
+        text = collector.get_prometheus_metrics()
+        assert 'fapilog_events_by_logger_total{logger="app.db"} 2' in text
+        assert 'fapilog_bytes_by_level_total{level="error"} 40' in text
+        assert 'fapilog_events_by_event_total{event="bad \\"input\\""} 1' in text
+
+    def test_event_volume_merges_threads(self):
+        """Per-thread top-K counters are merged on read."""
+        collector = MetricsCollector(enabled=True)
+
+        def record():
+            for _ in range(100):
+                collector.record_event_volume("info", "worker", "tick", 10)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (entry,) = collector.event_volume["logger"].top()
+        assert entry == ("worker", 400, 4000, 0)
+
+    def test_event_volume_read_while_threads_record(self):
+        """Reading merges live counters that are still evicting keys."""
+        collector = MetricsCollector(enabled=True, top_k=500)
+        stop = threading.Event()
+
+        def record(worker):
+            n = 0
+            while not stop.is_set():
+                collector.record_event_volume("info", "app", f"e{worker}-{n}", 1)
+                n += 1
+
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(200):
+                volume = collector.event_volume
+                assert len(volume["event"].top()) <= 500
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+
+class TestSpaceSavingCounter:
+    """Test the bounded top-K counter."""
+
+    def test_evicts_least_frequent_key(self):
+        counter = SpaceSavingCounter(2)
+        for key in ["a", "a", "a", "b", "c"]:
+            counter.add(key, 1)
+
+        # "c" replaced "b" and inherited its count as error
+        assert counter.top() == [("a", 3, 3, 0), ("c", 2, 2, 1)]
+
+    def test_heavy_hitter_survives_noise(self):
+        counter = SpaceSavingCounter(5)
+        for i in range(1000):
+            counter.add("hot" if i % 3 == 0 else f"noise-{i}")
+
+        key, events, _, error = counter.top()[0]
+        assert key == "hot"
+        assert events - error <= 334 <= events
+
+    def test_merge_keeps_capacity(self):
+        left, right = SpaceSavingCounter(2), SpaceSavingCounter(2)
+        left.add("a", 5)
+        left.add("b", 5)
+        right.add("b", 5)
+        right.add("c", 5)
+
+        left.merge(right)
+
+        assert len(left.entries) == 2
+        assert left.top()[0] == ("b", 2, 10, 0)
+
+    def test_capacity_validated(self):
+        with pytest.raises(ValueError):
+            SpaceSavingCounter(0)
+
 
 class TestMetricsIntegration:
     """Test metrics integration with queue and sinks."""
@@ -283,6 +497,14 @@ class TestMetricsIntegration:
             # Should have processed events
             assert metrics["performance"]["total_log_events"] > 0
 
+            # Every dequeued event records how long it waited
+            assert metrics["latency"]["dwell"]["count"] == 2
+
+            # Each sink records dwell and end-to-end time from queue capture
+            delivery = metrics["sinks"]["MockSink"]
+            assert delivery["end_to_end"]["count"] == 2
+            assert delivery["end_to_end"]["max"] >= delivery["dwell"]["max"]
+
         finally:
             await worker.stop()
 
@@ -350,10 +572,9 @@ class TestPrometheusExporter:
         assert exporter.path == "/custom-metrics"
         assert exporter.enabled
 
-        # Test with FastAPI not available
-        with patch("fapilog.monitoring.FastAPI", None):
-            exporter = PrometheusExporter(enabled=True)
-            assert not exporter.enabled
+        # Unknown serving modes are rejected
+        with pytest.raises(ValueError):
+            PrometheusExporter(mode="uvicorn")
 
     def test_disabled_exporter(self):
         """Test disabled Prometheus exporter."""
@@ -370,15 +591,8 @@ class TestPrometheusExporter:
             enabled=True,
         )
 
-        # Test that we can start (but might fail due to dependencies)
-        try:
-            await exporter.start()
-            assert (
-                exporter.is_running() or not exporter.enabled
-            )  # May be disabled if FastAPI not available
-        except Exception:
-            # Expected if FastAPI/uvicorn not available
-            pass
+        await exporter.start()
+        assert exporter.is_running()
 
         await exporter.stop()
         assert not exporter.is_running()
@@ -0,0 +1,144 @@
+"""Tests for the lightweight Prometheus metrics endpoint."""
+
+import asyncio
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from fapilog._internal.metrics import MetricsCollector
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
+from fapilog.monitoring import PrometheusExporter
+from fapilog.settings import LoggingSettings
+
+
+def _container(collector):
+    container = Mock()
+    container.get_metrics_collector.return_value = collector
+    return container
+
+
+@pytest.fixture
+def collector():
+    collector = MetricsCollector(enabled=True)
+    collector.record_queue_size(3)
+    return collector
+
+
+class TestRenderCache:
+    """Test TTL caching of the exposition text."""
+
+    def test_scrapes_within_ttl_reuse_rendered_text(self):
+        collector = Mock()
+        collector.is_enabled.return_value = True
+        collector.get_prometheus_metrics.return_value = "fapilog_queue_size 1"
+        exporter = PrometheusExporter(container=_container(collector), cache_ttl=60)
+
+        for _ in range(5):
+            assert exporter.render_metrics() == (200, "fapilog_queue_size 1")
+
+        collector.get_prometheus_metrics.assert_called_once()
+
+    def test_zero_ttl_renders_every_time(self):
+        collector = Mock()
+        collector.is_enabled.return_value = True
+        collector.get_prometheus_metrics.return_value = ""
+        exporter = PrometheusExporter(container=_container(collector), cache_ttl=0)
+
+        exporter.render_metrics()
+        exporter.render_metrics()
+
+        assert collector.get_prometheus_metrics.call_count == 2
+
+    def test_unknown_path_and_method(self):
+        exporter = PrometheusExporter()
+
+        assert exporter.handle_request("GET", "/other")[0] == 404
+        assert exporter.handle_request("POST", "/metrics")[0] == 405
+
+
+class TestServers:
+    """Test the thread and asyncio servers over real sockets."""
+
+    @pytest.mark.asyncio
+    async def test_thread_server_serves_metrics(self, collector):
+        exporter = PrometheusExporter(
+            host="127.0.0.1", port=0, container=_container(collector)
+        )
+        await exporter.start()
+        try:
+            port = exporter._http_server.server_address[1]
+            url = f"http://127.0.0.1:{port}/metrics?x=1"
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, urllib.request.urlopen, url
+            )
+            body = response.read().decode()
+        finally:
+            await exporter.stop()
+
+        assert response.status == 200
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "fapilog_queue_size 3" in body
+
+    @pytest.mark.asyncio
+    async def test_asyncio_server_serves_metrics(self, collector):
+        exporter = PrometheusExporter(
+            host="127.0.0.1", port=0, container=_container(collector), mode="asyncio"
+        )
+        await exporter.start()
+        try:
+            port = exporter._server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            response = (await reader.read()).decode()
+            writer.close()
+        finally:
+            await exporter.stop()
+
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "fapilog_queue_size 3" in response
+        assert not exporter.is_running()
+
+
+class TestMount:
+    """Test serving the endpoint from the application itself."""
+
+    def test_mount_adds_route_to_app(self, collector):
+        app = FastAPI()
+        exporter = PrometheusExporter(container=_container(collector), mode="mount")
+        exporter.mount(app)
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert "fapilog_queue_size 3" in response.text
+        assert exporter.is_running()
+
+    def test_container_mounts_on_configured_app(self):
+        app = FastAPI()
+        container = LoggingContainer(
+            LoggingSettings(
+                sinks=[],
+                metrics_enabled=True,
+                metrics_prometheus_enabled=True,
+                metrics_prometheus_mode="mount",
+            )
+        )
+        container.configure(app=app)
+        try:
+            response = TestClient(app).get("/metrics")
+        finally:
+            container.reset()
+
+        assert response.status_code == 200
+        assert "fapilog_queue_size" in response.text
+
+    def test_settings_validation(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(metrics_prometheus_cache_ttl=-1)
+        with pytest.raises(ValueError):
+            LoggingSettings(metrics_prometheus_mode="uvicorn")
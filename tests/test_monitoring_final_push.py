@@ -7,20 +7,6 @@ import pytest
 from fapilog.monitoring import PrometheusExporter
 
 
-class TestPrometheusExporterDisabled:
-    """Test PrometheusExporter when disabled."""
-
-    def test_setup_app_when_disabled(self):
-        """Test _setup_app early return when disabled."""
-        exporter = PrometheusExporter(port=9090, enabled=False)
-
-        # This should hit the early return on line 63
-        exporter._setup_app()
-
-        # Should not have created an app
-        assert exporter._app is None
-
-
 class TestMetricsEndpointErrors:
     """Test error scenarios in metrics endpoints."""
 
@@ -35,16 +21,17 @@ class TestMetricsEndpointErrors:
         exporter = PrometheusExporter(port=9090, enabled=True, container=mock_container)
 
         # This should return 503 status
-        exporter._setup_app()
-        assert exporter._app is not None
+        status, body = exporter.render_metrics()
+        assert status == 503
+        assert "disabled" in body
 
     def test_metrics_endpoint_when_collector_missing(self):
         """Test metrics endpoint when metrics collector is None."""
         # Create exporter without container (no metrics collector available)
         exporter = PrometheusExporter(port=9090, enabled=True)  # No container
 
-        exporter._setup_app()
-        assert exporter._app is not None
+        status, _ = exporter.render_metrics()
+        assert status == 503
 
     def test_metrics_endpoint_generation_error(self):
         """Test metrics endpoint when prometheus metrics generation fails."""
@@ -57,8 +44,9 @@ class TestMetricsEndpointErrors:
 
         exporter = PrometheusExporter(port=9090, enabled=True, container=mock_container)
 
-        exporter._setup_app()
-        assert exporter._app is not None
+        status, body = exporter.render_metrics()
+        assert status == 500
+        assert "Metrics error" in body
 
 
 class TestHealthEndpoint:
@@ -68,10 +56,11 @@ class TestHealthEndpoint:
         """Test that health endpoint is properly set up."""
         exporter = PrometheusExporter(port=9090, enabled=True)
 
-        exporter._setup_app()
+        status, content_type, body = exporter.handle_request("GET", "/health")
 
-        # Should have created an app with health endpoint
-        assert exporter._app is not None
+        assert status == 200
+        assert content_type == "application/json"
+        assert '"status": "healthy"' in body
 
 
 class TestMonitoringDisabledState:
@@ -83,18 +72,18 @@ class TestMonitoringDisabledState:
 
         # Should be disabled
         assert not exporter.enabled
-        assert exporter._app is None
+        assert not exporter.is_running()
 
-    def test_disabled_exporter_setup_does_nothing(self):
-        """Test that disabled exporter setup doesn't create resources."""
-        exporter = PrometheusExporter(port=9090, enabled=False)
+    def test_disabled_exporter_mount_does_nothing(self):
+        """Test that a disabled exporter does not mount a route."""
+        exporter = PrometheusExporter(port=9090, enabled=False, mode="mount")
+        app = Mock()
 
         # Multiple calls should be safe
-        exporter._setup_app()
-        exporter._setup_app()
+        exporter.mount(app)
+        exporter.mount(app)
 
-        # Should still have no app
-        assert exporter._app is None
+        app.add_route.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -20,27 +20,31 @@ from fapilog.monitoring import (
 class TestPrometheusExporterBasics:
     """Test basic PrometheusExporter functionality."""
 
-    def test_prometheus_exporter_disables_when_fastapi_unavailable(self):
-        """Test that PrometheusExporter disables itself when FastAPI is not available."""
-        with patch("fapilog.monitoring.FastAPI", None):
-            exporter = PrometheusExporter(enabled=True)
-            assert not exporter.enabled
+    def test_prometheus_exporter_rejects_unknown_mode(self):
+        """Test that PrometheusExporter validates the serving mode."""
+        with pytest.raises(ValueError, match="Invalid exporter mode"):
+            PrometheusExporter(mode="uvicorn")
+
+    def test_mount_logs_warning_when_starlette_unavailable(self):
+        """Test that mount() warns and does nothing without Starlette."""
+        app = MagicMock()
+        exporter = PrometheusExporter(enabled=True, mode="mount")
 
-    def test_prometheus_exporter_logs_warning_when_fastapi_unavailable(self):
-        """Test that PrometheusExporter logs warning when FastAPI is not available."""
-        with patch("fapilog.monitoring.FastAPI", None), patch(
+        with patch("fapilog.monitoring.Response", None), patch(
             "fapilog.monitoring.logger"
         ) as mock_logger:
-            PrometheusExporter(enabled=True)
+            exporter.mount(app)
 
             mock_logger.warning.assert_called_once()
-            assert "FastAPI not available" in mock_logger.warning.call_args[0][0]
+            assert "Starlette not available" in mock_logger.warning.call_args[0][0]
+        app.add_route.assert_not_called()
+        assert not exporter.is_running()
 
     def test_prometheus_exporter_disabled_initialization(self):
         """Test PrometheusExporter initialization when disabled."""
         exporter = PrometheusExporter(enabled=False)
         assert not exporter.enabled
-        assert exporter._app is None
+        assert not exporter.is_running()
 
     def test_get_metrics_url_when_disabled(self):
         """Test get_metrics_url returns None when disabled."""
@@ -49,13 +53,13 @@ class TestPrometheusExporterBasics:
 
     def test_get_metrics_url_when_enabled(self):
         """Test get_metrics_url returns correct URL when enabled."""
-        with patch("fapilog.monitoring.FastAPI") as mock_fastapi:
-            mock_fastapi.return_value = MagicMock()
-            exporter = PrometheusExporter(
-                enabled=True, host="localhost", port=9090, path="/custom"
-            )
-            url = exporter.get_metrics_url()
-            assert url == "http://localhost:9090/custom"
+        exporter = PrometheusExporter(
+            enabled=True, host="localhost", port=9090, path="/custom"
+        )
+        assert exporter.get_metrics_url() == "http://localhost:9090/custom"
+
+        mounted = PrometheusExporter(enabled=True, path="/custom", mode="mount")
+        assert mounted.get_metrics_url() == "/custom"
 
     def test_is_running_states(self):
         """Test is_running() in various states."""
@@ -63,39 +67,26 @@ class TestPrometheusExporterBasics:
         exporter = PrometheusExporter(enabled=False)
         assert not exporter.is_running()
 
-        # Enabled but no task
-        with patch("fapilog.monitoring.FastAPI") as mock_fastapi:
-            mock_fastapi.return_value = MagicMock()
-            exporter = PrometheusExporter(enabled=True)
-            assert not exporter.is_running()
+        # Enabled but not started
+        exporter = PrometheusExporter(enabled=True)
+        assert not exporter.is_running()
 
-            # With completed task
-            mock_task = MagicMock()
-            mock_task.done.return_value = True
-            exporter._server_task = mock_task
-            assert not exporter.is_running()
+        # With a finished server thread
+        mock_thread = MagicMock()
+        mock_thread.is_alive.return_value = False
+        exporter._thread = mock_thread
+        assert not exporter.is_running()
 
-            # With running task
-            mock_task.done.return_value = False
-            assert exporter.is_running()
+        # With a live server thread
+        mock_thread.is_alive.return_value = True
+        assert exporter.is_running()
 
 
 class TestPrometheusExporterServerControl:
     """Test server start/stop functionality."""
 
-    @pytest.fixture
-    def mock_fastapi_components(self):
-        """Mock FastAPI and uvicorn components."""
-        with patch("fapilog.monitoring.FastAPI") as mock_fastapi, patch(
-            "fapilog.monitoring.uvicorn"
-        ) as mock_uvicorn:
-            mock_app = MagicMock()
-            mock_fastapi.return_value = mock_app
-
-            yield {"FastAPI": mock_fastapi, "app": mock_app, "uvicorn": mock_uvicorn}
-
     @pytest.mark.asyncio
-    async def test_start_server_when_disabled(self, mock_fastapi_components):
+    async def test_start_server_when_disabled(self):
         """Test start() when exporter is disabled."""
         exporter = PrometheusExporter(enabled=False)
 
@@ -106,60 +97,46 @@ class TestPrometheusExporterServerControl:
             )
 
     @pytest.mark.asyncio
-    async def test_start_server_already_running(self, mock_fastapi_components):
+    async def test_start_server_already_running(self):
         """Test start() when server is already running."""
         exporter = PrometheusExporter(enabled=True)
 
-        mock_task = MagicMock()
-        mock_task.done.return_value = False
-        exporter._server_task = mock_task
+        mock_thread = MagicMock()
+        mock_thread.is_alive.return_value = True
+        exporter._thread = mock_thread
 
         with patch("fapilog.monitoring.logger") as mock_logger:
             await exporter.start()
             mock_logger.debug.assert_called_with("Prometheus exporter already running")
 
     @pytest.mark.asyncio
-    async def test_start_server_success(self, mock_fastapi_components):
-        """Test successful server start."""
-        mocks = mock_fastapi_components
-        exporter = PrometheusExporter(enabled=True, host="127.0.0.1", port=9090)
+    async def test_start_server_success(self):
+        """Test successful server start on a background thread."""
+        exporter = PrometheusExporter(enabled=True, host="127.0.0.1", port=0)
 
-        mock_config = MagicMock()
-        mock_server = MagicMock()
-        mock_task = AsyncMock()
-
-        mocks["uvicorn"].Config.return_value = mock_config
-        mocks["uvicorn"].Server.return_value = mock_server
-
-        with patch(
-            "asyncio.create_task", return_value=mock_task
-        ) as mock_create_task, patch("fapilog.monitoring.logger") as mock_logger:
+        with patch("fapilog.monitoring.logger") as mock_logger:
             await exporter.start()
+            try:
+                assert exporter.is_running()
+                mock_logger.info.assert_called_once()
+                assert (
+                    "started on http://127.0.0.1:0"
+                    in (mock_logger.info.call_args[0][0])
+                )
+            finally:
+                await exporter.stop()
 
-            mocks["uvicorn"].Config.assert_called_once_with(
-                app=exporter._app,
-                host="127.0.0.1",
-                port=9090,
-                log_level="error",
-                access_log=False,
-            )
-            mocks["uvicorn"].Server.assert_called_once_with(mock_config)
-            mock_create_task.assert_called_once()
-
-            mock_logger.info.assert_called_once()
-            assert (
-                "started on http://127.0.0.1:9090" in mock_logger.info.call_args[0][0]
-            )
+        assert not exporter.is_running()
 
     @pytest.mark.asyncio
-    async def test_start_server_exception(self, mock_fastapi_components):
+    async def test_start_server_exception(self):
         """Test server start with exception."""
-        mocks = mock_fastapi_components
         exporter = PrometheusExporter(enabled=True)
 
-        mocks["uvicorn"].Config.side_effect = Exception("Server start error")
-
-        with patch("fapilog.monitoring.logger") as mock_logger:
+        with patch(
+            "fapilog.monitoring.ThreadingHTTPServer",
+            side_effect=OSError("Server start error"),
+        ), patch("fapilog.monitoring.logger") as mock_logger:
             await exporter.start()
 
             mock_logger.error.assert_called_once()
@@ -170,25 +147,23 @@ class TestPrometheusExporterServerControl:
             assert not exporter.enabled
 
     @pytest.mark.asyncio
-    async def test_stop_server_no_task(self):
-        """Test stop() when no server task exists."""
-        exporter = PrometheusExporter(enabled=True)
-        exporter._server_task = None
+    async def test_start_in_mount_mode_starts_no_server(self):
+        """Test start() is a no-op when the endpoint is mounted on the app."""
+        exporter = PrometheusExporter(enabled=True, mode="mount")
 
-        await exporter.stop()  # Should not raise exception
+        await exporter.start()
+
+        assert exporter._thread is None
+        assert exporter._server is None
 
     @pytest.mark.asyncio
-    async def test_stop_server_task_done(self):
-        """Test stop() when task is already done."""
+    async def test_stop_server_not_started(self):
+        """Test stop() when no server was started."""
         exporter = PrometheusExporter(enabled=True)
 
-        mock_task = MagicMock()
-        mock_task.done.return_value = True
-        exporter._server_task = mock_task
-
-        await exporter.stop()
+        await exporter.stop()  # Should not raise exception
 
-        mock_task.cancel.assert_not_called()
+        assert not exporter.is_running()
 
 
 class TestGlobalFunctions:
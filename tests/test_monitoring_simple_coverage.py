@@ -77,12 +77,11 @@ class TestMonitoringUtilityFunctions:
 
     def test_create_prometheus_exporter(self):
         """Test create_prometheus_exporter function."""
-        # Test with FastAPI disabled
-        with patch("fapilog.monitoring.FastAPI", None):
-            exporter = create_prometheus_exporter(port=9999)
-            assert exporter is not None
-            assert not exporter.enabled
-            assert exporter.port == 9999
+        exporter = create_prometheus_exporter(port=9999, mode="asyncio")
+        assert exporter is not None
+        assert exporter.enabled
+        assert exporter.mode == "asyncio"
+        assert exporter.port == 9999
 
     def test_prometheus_exporter_disabled_start_stop(self):
         """Test PrometheusExporter start/stop when disabled."""
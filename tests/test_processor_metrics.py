@@ -10,14 +10,18 @@ import pytest
 from fapilog._internal.processor import Processor
 from fapilog._internal.processor_metrics import (
     ProcessorMetrics,
+    estimate_event_size,
     wrap_processor_with_metrics,
 )
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
 from fapilog.monitoring import (
     get_processor_health_status,
     get_processor_performance_stats,
     get_processor_summary,
     reset_processor_metrics,
 )
+from fapilog.settings import LoggingSettings
 
 
 class TestProcessorMetrics:
@@ -487,3 +491,95 @@ class TestIntegration:
         # Test monitoring API still works (returns empty)
         api_stats = get_processor_performance_stats()
         assert api_stats == {}  # Empty since using per-call instances
+
+
+class TestSampledProfiling:
+    """Test sampled profiling and per-thread buffers."""
+
+    def test_samples_one_in_n_executions(self):
+        metrics = ProcessorMetrics(sample_every=4)
+        wrapped = wrap_processor_with_metrics(MockFastProcessor(), metrics)
+
+        for _ in range(20):
+            wrapped(None, "info", {"level": "INFO", "event": "hello"})
+
+        stats = metrics.get_processor_stats("MockFastProcessor")
+        assert stats["total_executions"] == 20
+        assert stats["successful_executions"] == 20
+        assert stats["profiled_executions"] == 5
+        assert stats["total_bytes_processed"] > 0
+        assert stats["average_latency_ms"] >= 0
+
+    def test_unsampled_failures_are_counted(self):
+        metrics = ProcessorMetrics()
+        wrapped = wrap_processor_with_metrics(
+            MockFailingProcessor(), metrics, sample_every=10
+        )
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                wrapped(None, "info", {"event": "x"})
+
+        stats = metrics.get_processor_stats("MockFailingProcessor")
+        assert stats["failed_executions"] == 3
+        assert stats["profiled_executions"] == 1
+        assert stats["error_counts"] == {"Mock processor error": 3}
+
+    def test_threads_merge_on_read(self):
+        metrics = ProcessorMetrics()
+
+        def record():
+            for _ in range(50):
+                metrics.record_processor_execution("P", 1.0, True)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.get_processor_stats("P")["total_executions"] == 200
+
+        metrics.reset_stats()
+        assert metrics.get_all_stats() == {}
+
+    def test_exited_threads_buffers_are_retired(self):
+        metrics = ProcessorMetrics()
+
+        def record():
+            metrics.record_processor_execution("P", 1.0, False, error="boom")
+
+        for _ in range(20):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+        metrics.record_processor_execution("P", 3.0, True)
+
+        assert len(metrics._buffers) == 1
+        stats = metrics.get_processor_stats("P")
+        assert stats["total_executions"] == 21
+        assert stats["error_counts"] == {"boom": 20}
+        assert stats["max_latency_ms"] == 3.0
+
+        metrics.reset_stats("P")
+        assert metrics.get_processor_stats("P") == {}
+
+    def test_estimate_event_size(self):
+        assert estimate_event_size({}) == 2
+        assert estimate_event_size({"a": "bc", "n": 10}) == 2 + 7 + 2 + 7 + 2
+
+    def test_monitoring_reads_container_stats(self):
+        container = LoggingContainer(
+            LoggingSettings(sinks=[], processor_metrics_sample_every=3)
+        )
+        metrics = container.get_processor_metrics()
+        assert metrics.sample_every == 3
+        metrics.record_processor_execution("P", 2.0, True)
+
+        stats = get_processor_performance_stats(container)
+
+        assert stats["P"]["total_executions"] == 1
+
+    def test_sample_every_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(processor_metrics_sample_every=0)
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 import structlog
 
+from fapilog._internal.metrics import MetricsCollector
 from fapilog._internal.queue_integration import create_queue_sink, queue_sink
 from fapilog._internal.queue_worker import QueueWorker
 from fapilog.container import LoggingContainer
@@ -169,6 +170,26 @@ class TestCreateQueueSink:
         with pytest.raises(structlog.DropEvent):
             queue_sink_func(Mock(), "info", event_dict)
 
+    def test_create_queue_sink_records_event_volume(self):
+        """Accepted events are counted by level, logger name and event."""
+        collector = MetricsCollector(enabled=True)
+        container = Mock()
+        container.get_metrics_collector.return_value = collector
+        container.queue_worker = MockQueueWorker(overflow_strategy="drop")
+        stdlib_logger = Mock()
+        stdlib_logger.name = "app.payments"
+
+        queue_sink_func = create_queue_sink(container)
+        with pytest.raises(structlog.DropEvent):
+            queue_sink_func(
+                stdlib_logger, "warning", {"level": "warning", "event": "declined"}
+            )
+
+        volume = collector.event_volume
+        assert volume["logger"].top()[0][:2] == ("app.payments", 1)
+        assert volume["level"].top()[0][:2] == ("warning", 1)
+        assert volume["event"].top()[0][2] > 0
+
     def test_create_queue_sink_block_strategy_success(self):
         """Test create_queue_sink with block strategy - successful enqueue."""
         container = Mock()
@@ -0,0 +1,183 @@
+"""Tests for the queue's byte budget."""
+
+import asyncio
+import threading
+
+import pytest
+
+from fapilog._internal.lane_queue import LaneQueue
+from fapilog._internal.processor_metrics import estimate_event_size
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.ring_buffer import RingBuffer
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+def _sized(event):
+    """Sizer that reads an event's size from the event itself."""
+    return event["size"]
+
+
+def _event(size, level="info"):
+    return {"level": level, "size": size}
+
+
+class TestRingBufferBudget:
+    """Test byte accounting in the ring buffer."""
+
+    def test_running_total_follows_puts_and_drains(self):
+        queue = RingBuffer(4, sizer=_sized)
+        for size in (10, 20, 30):
+            queue.put_nowait(_event(size))
+        assert queue.bytes == 60
+
+        queue.drain(2)
+        queue.put_nowait(_event(40))
+        queue.put_nowait(_event(50))  # wraps around the slot array
+        assert queue.bytes == 120
+
+        queue.drain(10)
+        assert queue.bytes == 0
+
+    def test_refuses_events_past_budget(self):
+        queue = RingBuffer(10, max_bytes=100, sizer=_sized)
+        queue.put_nowait(_event(60))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event(50))
+        queue.put_nowait(_event(40))
+        assert queue.bytes == 100
+
+    def test_oversized_event_accepted_when_empty(self):
+        queue = RingBuffer(10, max_bytes=100, sizer=_sized)
+
+        queue.put_nowait(_event(500))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event(1))
+
+    def test_budget_requires_sizer(self):
+        with pytest.raises(ValueError):
+            RingBuffer(10, max_bytes=100)
+
+    @pytest.mark.asyncio
+    async def test_threadsafe_puts_count_against_budget(self):
+        queue = RingBuffer(10, max_bytes=100, sizer=_sized)
+        queue.bind(asyncio.get_running_loop())
+        results = []
+
+        def producer():
+            results.append(queue.put_threadsafe(_event(70)))
+            results.append(queue.put_threadsafe(_event(70)))
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        thread.join()
+
+        assert results == [True, False]
+        assert queue.bytes == 70
+        assert queue.drain(10) == [_event(70)]
+        assert queue.bytes == 0
+
+
+class TestLaneQueueBudget:
+    """Test the byte budget shared by both lanes."""
+
+    def test_error_evicts_low_priority_bytes(self):
+        evicted = []
+        queue = LaneQueue(10, 10, on_evict=evicted.append, max_bytes=100, sizer=_sized)
+        for _ in range(3):
+            queue.put_nowait(_event(30))
+
+        queue.put_nowait(_event(50, "error"))
+
+        assert len(evicted) == 2
+        assert queue.bytes == 80
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event(30))
+
+    def test_error_rejected_when_errors_fill_budget(self):
+        evicted = []
+        queue = LaneQueue(10, 10, on_evict=evicted.append, max_bytes=100, sizer=_sized)
+        queue.put_nowait(_event(80, "error"))
+        queue.put_nowait(_event(10))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_event(50, "critical"))
+        assert evicted == []
+
+    @pytest.mark.asyncio
+    async def test_threadsafe_put_waits_for_bytes(self):
+        queue = LaneQueue(10, 10, max_bytes=100, sizer=_sized)
+        loop = asyncio.get_running_loop()
+        queue.bind(loop)
+        queue.put_nowait(_event(80, "error"))
+        loop.call_later(0.05, queue.drain, 1)
+
+        accepted = await loop.run_in_executor(
+            None, lambda: queue.put_threadsafe(_event(50), timeout=5.0)
+        )
+        refused = await loop.run_in_executor(
+            None, lambda: queue.put_threadsafe(_event(60), timeout=0.05)
+        )
+
+        assert accepted
+        assert not refused
+        assert queue.drain(10) == [_event(50)]
+
+
+class TestWorkerBudget:
+    """Test the worker's queue with a byte budget."""
+
+    @pytest.mark.asyncio
+    async def test_large_payload_overflows_and_total_exported(self, container):
+        worker = QueueWorker(
+            sinks=[],
+            queue_max_bytes=1000,
+            container=container,
+            drop_summary_interval=0,
+        )
+        small = {"event": "small"}
+
+        assert await worker.enqueue(small)
+        assert not await worker.enqueue({"event": "x" * 2000})
+        assert worker.queue.bytes == estimate_event_size(small)
+
+        await worker._collect_batch()
+        queue = container.metrics.get_all_metrics()["queue"]
+        assert queue["bytes"] == 0
+        assert queue["memory_usage_bytes"] == 0
+        assert "fapilog_queue_bytes 0" in container.metrics.get_prometheus_metrics()
+
+    @pytest.mark.asyncio
+    async def test_spill_by_bytes_and_replay_within_budget(self, tmp_path):
+        sink = RecordingSink()
+        worker = QueueWorker(
+            sinks=[sink],
+            batch_timeout=0.01,
+            queue_max_bytes=2000,
+            spill_dir=str(tmp_path),
+            spill_watermark=0.5,
+            spill_replay_rate=0,
+            drop_summary_interval=0,
+        )
+        for n in range(200):
+            assert await worker.enqueue({"event": n})
+        assert worker.queue.bytes < 1000 + estimate_event_size({"event": 0})
+        assert worker.spill.pending == 200 - worker.queue.qsize() > 100
+
+        await worker.start()
+        for _ in range(200):
+            if len(sink.events) == 200:
+                break
+            await asyncio.sleep(0.01)
+        await worker.shutdown()
+
+        assert [e["event"] for e in sink.events] == list(range(200))
+        assert worker.spill.pending == 0
+
+    def test_setting_validated(self):
+        assert LoggingSettings(queue_max_bytes=1024).queue_max_bytes == 1024
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(queue_max_bytes=-1)
@@ -0,0 +1,154 @@
+"""Tests for per-route request latency histograms."""
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from fapilog._internal.histogram import Histogram
+from fapilog._internal.metrics import MetricsCollector
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
+from fapilog.middleware import TraceIDMiddleware
+from fapilog.settings import LoggingSettings
+
+
+class TestHistogram:
+    """Test the fixed-bucket histogram."""
+
+    def test_observe_uses_le_semantics(self):
+        histogram = Histogram([1.0, 10.0])
+
+        for value in (0.5, 1.0, 5.0, 50.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.cumulative_counts() == [2, 3, 4]
+        assert histogram.count == 4
+        assert histogram.sum == 56.5
+
+    def test_quantile_interpolates_within_bucket(self):
+        histogram = Histogram([10.0, 20.0])
+        for _ in range(10):
+            histogram.observe(15.0)
+
+        assert histogram.quantile(0.5) == pytest.approx(15.0)
+        assert Histogram().quantile(0.99) == 0.0
+
+    def test_quantile_never_exceeds_max(self):
+        histogram = Histogram([10.0])
+        histogram.observe(2.0)
+        histogram.observe(50.0)
+
+        assert histogram.quantile(0.5) == 10.0
+        assert histogram.quantile(0.99) == 50.0
+        assert histogram.summary()["max"] == 50.0
+
+
+class TestMetricsCollectorRequests:
+    """Test request histograms in the MetricsCollector."""
+
+    def test_record_request_groups_by_route_and_status(self):
+        collector = MetricsCollector()
+        collector.record_request("GET", "/items/{id}", 200, 3.0)
+        collector.record_request("GET", "/items/{id}", 200, 7.0)
+        collector.record_request("GET", "/items/{id}", 404, 1.0)
+
+        requests = collector.get_all_metrics()["requests"]
+
+        assert {(r["status_code"], r["count"]) for r in requests} == {
+            (200, 2),
+            (404, 1),
+        }
+
+    def test_prometheus_histogram_export(self):
+        collector = MetricsCollector()
+        collector.record_request("GET", "/health", 200, 3.0)
+
+        text = collector.get_prometheus_metrics()
+
+        assert "# TYPE fapilog_request_latency_ms histogram" in text
+        assert (
+            'fapilog_request_latency_ms_bucket{method="GET",route="/health",'
+            'status="200",le="5"} 1'
+        ) in text
+        assert (
+            'fapilog_request_latency_ms_count{method="GET",route="/health",'
+            'status="200"} 1'
+        ) in text
+
+    def test_disabled_collector_ignores_requests(self):
+        collector = MetricsCollector(enabled=False)
+        collector.record_request("GET", "/", 200, 1.0)
+
+        assert collector.request_latency == {}
+
+
+class TestMiddlewareMetrics:
+    """Test latency recording and access log sampling in the middleware."""
+
+    @pytest.fixture
+    def access_logs(self, monkeypatch):
+        import fapilog
+
+        calls = []
+
+        class RecordingLog:
+            def __getattr__(self, level):
+                return lambda event, **kw: calls.append(kw)
+
+        monkeypatch.setattr(fapilog, "log", RecordingLog())
+        return calls
+
+    def _client(self, collector, **kwargs):
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id}
+
+        app.add_middleware(TraceIDMiddleware, metrics_collector=collector, **kwargs)
+        return TestClient(app)
+
+    def test_records_route_template(self, access_logs):
+        collector = MetricsCollector()
+        client = self._client(collector)
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+        assert collector.request_latency[("GET", "/items/{item_id}", 200)].count == 2
+        assert collector.request_latency[("GET", "<unmatched>", 404)].count == 1
+
+    def test_access_log_disabled_but_metrics_kept(self, access_logs):
+        collector = MetricsCollector()
+        client = self._client(collector, access_log_sample_rate=0.0)
+
+        client.get("/items/1")
+
+        assert access_logs == []
+        assert collector.request_latency[("GET", "/items/{item_id}", 200)].count == 1
+
+    def test_container_wires_collector(self):
+        container = LoggingContainer(
+            LoggingSettings(sinks=[], metrics_enabled=True, access_log_sample_rate=0.5)
+        )
+        app = FastAPI()
+        container._register_middleware(app)
+
+        options = app.user_middleware[0].kwargs
+        assert options["metrics_collector"] is container.get_metrics_collector()
+        assert options["access_log_sample_rate"] == 0.5
+
+    def test_sample_rate_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(access_log_sample_rate=1.5)
+
+    def test_histogram_buckets_setting(self):
+        settings = LoggingSettings(metrics_histogram_buckets="0.5, 5, 50")
+        assert settings.metrics_histogram_buckets == [0.5, 5.0, 50.0]
+
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(metrics_histogram_buckets="5,1")
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(metrics_histogram_buckets="0,1")
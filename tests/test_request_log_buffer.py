@@ -0,0 +1,170 @@
+"""Tests for tail-based per-request log buffering."""
+
+import asyncio
+
+import pytest
+import structlog
+from fastapi import FastAPI, HTTPException
+from starlette.testclient import TestClient
+
+from fapilog._internal.context import bind_request_buffer, get_request_buffer
+from fapilog._internal.request_buffer import RequestBufferProcessor, RequestLogBuffer
+from fapilog.exceptions import ConfigurationError
+from fapilog.middleware import TraceIDMiddleware
+from fapilog.pipeline import build_processor_chain
+from fapilog.settings import LoggingSettings
+
+
+@pytest.fixture
+def emitted():
+    """Route structlog through a buffer processor into a list."""
+    events = []
+
+    def capture(logger, method_name, event_dict):
+        events.append((method_name, event_dict))
+        raise structlog.DropEvent
+
+    # Drop any level-filtering wrapper left configured by earlier tests
+    structlog.reset_defaults()
+    structlog.configure(
+        processors=[RequestBufferProcessor([capture]), capture],
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=False,
+    )
+    yield events
+    structlog.reset_defaults()
+
+
+def _client(slow_ms=1000.0):
+    app = FastAPI()
+    log = structlog.get_logger()
+
+    @app.get("/ok")
+    async def ok():
+        log.debug("loading user")
+        log.info("user loaded")
+        log.warning("cache miss")
+        return {"ok": True}
+
+    @app.get("/unavailable")
+    async def unavailable():
+        log.info("calling upstream")
+        raise HTTPException(status_code=503)
+
+    @app.get("/boom")
+    async def boom():
+        log.info("about to fail")
+        raise RuntimeError("boom")
+
+    @app.get("/slow")
+    async def slow():
+        log.info("working hard")
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    app.add_middleware(TraceIDMiddleware, buffer_max_events=10, buffer_slow_ms=slow_ms)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestRequestLogBuffer:
+    """Test the bounded buffer itself."""
+
+    def test_evicts_oldest_and_counts(self):
+        replayed = []
+        buffer = RequestLogBuffer(max_events=2)
+
+        for i in range(3):
+            buffer.add(lambda lg, m, e: replayed.append(e["n"]), None, "info", {"n": i})
+
+        assert len(buffer) == 2
+        assert buffer.evicted == 1
+        assert buffer.flush() == 2
+        assert replayed == [1, 2]
+
+    def test_discard_counts_evicted_events(self):
+        buffer = RequestLogBuffer(max_events=1)
+        buffer.add(None, None, "info", {})
+        buffer.add(None, None, "info", {})
+
+        assert buffer.discard() == 2
+        assert len(buffer) == 0
+
+
+class TestRequestBufferProcessor:
+    """Test event diversion and replay."""
+
+    def test_passes_through_without_buffer(self):
+        processor = RequestBufferProcessor([])
+        event = {"event": "x"}
+
+        assert processor(None, "info", event) is event
+
+    def test_buffers_info_but_not_warnings(self):
+        processor = RequestBufferProcessor([])
+        buffer = RequestLogBuffer(max_events=5)
+        bind_request_buffer(buffer)
+        try:
+            with pytest.raises(structlog.DropEvent):
+                processor(None, "info", {"event": "held"})
+            assert processor(None, "warning", {"event": "w"}) == {"event": "w"}
+        finally:
+            bind_request_buffer(None)
+
+        assert len(buffer) == 1
+
+    def test_replay_emits_rendered_output(self):
+        emitted = []
+
+        class Logger:
+            def info(self, message):
+                emitted.append(message)
+
+        processor = RequestBufferProcessor([lambda lg, m, e: f"rendered:{e['event']}"])
+        processor._replay(Logger(), "info", {"event": "hello"})
+
+        assert emitted == ["rendered:hello"]
+
+    def test_pipeline_inserts_before_renderer(self):
+        chain = build_processor_chain(
+            LoggingSettings(queue_enabled=False, request_buffer_enabled=True)
+        )
+
+        assert isinstance(chain[-2], RequestBufferProcessor)
+        assert chain[-2].downstream == [chain[-1]]
+
+    def test_settings_validation(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(request_buffer_max_events=0)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(request_buffer_slow_ms=-1)
+
+
+class TestMiddlewareBuffering:
+    """Test flush and discard decisions made by the middleware."""
+
+    def test_fast_success_discards_and_summarizes(self, emitted):
+        _client().get("/ok")
+
+        events = [e["event"] for _, e in emitted]
+        assert events == ["cache miss", "Request processed"]
+        assert emitted[-1][1]["buffered_events_dropped"] == 2
+        assert get_request_buffer() is None
+
+    def test_5xx_response_flushes(self, emitted):
+        _client().get("/unavailable")
+
+        events = [e["event"] for _, e in emitted]
+        assert events == ["calling upstream", "Request processed"]
+
+    def test_exception_flushes(self, emitted):
+        _client().get("/boom")
+
+        events = [e["event"] for _, e in emitted]
+        assert events == ["about to fail", "Request failed"]
+
+    def test_slow_request_flushes(self, emitted):
+        _client(slow_ms=10).get("/slow")
+
+        events = [e["event"] for _, e in emitted]
+        assert events == ["working hard", "Request processed"]
+        assert "buffered_events_dropped" not in emitted[-1][1]
@@ -0,0 +1,117 @@
+"""Tests for the ring buffer queue used by QueueWorker."""
+
+import asyncio
+
+import pytest
+
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+    """Test FIFO semantics, bulk drain and wakeups."""
+
+    def test_fifo_across_wraparound(self):
+        buffer = RingBuffer(3)
+        buffer.put_nowait(1)
+        buffer.put_nowait(2)
+        assert buffer.get_nowait() == 1
+        buffer.put_nowait(3)
+        buffer.put_nowait(4)
+
+        assert buffer.full()
+        with pytest.raises(asyncio.QueueFull):
+            buffer.put_nowait(5)
+
+        capture_times = []
+        assert buffer.drain(10, capture_times) == [2, 3, 4]
+        assert len(capture_times) == 3
+        assert capture_times == sorted(capture_times)
+        assert buffer.empty()
+        # Drained slots no longer reference events
+        assert buffer._items == [None, None, None]
+
+    def test_get_nowait_on_empty_buffer(self):
+        buffer = RingBuffer(2)
+
+        with pytest.raises(asyncio.QueueEmpty):
+            buffer.get_nowait()
+        assert buffer.drain(5) == []
+
+    def test_drain_is_bounded(self):
+        buffer = RingBuffer(10)
+        for i in range(6):
+            buffer.put_nowait(i)
+
+        assert buffer.drain(4) == [0, 1, 2, 3]
+        assert buffer.qsize() == 2
+        assert buffer.last_dwell_ms >= 0
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_when_empty(self):
+        buffer = RingBuffer(2)
+
+        assert await buffer.wait(0.01) is False
+        assert buffer._waiter is None
+
+    @pytest.mark.asyncio
+    async def test_producer_wakes_waiting_consumer(self):
+        buffer = RingBuffer(2)
+        waiter = asyncio.create_task(buffer.wait(5.0))
+        await asyncio.sleep(0)
+
+        buffer.put_nowait("event")
+
+        assert await asyncio.wait_for(waiter, 1.0) is True
+        assert await buffer.get() == "event"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_count_wakes_when_reached(self):
+        buffer = RingBuffer(8)
+        buffer.put_nowait(0)
+        waiter = asyncio.create_task(buffer.wait(5.0, count=3))
+        await asyncio.sleep(0)
+
+        buffer.put_nowait(1)
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        buffer.put_nowait(2)
+
+        assert await asyncio.wait_for(waiter, 1.0) is True
+        assert buffer._wait_for == 1
+        assert await buffer.wait(0.01, count=4) is False
+
+    @pytest.mark.asyncio
+    async def test_put_waits_for_free_slot(self):
+        buffer = RingBuffer(1)
+        buffer.put_nowait("first")
+        putter = asyncio.create_task(buffer.put("second"))
+        await asyncio.sleep(0)
+        assert not putter.done()
+
+        assert buffer.drain(1) == ["first"]
+        await asyncio.wait_for(putter, 1.0)
+
+        assert buffer.get_nowait() == "second"
+
+
+class TestWorkerBatches:
+    """Test that the worker drains batches from the ring buffer."""
+
+    @pytest.mark.asyncio
+    async def test_collect_batch_drains_in_one_call(self):
+        worker = QueueWorker([], batch_size=3, batch_timeout=0.01)
+        for i in range(5):
+            worker.queue.put_nowait({"event": i})
+
+        first = await worker._collect_batch()
+        second = await worker._collect_batch()
+
+        assert [e["event"] for e in first] == [0, 1, 2]
+        assert [e["event"] for e in second] == [3, 4]
+        assert len(worker._batch_capture_times) == 2
+        assert await worker._collect_batch() == []
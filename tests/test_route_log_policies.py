@@ -0,0 +1,190 @@
+"""Tests for route-level log policies."""
+
+import pytest
+import structlog
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from fapilog._internal.route_policy import (
+    RoutePolicy,
+    RoutePolicyTable,
+    get_log_decision,
+    route_policy_processor,
+    set_log_decision,
+)
+from fapilog.exceptions import ConfigurationError
+from fapilog.middleware import TraceIDMiddleware
+from fapilog.pipeline import build_processor_chain
+from fapilog.settings import LoggingSettings
+
+
+class TestRoutePolicyParsing:
+    """Test policy spec parsing and validation."""
+
+    def test_parse_combined_actions(self):
+        policy = RoutePolicy.parse("/api/*", "sample:0.25+access:DEBUG+level:warning")
+
+        assert policy.sample_rate == 0.25
+        assert policy.access_level == "debug"
+        assert policy.min_level == "warning"
+        assert policy.suppress is False
+
+    @pytest.mark.parametrize(
+        "pattern,spec",
+        [
+            ("/health", "mute"),
+            ("/health", "sample:2"),
+            ("/health", "sample:abc"),
+            ("/health", "level:verbose"),
+            ("health", "suppress"),
+        ],
+    )
+    def test_invalid_specs_raise(self, pattern, spec):
+        with pytest.raises(ConfigurationError):
+            RoutePolicy.parse(pattern, spec)
+
+    def test_settings_parse_env_string(self, monkeypatch):
+        monkeypatch.setenv(
+            "FAPILOG_ROUTE_LOG_POLICIES", "/health=suppress, /api/*=sample:0.1"
+        )
+
+        settings = LoggingSettings()
+
+        assert settings.route_log_policies == {
+            "/health": "suppress",
+            "/api/*": "sample:0.1",
+        }
+
+    def test_settings_reject_invalid_policy(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(route_log_policies={"/health": "bogus"})
+
+
+class TestRoutePolicyTable:
+    """Test policy matching precedence and caching."""
+
+    def test_exact_template_and_longest_prefix(self):
+        table = RoutePolicyTable.from_mapping(
+            {
+                "/health": "suppress",
+                "/items/{item_id}": "level:warning",
+                "/files/{path:path}": "access:debug",
+                "/api/*": "sample:0.5",
+                "/api/internal/*": "suppress",
+            }
+        )
+
+        assert table.match("/health").pattern == "/health"
+        assert table.match("/health/deep") is None
+        assert table.match("/items/42").pattern == "/items/{item_id}"
+        assert table.match("/items/42/extra") is None
+        assert table.match("/files/a/b/c.txt").pattern == "/files/{path:path}"
+        assert table.match("/api/internal/jobs").pattern == "/api/internal/*"
+        assert table.match("/api/users").pattern == "/api/*"
+
+    def test_match_cache_is_bounded(self):
+        table = RoutePolicy.parse("/items/{item_id}", "suppress")
+        table = RoutePolicyTable([table], cache_size=2)
+
+        for item_id in range(10):
+            table.match(f"/items/{item_id}")
+
+        assert len(table._cache) == 2
+
+    def test_sampling_decision_is_per_request(self):
+        table = RoutePolicyTable.from_mapping({"/a": "sample:0.0", "/b": "sample:1"})
+
+        assert table.decide("/a").dropped is True
+        assert table.decide("/b").dropped is False
+        assert table.decide("/c") is None
+
+    def test_errors_always_allowed(self):
+        decision = RoutePolicyTable.from_mapping({"/health": "suppress"}).decide(
+            "/health"
+        )
+
+        assert not decision.allows("info")
+        assert not decision.allows("warning")
+        assert decision.allows("error")
+        assert decision.allows("critical")
+
+
+class TestRoutePolicyProcessor:
+    """Test the pipeline processor that applies the request decision."""
+
+    def test_drops_filtered_events(self):
+        decision = RoutePolicyTable.from_mapping({"/x": "level:warning"}).decide("/x")
+        set_log_decision(decision)
+        try:
+            with pytest.raises(structlog.DropEvent):
+                route_policy_processor(None, "info", {"event": "noise"})
+            event = {"event": "careful"}
+            assert route_policy_processor(None, "warning", event) is event
+        finally:
+            set_log_decision(None)
+
+    def test_passes_through_without_decision(self):
+        event = {"event": "hello"}
+        assert route_policy_processor(None, "debug", event) is event
+
+    def test_added_to_chain_only_when_configured(self):
+        default_chain = build_processor_chain(LoggingSettings(queue_enabled=False))
+        configured_chain = build_processor_chain(
+            LoggingSettings(
+                queue_enabled=False, route_log_policies={"/health": "suppress"}
+            )
+        )
+
+        assert route_policy_processor not in default_chain
+        assert configured_chain[0] is route_policy_processor
+
+
+class TestMiddlewareIntegration:
+    """Test that the middleware applies the policy to the access log."""
+
+    @pytest.fixture
+    def access_logs(self, monkeypatch):
+        import fapilog
+
+        calls = []
+
+        class RecordingLog:
+            def __getattr__(self, level):
+                return lambda event, **kw: calls.append((level, event, kw))
+
+        monkeypatch.setattr(fapilog, "log", RecordingLog())
+        return calls
+
+    def _client(self, policies):
+        app = FastAPI()
+        seen = {}
+
+        @app.get("/health")
+        async def health():
+            seen["decision"] = get_log_decision()
+            return {"ok": True}
+
+        @app.get("/users/{user_id}")
+        async def user(user_id: str):
+            return {"id": user_id}
+
+        app.add_middleware(TraceIDMiddleware, route_policies=policies)
+        return TestClient(app), seen
+
+    def test_suppressed_route_skips_access_log(self, access_logs):
+        client, seen = self._client({"/health": "suppress"})
+
+        client.get("/health")
+        client.get("/users/1")
+
+        assert seen["decision"].dropped is True
+        assert [call[1] for call in access_logs] == ["Request processed"]
+        assert access_logs[0][2]["path"] == "/users/1"
+        assert get_log_decision() is None
+
+    def test_access_log_level_adjusted(self, access_logs):
+        client, _ = self._client({"/users/{user_id}": "access:debug"})
+
+        client.get("/users/7")
+
+        assert access_logs[0][0] == "debug"
@@ -0,0 +1,259 @@
+"""Tests for the out-of-process log shipper and its client sink."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from fapilog.container import LoggingContainer
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.shipper import LogShipper, _settings_json, shipper_available
+from fapilog.sinks.shipper import ShipperSink
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+async def _wait_for(predicate, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "shipper.sock")
+
+
+def _shipper(socket_path, sink):
+    return LogShipper(
+        socket_path,
+        LoggingSettings(sinks=[sink], queue_batch_timeout=0.01),
+    )
+
+
+class ClosableSink(RecordingSink):
+    """Recording sink that tracks whether it was closed."""
+
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class AsyncClosableSink(ClosableSink):
+    async def close(self) -> None:  # type: ignore[override]
+        self.closed = True
+
+
+class TestShipperSink:
+    """Test the client side."""
+
+    @pytest.mark.asyncio
+    async def test_close_closes_fallback_sinks(self, socket_path):
+        fallbacks = [ClosableSink(), AsyncClosableSink(), RecordingSink()]
+        sink = ShipperSink(socket_path, fallback_sinks=fallbacks)
+        await sink.write({"event": "a"})
+
+        await sink.close()
+
+        assert fallbacks[0].closed
+        assert fallbacks[1].closed
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_shipper_unavailable(self, socket_path):
+        fallback = RecordingSink()
+        sink = ShipperSink(socket_path, fallback_sinks=[fallback])
+
+        await sink.write({"event": "a"})
+        await sink.write({"event": "b"})
+
+        assert not sink.connected
+        assert [e["event"] for e in fallback.events] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_events_shipped_to_shipper_sinks(self, socket_path):
+        received = RecordingSink()
+        fallback = RecordingSink()
+        shipper = _shipper(socket_path, received)
+        await shipper.start()
+        try:
+            assert shipper_available(socket_path)
+            sink = ShipperSink(socket_path, fallback_sinks=[fallback])
+            for i in range(3):
+                await sink.write({"event": f"e{i}", "level": "info"})
+            await _wait_for(lambda: len(received.events) == 3)
+            await sink.close()
+        finally:
+            await shipper.stop()
+
+        assert [e["event"] for e in received.events] == ["e0", "e1", "e2"]
+        assert fallback.events == []
+        assert shipper.events_received == 3
+
+    @pytest.mark.asyncio
+    async def test_shipped_events_take_the_enqueue_path(self, socket_path):
+        shipper = LogShipper(
+            socket_path,
+            LoggingSettings(
+                sinks=[RecordingSink()],
+                queue_batch_timeout=0.01,
+                sampling_rate=0.0,
+                metrics_enabled=True,
+            ),
+        )
+        await shipper.start()
+        try:
+            sink = ShipperSink(socket_path)
+            for i in range(3):
+                await sink.write({"event": f"e{i}", "level": "info"})
+            await _wait_for(lambda: shipper.events_received == 3)
+            await sink.close()
+            metrics = shipper._container.get_metrics_collector()
+            # Counted by the worker's enqueue; workers already sampled
+            assert metrics.queue_metrics.total_enqueued == 3
+        finally:
+            await shipper.stop()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_after_shipper_stops(self, socket_path):
+        fallback = RecordingSink()
+        shipper = _shipper(socket_path, RecordingSink())
+        await shipper.start()
+        sink = ShipperSink(socket_path, fallback_sinks=[fallback])
+        await sink.write({"event": "shipped"})
+        await _wait_for(lambda: shipper.events_received == 1)
+        await shipper.stop()
+        await asyncio.sleep(0.01)
+
+        await sink.write({"event": "fallback"})
+
+        assert [e["event"] for e in fallback.events] == ["fallback"]
+        assert not sink.connected
+
+
+class TestLogShipper:
+    """Test the shipper process side."""
+
+    @pytest.mark.asyncio
+    async def test_one_shipper_per_socket(self, socket_path):
+        first = _shipper(socket_path, RecordingSink())
+        await first.start()
+        try:
+            with pytest.raises(ConfigurationError):
+                await _shipper(socket_path, RecordingSink()).start()
+        finally:
+            await first.stop()
+
+        assert not shipper_available(socket_path)
+
+    def test_container_uses_shipper_sink(self, socket_path):
+        fallback = RecordingSink()
+        container = LoggingContainer(
+            LoggingSettings(sinks=[fallback], shipper_socket=socket_path)
+        )
+        try:
+            container.configure()
+            (sink,) = container.queue_worker.sinks
+
+            assert isinstance(sink, ShipperSink)
+            assert sink.socket_path == socket_path
+            assert sink.fallback_sinks == [fallback]
+        finally:
+            container.reset()
+
+    def test_container_shutdown_closes_fallback_sinks(self, socket_path):
+        fallback = ClosableSink()
+        container = LoggingContainer(
+            LoggingSettings(sinks=[fallback], shipper_socket=socket_path)
+        )
+        container.configure()
+
+        container.reset()
+
+        assert fallback.closed
+
+    def test_spawned_shipper_gets_settings_and_outlives_container(self, tmp_path):
+        socket_path = str(tmp_path / "spawned.sock")
+        log_file = tmp_path / "shipped.log"
+        container = LoggingContainer(
+            LoggingSettings(
+                sinks=[f"file://{log_file}"],
+                queue_batch_timeout=0.01,
+                shipper_socket=socket_path,
+                shipper_spawn=True,
+            )
+        )
+        try:
+            container.configure()
+            process = container.queue_worker.sinks[0]._process
+            assert process is not None
+            deadline = time.monotonic() + 30
+            while not shipper_available(socket_path):
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+
+            async def ship():
+                sink = ShipperSink(socket_path)
+                await sink.write({"event": "shipped", "level": "info"})
+                await sink.close()
+
+            asyncio.run(ship())
+            # Written by the child, which had only the container's settings
+            while not log_file.exists() or not log_file.read_text():
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+            container.reset()
+            # Shared with other workers, so shutdown leaves it running
+            assert process.poll() is None
+            assert shipper_available(socket_path)
+        finally:
+            container.reset()
+            process.terminate()
+            process.wait(timeout=30)
+
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["shipped"]
+
+    def test_reconnect_respawns_missing_shipper(self, tmp_path, monkeypatch):
+        socket_path = str(tmp_path / "respawn.sock")
+        monkeypatch.setenv("FAPILOG_SINKS", f"file://{tmp_path / 'shipped.log'}")
+        fallback = RecordingSink()
+        sink = ShipperSink(
+            socket_path, fallback_sinks=[fallback], reconnect_interval=0.05, spawn=True
+        )
+
+        async def ship():
+            # The first write finds no shipper, falls back and starts one
+            await sink.write({"event": "fallback", "level": "info"})
+            process = sink._process
+            assert process is not None
+            try:
+                deadline = time.monotonic() + 30
+                while not sink.connected:
+                    assert time.monotonic() < deadline
+                    await asyncio.sleep(0.05)
+                    await sink.write({"event": "retry", "level": "info"})
+            finally:
+                await sink.close()
+                process.terminate()
+                process.wait(timeout=30)
+
+        asyncio.run(ship())
+
+        assert fallback.events[0]["event"] == "fallback"
+
+    def test_settings_json_keeps_uri_sinks_only(self):
+        settings = LoggingSettings(sinks=["stdout", RecordingSink()], queue_maxsize=42)
+
+        payload = json.loads(_settings_json(settings))
+
+        assert payload["sinks"] == ["stdout"]
+        assert LoggingSettings(**payload).queue_maxsize == 42
+
+    def test_reconnect_interval_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(shipper_reconnect_interval=0)
@@ -0,0 +1,128 @@
+"""Tests for independent per-sink queues."""
+
+import asyncio
+
+import pytest
+
+from fapilog._internal.metrics import MetricsCollector
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.sink_queue import SinkQueue
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+def _events(sink):
+    return [e["event"] for e in sink.events]
+
+
+class TestSinkQueue:
+    """Test a single sink's queue."""
+
+    @pytest.mark.asyncio
+    async def test_overflow_drop_keeps_oldest(self, container):
+        sink_queue = SinkQueue(RecordingSink(), "s", maxsize=2, container=container)
+
+        assert sink_queue.offer({"event": 1}, None)
+        assert sink_queue.offer({"event": 2}, None)
+        assert not sink_queue.offer({"event": 3}, None)
+
+        assert [e["event"] for e, _ in sink_queue.queue.drain(10)] == [1, 2]
+        assert container.ledger.totals()["sink_overflow"] == 1
+        assert container.metrics.sink_metrics["s"].total_dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_overflow_drop_oldest_keeps_newest(self):
+        sink_queue = SinkQueue(RecordingSink(), "s", maxsize=2, overflow="drop_oldest")
+
+        for i in range(1, 4):
+            assert sink_queue.offer({"event": i}, None)
+
+        assert [e["event"] for e, _ in sink_queue.queue.drain(10)] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_retries_only_the_failing_sink(self, container, flaky_sink):
+        sink = flaky_sink(failures=1)
+        sink_queue = SinkQueue(sink, "s", retry_delay=0.001, container=container)
+        sink_queue.start()
+
+        sink_queue.offer({"event": "x"}, None)
+        await sink_queue.close()
+
+        assert sink.calls == 2
+        assert _events(sink) == ["x"]
+        assert container.metrics.sink_metrics["s"].total_retries == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self, container, flaky_sink):
+        sink = flaky_sink(failures=10)
+        sink_queue = SinkQueue(
+            sink, "s", max_retries=1, retry_delay=0.001, container=container
+        )
+        sink_queue.start()
+
+        sink_queue.offer({"event": "x"}, None)
+        await sink_queue.close()
+
+        assert sink.calls == 2
+        assert container.ledger.totals()["sink_failed"] == 1
+
+
+class TestWorkerFanOut:
+    """Test the worker with per-sink queues enabled."""
+
+    @pytest.mark.asyncio
+    async def test_slow_sink_does_not_stall_fast_sink(self, flaky_sink):
+        fast = RecordingSink()
+        slow = flaky_sink(delay=0.2)
+        worker = QueueWorker(
+            sinks=[fast, slow], batch_timeout=0.01, sink_queue_size=100
+        )
+        await worker.start()
+        try:
+            for i in range(5):
+                await worker.enqueue({"event": i})
+            await asyncio.sleep(0.1)
+
+            assert len(fast.events) == 5
+            assert len(slow.events) < 5
+        finally:
+            await worker.shutdown()
+
+        # Shutdown delivers the slow sink's backlog
+        assert _events(slow) == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_failing_sink_gets_no_duplicates(self, flaky_sink):
+        good = flaky_sink()
+        flaky = flaky_sink(failures=1)
+        worker = QueueWorker(
+            sinks=[good, flaky],
+            batch_timeout=0.01,
+            retry_delay=0.001,
+            sink_queue_size=10,
+        )
+        await worker.start()
+        await worker.enqueue({"event": "x"})
+        await worker.shutdown()
+
+        assert good.calls == 1
+        assert flaky.calls == 2
+        assert _events(flaky) == ["x"]
+
+    def test_backlog_exported(self):
+        collector = MetricsCollector()
+        collector.record_sink_backlog("LokiSink", 42)
+        collector.record_sink_dropped("LokiSink")
+
+        sinks = collector.get_all_metrics()["sinks"]
+        text = collector.get_prometheus_metrics()
+
+        assert sinks["LokiSink"]["backlog"] == 42
+        assert sinks["LokiSink"]["total_dropped"] == 1
+        assert 'fapilog_sink_backlog{sink="LokiSink"} 42' in text
+        assert 'fapilog_sink_dropped_total{sink="LokiSink"} 1' in text
+
+    def test_size_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(sink_queue_size=-1)
@@ -0,0 +1,235 @@
+"""Tests for the disk spill store and spilling queues."""
+
+import asyncio
+import os
+
+import pytest
+
+from fapilog._internal.circuit_breaker import CLOSED, CircuitBreaker
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.sink_queue import SinkQueue
+from fapilog._internal.spill_store import SpillStore
+from fapilog.exceptions import ConfigurationError
+from fapilog.settings import LoggingSettings
+from fapilog.testing.mock_sinks import RecordingSink
+
+
+def _events(sink):
+    return [e["event"] for e in sink.events]
+
+
+def _store(directory, **kwargs):
+    kwargs.setdefault("replay_rate", 0)
+    store = SpillStore(str(directory), **kwargs)
+    store.open()
+    return store
+
+
+def _segments(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".seg"))
+
+
+class TestSpillStore:
+    """Test the segment log."""
+
+    def test_replays_in_order_across_segments(self, tmp_path):
+        store = _store(tmp_path, segment_bytes=100)
+        for i in range(10):
+            assert store.append({"event": i})
+
+        assert store.pending == 10
+        assert len(_segments(tmp_path)) > 1
+        assert [e["event"] for e in store.take(4)] == [0, 1, 2, 3]
+        assert [e["event"] for e in store.take(100)] == list(range(4, 10))
+        assert store.pending == 0
+        assert store.bytes == 0
+        assert _segments(tmp_path) == []
+
+    def test_recovers_after_crash(self, tmp_path):
+        store = _store(tmp_path, segment_bytes=100)
+        for i in range(6):
+            store.append({"event": i})
+        # Three events per segment: replay moves on to the second one
+        assert [e["event"] for e in store.take(4)] == [0, 1, 2, 3]
+        # No close(): the process died here
+
+        recovered = _store(tmp_path)
+
+        assert recovered.pending == 2
+        assert [e["event"] for e in recovered.take(100)] == [4, 5]
+
+    def test_cursor_saved_per_segment_not_per_replay(self, tmp_path):
+        store = _store(tmp_path, segment_bytes=100)
+        for i in range(6):
+            store.append({"event": i})
+        cursor = tmp_path / "cursor"
+
+        store.take(1)
+        store.take(1)
+        assert not cursor.exists()
+        # Events handed out within the segment are replayed again after a crash
+        assert _store(tmp_path).pending == 6
+
+        store.take(2)
+        assert cursor.exists()
+        assert _store(tmp_path).pending == 2
+
+    def test_appends_buffered_until_replay(self, tmp_path):
+        store = _store(tmp_path)
+        for i in range(3):
+            store.append({"event": i})
+        (segment,) = _segments(tmp_path)
+
+        assert (tmp_path / segment).stat().st_size == 0
+        assert [e["event"] for e in store.take(10)] == [0, 1, 2]
+
+    def test_truncates_torn_record(self, tmp_path):
+        store = _store(tmp_path)
+        store.append({"event": "kept"})
+        store.append({"event": "torn"})
+        store.close()
+        (segment,) = _segments(tmp_path)
+        path = tmp_path / segment
+        path.write_bytes(path.read_bytes()[:-3])
+
+        recovered = _store(tmp_path)
+        recovered.append({"event": "after"})
+
+        assert recovered.pending == 2
+        assert [e["event"] for e in recovered.take(10)] == ["kept", "after"]
+
+    def test_refuses_events_when_full(self, tmp_path):
+        store = _store(tmp_path, max_bytes=100)
+
+        assert store.append({"event": "a"})
+        assert not store.append({"event": "x" * 100})
+        assert store.pending == 1
+
+    def test_replay_keeps_refused_event(self, tmp_path):
+        store = _store(tmp_path, segment_bytes=100)
+        for i in range(10):
+            store.append({"event": i})
+        accepted = []
+
+        def put(event):
+            if len(accepted) == 3:
+                return False
+            accepted.append(event["event"])
+            return True
+
+        assert store.replay(10, put) == 3
+        assert store.pending == 7
+        accepted.clear()
+        assert store.replay(10, put) == 3
+        assert accepted == [3, 4, 5]
+        assert [e["event"] for e in _store(tmp_path).take(10)] == [6, 7, 8, 9]
+
+    def test_replay_rate_limits_take(self, tmp_path):
+        store = _store(tmp_path, replay_rate=5)
+        for i in range(20):
+            store.append({"event": i})
+
+        assert len(store.take(20)) == 5
+        assert store.take(20) == []
+        assert store.next_replay_in() > 0
+
+    def test_metrics_exported(self, tmp_path, container):
+        store = _store(tmp_path / "queue", container=container)
+        store.append({"event": "a"})
+
+        spill = container.metrics.get_all_metrics()["spill"]["queue"]
+        text = container.metrics.get_prometheus_metrics()
+
+        assert spill["pending"] == 1
+        assert spill["segments"] == 1
+        assert spill["bytes"] == store.bytes > 0
+        assert 'fapilog_spill_pending_events{store="queue"} 1' in text
+        assert 'fapilog_spill_replay_lag_seconds{store="queue"} 0.0' in text
+
+
+class TestSpillingQueues:
+    """Test spilling from the worker queue and sink queues."""
+
+    @pytest.mark.asyncio
+    async def test_worker_spills_past_watermark_and_replays(self, tmp_path):
+        sink = RecordingSink()
+        worker = QueueWorker(
+            sinks=[sink],
+            queue_max_size=4,
+            batch_timeout=0.01,
+            spill_dir=str(tmp_path),
+            spill_watermark=0.5,
+            spill_replay_rate=0,
+        )
+        for i in range(10):
+            assert await worker.enqueue({"event": i})
+        assert worker.queue.qsize() == 2
+        assert worker.spill.pending == 8
+
+        await worker.start()
+        for _ in range(100):
+            if len(sink.events) == 10:
+                break
+            await asyncio.sleep(0.01)
+        await worker.shutdown()
+
+        assert _events(sink) == list(range(10))
+        assert worker.spill.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_sink_queue_spills_while_breaker_open(self, tmp_path, flaky_sink):
+        sink = flaky_sink(down=True)
+        breaker = CircuitBreaker("s", failure_threshold=1, reset_timeout=0.05)
+        sink_queue = SinkQueue(
+            sink,
+            "s",
+            max_retries=0,
+            breaker=breaker,
+            spill=_store(tmp_path),
+        )
+        sink_queue.start()
+
+        sink_queue.offer({"event": 0}, None)
+        await asyncio.sleep(0.01)
+        for i in range(1, 5):
+            sink_queue.offer({"event": i}, None)
+        assert sink_queue.spill.pending == 4
+
+        sink.down = False
+        for _ in range(100):
+            if len(sink.events) == 5:
+                break
+            await asyncio.sleep(0.01)
+        await sink_queue.close()
+
+        assert breaker.state == CLOSED
+        assert _events(sink) == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_backlog_spilled_at_shutdown_while_down(self, tmp_path, flaky_sink):
+        sink = flaky_sink(down=True)
+        worker = QueueWorker(
+            sinks=[sink],
+            batch_timeout=0.01,
+            max_retries=0,
+            circuit_breaker_threshold=1,
+            circuit_breaker_reset_timeout=60,
+            sink_queue_size=10,
+            spill_dir=str(tmp_path),
+        )
+        await worker.start()
+        for i in range(3):
+            await worker.enqueue({"event": i})
+        await asyncio.sleep(0.05)
+        await worker.shutdown()
+
+        store = _store(tmp_path / "sink-0-FlakySink")
+        assert [e["event"] for e in store.take(10)] == [0, 1, 2]
+
+    def test_settings_validated(self):
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(spill_watermark=0)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(spill_max_bytes=0)
+        with pytest.raises(ConfigurationError):
+            LoggingSettings(spill_replay_rate=-1)
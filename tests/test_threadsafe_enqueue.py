@@ -0,0 +1,109 @@
+"""Tests for enqueueing log events from threads other than the worker's loop."""
+
+import asyncio
+import threading
+
+import pytest
+import structlog
+
+from fapilog._internal.queue_integration import create_queue_sink
+from fapilog._internal.queue_worker import QueueWorker
+from fapilog._internal.ring_buffer import RingBuffer
+from fapilog.container import LoggingContainer
+from fapilog.settings import LoggingSettings
+
+
+class RecordingSink:
+    """Sink that keeps every event written to it."""
+
+    def __init__(self):
+        self.events = []
+
+    async def write(self, event_dict):
+        self.events.append(event_dict)
+
+
+class TestPutThreadsafe:
+    """Test the ring buffer's cross-thread handoff."""
+
+    def test_refused_without_owner_loop(self):
+        buffer = RingBuffer(4)
+
+        assert not buffer.put_threadsafe("x")
+        assert buffer.empty()
+
+    @pytest.mark.asyncio
+    async def test_events_from_threads_wake_consumer(self):
+        buffer = RingBuffer(1000)
+        buffer.bind(asyncio.get_running_loop())
+
+        def produce(offset):
+            for i in range(100):
+                assert buffer.put_threadsafe(offset + i)
+
+        threads = [threading.Thread(target=produce, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        received = []
+        while len(received) < 400:
+            assert await buffer.wait(timeout=1.0)
+            received.extend(buffer.drain(50))
+
+        assert sorted(received) == list(range(400))
+        assert buffer.empty()
+
+    @pytest.mark.asyncio
+    async def test_refused_when_full(self):
+        buffer = RingBuffer(2)
+        buffer.bind(asyncio.get_running_loop())
+        buffer.put_nowait("a")
+
+        assert buffer.put_threadsafe("b")
+        assert not buffer.put_threadsafe("c")
+        assert buffer.qsize() == 2
+        assert buffer.drain(10) == ["a", "b"]
+
+
+class TestQueueSinkFromThreads:
+    """Test the queue sink when called outside the worker's loop."""
+
+    @pytest.mark.asyncio
+    async def test_executor_thread_events_reach_sinks(self):
+        sink = RecordingSink()
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        worker = QueueWorker(sinks=[sink], batch_timeout=0.01, container=container)
+        container._queue_worker = worker
+        queue_sink = create_queue_sink(container)
+
+        def log_from_thread(i):
+            with pytest.raises(structlog.DropEvent):
+                queue_sink(None, "info", {"event": f"sync {i}", "level": "info"})
+
+        await worker.start()
+        try:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(None, log_from_thread, i) for i in range(20))
+            )
+            for _ in range(100):
+                if len(sink.events) == 20:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.shutdown()
+
+        assert sorted(e["event"] for e in sink.events) == sorted(
+            f"sync {i}" for i in range(20)
+        )
+
+    def test_dropped_when_worker_never_started(self):
+        container = LoggingContainer(LoggingSettings(sinks=[]))
+        container._queue_worker = QueueWorker(sinks=[], container=container)
+
+        with pytest.raises(structlog.DropEvent):
+            create_queue_sink(container)(None, "info", {"event": "x"})
+
+        assert container.get_drop_ledger().totals()["no_loop"] == 1